@@ -23,7 +23,8 @@ async def main():
     await check_version(VERSION, proxy="")
 
     configuration()
-    await start()
+    # e.g. "python main.py 6" starts a worker without the menu
+    await start(sys.argv[1] if len(sys.argv) > 1 else None)
 
 
 log_format = (
@@ -34,7 +35,7 @@ log_format = (
 )
 
 
-def configuration():
+def configuration(log_file: str = "logs/app.log"):
     urllib3.disable_warnings()
     logger.remove()
 
@@ -48,7 +49,7 @@ def configuration():
         format=log_format,
     )
     logger.add(
-        "logs/app.log",
+        log_file,
         rotation="10 MB",
         retention="1 month",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{line} - {message}",
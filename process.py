@@ -1,5 +1,9 @@
 import asyncio
+import math
+import multiprocessing
+import queue
 import random
+from typing import Awaitable, Callable, Iterator, List, Tuple
 from loguru import logger
 
 
@@ -7,13 +11,23 @@ import src.utils
 from src.utils.proxy_parser import Proxy
 import src.model
 from src.utils.statistics import print_wallets_stats
-from src.utils.logs import ProgressTracker, create_progress_tracker
+from src.utils.logs import (
+    ProgressTracker,
+    QueueProgressTracker,
+    create_progress_tracker,
+)
 from src.utils.config_browser import run
+from src.model.onchain.pool import provider_pool
+from src.model.onchain.chain_clients import chain_clients
+from src.model.onchain.static_cache import get_static_cache
+from src.utils.signer import get_signer_pool
+from src.utils.flow_scheduler import get_flow_scheduler
+from src.model.distributed import run_coordinator, run_worker
 
 
-async def start():
+async def start(choice: str = None):
     async def launch_wrapper(index, proxy, private_key, twitter_token):
-        async with semaphore:
+        async with scheduler.slot():
             await account_flow(
                 index,
                 proxy,
@@ -24,25 +38,30 @@ async def start():
                 twitter_token,
             )
 
-    print("\nAvailable options:\n")
-    print("[1] ⭐️ Start farming")
-    print("[2] 🔧 Edit config")
-    print("[3] 💾 Database actions")
-    print("[4] 👋 Exit")
-    print()
-
-    try:
-        choice = input("Enter option (1-4): ").strip()
-    except Exception as e:
-        logger.error(f"Input error: {e}")
-        return
+    # Option given on the command line (python main.py 6), no prompts then
+    interactive = choice is None
+    if interactive:
+        print("\nAvailable options:\n")
+        print("[1] ⭐️ Start farming")
+        print("[2] 🔧 Edit config")
+        print("[3] 💾 Database actions")
+        print("[4] 👋 Exit")
+        print("[5] 🛰 Coordinator (hand out accounts to workers)")
+        print("[6] 🖥 Worker (run accounts of a coordinator)")
+        print()
+
+        try:
+            choice = input("Enter option (1-6): ").strip()
+        except Exception as e:
+            logger.error(f"Input error: {e}")
+            return
 
     if choice == "4" or not choice:
         return
     elif choice == "2":
         run()
         return
-    elif choice == "1":
+    elif choice in ("1", "5", "6"):
         pass
     elif choice == "3":
         from src.model.database.db_manager import show_database_menu
@@ -66,6 +85,15 @@ async def start():
         logger.error(f"Failed to load proxies: {e}")
         return
 
+    if choice == "6":
+        # Accounts, keys and tasks come from the coordinator
+        await run_worker(config, proxies)
+        await close_shared_connections()
+        print_wallets_stats(config)
+        if interactive:
+            input("Press Enter to continue...")
+        return
+
     private_keys = src.utils.read_private_keys("data/private_keys.txt")
 
     # Read Twitter tokens regardless of tasks
@@ -115,13 +143,6 @@ async def start():
         # Python slice не включает последний элемент, поэтому +1
         accounts_to_process = private_keys[start_index - 1 : end_index]
 
-    threads = config.SETTINGS.THREADS
-
-    # Подготавливаем прокси для выбранных аккаунтов
-    cycled_proxies = [
-        proxies[i % len(proxies)] for i in range(len(accounts_to_process))
-    ]
-
     # Создаем список индексов
     indices = list(range(len(accounts_to_process)))
 
@@ -146,39 +167,216 @@ async def start():
     logger.info(f"Accounts order: {account_order}")
 
     lock = asyncio.Lock()
-    semaphore = asyncio.Semaphore(value=threads)
-    tasks = []
 
     # Add before creating tasks
     progress_tracker = await create_progress_tracker(
         total=len(accounts_to_process), description="Accounts completed"
     )
 
-    # Используем индексы для создания задач
-    for idx in indices:
-        actual_index = (
-            config.SETTINGS.EXACT_ACCOUNTS_TO_USE[idx]
-            if config.SETTINGS.EXACT_ACCOUNTS_TO_USE
-            else start_index + idx
-        )
-        tasks.append(
-            asyncio.create_task(
-                launch_wrapper(
-                    actual_index,
-                    cycled_proxies[idx],
-                    accounts_to_process[idx],
-                    twitter_tokens[idx],
-                )
+    # Аккаунты выдаются воркерам по одному, по мере освобождения
+    def iter_accounts():
+        for idx in indices:
+            actual_index = (
+                config.SETTINGS.EXACT_ACCOUNTS_TO_USE[idx]
+                if config.SETTINGS.EXACT_ACCOUNTS_TO_USE
+                else start_index + idx
+            )
+            yield (
+                actual_index,
+                proxies[idx % len(proxies)],
+                accounts_to_process[idx],
+                twitter_tokens[idx],
             )
+
+    processes = min(config.SETTINGS.PROCESSES, len(accounts_to_process))
+    if choice == "5":
+        # Workers on other machines run the accounts with their own proxies
+        await run_coordinator(
+            config,
+            [
+                (index, private_key, twitter_token)
+                for index, _, private_key, twitter_token in iter_accounts()
+            ],
+            progress_tracker,
+        )
+    elif processes > 1:
+        await run_sharded(
+            list(iter_accounts()), processes, config, progress_tracker
+        )
+    else:
+        # Accounts sleeping between steps give their thread to others
+        scheduler = get_flow_scheduler()
+        await run_worker_pool(
+            iter_accounts(), scheduler.accounts_in_progress, launch_wrapper
         )
 
-    await asyncio.gather(*tasks)
+    await close_shared_connections()
 
     logger.success("Saved accounts and private keys to a file.")
 
     print_wallets_stats(config)
 
-    input("Press Enter to continue...")
+    if interactive:
+        input("Press Enter to continue...")
+
+
+async def run_worker_pool(
+    accounts: Iterator[Tuple], workers: int, handler: Callable[..., Awaitable]
+) -> None:
+    """
+    Run handler(*account) for every account with at most `workers` running
+    at once. Workers pull the next account from the iterator when they are
+    done with the previous one, so only `workers` coroutines exist at any
+    time, however many accounts there are.
+    """
+
+    async def worker():
+        # Shared iterator: next() never runs concurrently on one event loop
+        for account in accounts:
+            await handler(*account)
+
+    await asyncio.gather(*(worker() for _ in range(max(workers, 1))))
+
+
+async def close_shared_connections() -> None:
+    """
+    Close RPC connections and signer processes shared between accounts,
+    save the RPC cache.
+    """
+    await get_static_cache().flush()
+    await chain_clients.close_all()
+    await provider_pool.close_all()
+    signer_pool = get_signer_pool()
+    if signer_pool is not None:
+        signer_pool.close()
+
+
+async def run_sharded(
+    accounts: List[Tuple],
+    processes: int,
+    config: src.utils.config.Config,
+    progress_tracker: ProgressTracker,
+) -> None:
+    """
+    Run the accounts in `processes` worker processes, each with its own event
+    loop, connection pools and a share of the THREADS and rate limits.
+    Workers report finished accounts and collected wallet stats through a
+    queue, the database is shared (SQLite in WAL mode).
+    """
+    context = multiprocessing.get_context("spawn")
+    messages = context.Queue()
+    workers = [
+        context.Process(
+            target=run_shard,
+            args=(
+                shard,
+                processes,
+                accounts[shard::processes],
+                config.spare_twitter_tokens[shard::processes],
+                messages,
+            ),
+        )
+        for shard in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    logger.info(f"Started {processes} worker processes")
+
+    loop = asyncio.get_running_loop()
+    running = set(range(processes))
+    while running:
+        try:
+            kind, shard, payload = await loop.run_in_executor(
+                None, messages.get, True, 1
+            )
+        except queue.Empty:
+            for shard in list(running):
+                if not workers[shard].is_alive():
+                    logger.error(
+                        f"Worker process {shard + 1} exited with code {workers[shard].exitcode}"
+                    )
+                    running.discard(shard)
+            continue
+
+        if kind == "progress":
+            await progress_tracker.increment(payload)
+        elif kind == "wallets":
+            config.WALLETS.wallets.extend(payload)
+        elif kind == "done":
+            running.discard(shard)
+
+    for worker in workers:
+        await loop.run_in_executor(None, worker.join)
+
+
+def run_shard(
+    shard: int,
+    processes: int,
+    accounts: List[Tuple],
+    spare_twitter_tokens: List[str],
+    messages: multiprocessing.Queue,
+) -> None:
+    """Entry point of a worker process started by run_sharded()."""
+    from main import configuration
+
+    configuration(log_file=f"logs/app.worker{shard + 1}.log")
+    asyncio.run(
+        _run_shard(shard, processes, accounts, spare_twitter_tokens, messages)
+    )
+
+
+async def _run_shard(
+    shard: int,
+    processes: int,
+    accounts: List[Tuple],
+    spare_twitter_tokens: List[str],
+    messages: multiprocessing.Queue,
+) -> None:
+    config = src.utils.get_config()
+    config.spare_twitter_tokens = spare_twitter_tokens
+    split_limits(config, processes)
+
+    lock = asyncio.Lock()
+    progress_tracker = QueueProgressTracker(messages, shard)
+    scheduler = get_flow_scheduler()
+
+    async def launch_wrapper(index, proxy, private_key, twitter_token):
+        async with scheduler.slot():
+            await account_flow(
+                index,
+                proxy,
+                private_key,
+                config,
+                lock,
+                progress_tracker,
+                twitter_token,
+            )
+
+    try:
+        await run_worker_pool(
+            iter(accounts), scheduler.accounts_in_progress, launch_wrapper
+        )
+        await close_shared_connections()
+    finally:
+        messages.put(("wallets", shard, config.WALLETS.wallets))
+        messages.put(("done", shard, None))
+
+
+def split_limits(config: src.utils.config.Config, processes: int) -> None:
+    """Give a worker process its share of the run-wide limits, rounded up."""
+
+    def share(value):
+        return math.ceil(value / processes) if value else value
+
+    config.SETTINGS.THREADS = share(config.SETTINGS.THREADS)
+    config.SETTINGS.MAX_PAUSED_ACCOUNTS = share(config.SETTINGS.MAX_PAUSED_ACCOUNTS)
+    config.FLOW.TASK_CONCURRENCY = {
+        task: share(limit) for task, limit in config.FLOW.TASK_CONCURRENCY.items()
+    }
+    config.ONCHAIN.SIGNER_PROCESSES = share(config.ONCHAIN.SIGNER_PROCESSES)
+    # Hosts see the requests of all processes together
+    config.OTHERS.RPC_REQUESTS_PER_SECOND /= processes
+    config.OTHERS.HTTP_REQUESTS_PER_SECOND /= processes
 
 
 async def account_flow(
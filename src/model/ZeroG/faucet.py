@@ -472,9 +472,6 @@ async def mint_token(
         tx_params = {
             "from": wallet.address,
             "value": 0,
-            "nonce": await web3.web3.eth.get_transaction_count(
-                wallet.address, "pending"
-            ),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -501,6 +498,15 @@ async def mint_token(
         )
 
         if tx_hash:
+            # Minted amount from the receipt's Transfer log, never fails the mint
+            if isinstance(tx_hash, str):
+                await web3.report_received_tokens(
+                    tx_hash,
+                    contract_address,
+                    wallet.address,
+                    symbol=token_name,
+                    account_index=account_index,
+                )
             logger.success(f"{account_index} | Successfully faucet {token_name}")
             return True
 
@@ -84,7 +84,6 @@ async def deploy_storage_scan(
             "to": web3.web3.to_checksum_address(STORAGE_SCAN_CONTRACT),
             "value": web3.web3.to_wei(random_value, "ether"),
             "data": data,
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -95,7 +94,7 @@ async def deploy_storage_scan(
 
         # Try to estimate gas
         try:
-            estimated_gas = await web3.estimate_gas(tx_params)
+            estimated_gas = await web3.estimate_gas(tx_params, cache=True)
             tx_params["gas"] = estimated_gas
         except Exception as e:
             raise Exception(f"Error estimating gas: {e}")
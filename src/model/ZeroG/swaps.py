@@ -7,10 +7,9 @@ from loguru import logger
 from src.utils.decorators import retry_async
 from src.utils.config import Config
 from src.model.onchain.web3_custom import Web3Custom
+from src.model.onchain.abi_registry import abi_registry
 from eth_account import Account
 import primp
-from web3 import Web3 as SyncWeb3
-from eth_abi import abi
 
 from src.utils.constants import EXPLORER_URL_0G
 
@@ -51,36 +50,8 @@ ROUTER_ABI = [
     }
 ]
 
-# ERC20 ABI для апрувов
-ERC_20_ABI = [
-    {
-        "inputs": [
-            {"internalType": "address", "name": "spender", "type": "address"},
-            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-        ],
-        "name": "approve",
-        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "address", "name": "", "type": "address"},
-            {"internalType": "address", "name": "", "type": "address"},
-        ],
-        "name": "allowance",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-    {
-        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
+# exactInputSingle кодируется без создания контракта, селектор считается один раз
+EXACT_INPUT_SINGLE = abi_registry.function(ROUTER_ABI, "exactInputSingle")
 
 # В начале файла добавим словарь с токенами
 TOKENS = {
@@ -105,16 +76,13 @@ async def swaps(
         if native_balance.wei == 0:
             raise Exception("Native token balance is 0")
 
-        # Получаем балансы всех трех токенов
+        # Получаем балансы всех трех токенов одним multicall
+        balances = await web3.get_token_balances(wallet.address, TOKENS)
+        if balances is None:
+            raise Exception("Failed to get token balances")
+
         token_balances = {}
-        for symbol, token_data in TOKENS.items():
-            balance = await web3.get_token_balance(
-                wallet_address=wallet.address,
-                token_address=token_data["address"],
-                token_abi=ERC_20_ABI,
-                decimals=token_data["decimals"],
-                symbol=symbol,
-            )
+        for symbol, balance in balances.items():
             token_balances[symbol] = balance.wei
             logger.info(
                 f"{account_index} | {symbol} Balance: {balance.wei / 10**18:.4f}"
@@ -194,7 +162,6 @@ async def swaps(
             new_balance = await web3.get_token_balance(
                 wallet_address=wallet.address,
                 token_address=token_out_address,
-                token_abi=ERC_20_ABI,
                 decimals=TOKENS[token_out_symbol]["decimals"],
                 symbol=token_out_symbol,
             )
@@ -267,7 +234,7 @@ async def swap_tokens(
 
         # Апрув токена
         router_address = "0xD86b764618c6E3C078845BE3c3fCe50CE9535Da7"
-        chain_id = await web3.web3.eth.chain_id
+        chain_id = await web3.get_chain_id()
 
         await web3.approve_token(
             token_address=token_in_address,
@@ -275,7 +242,6 @@ async def swap_tokens(
             amount=amount_in,
             wallet=wallet,
             chain_id=chain_id,
-            token_abi=ERC_20_ABI,
             explorer_url=EXPLORER_URL_0G,
         )
 
@@ -292,21 +258,8 @@ async def swap_tokens(
         }
 
         # Кодируем функцию и параметры
-        function_signature = "exactInputSingle((address,address,uint24,address,uint256,uint256,uint256,uint160))"
-        function_selector = SyncWeb3.keccak(text=function_signature)[:4]
-
-        encoded_params = abi.encode(
-            [
-                "address",
-                "address",
-                "uint24",
-                "address",
-                "uint256",
-                "uint256",
-                "uint256",
-                "uint160",
-            ],
-            [
+        encoded_data = EXACT_INPUT_SINGLE.encode(
+            (
                 swap_params["tokenIn"],
                 swap_params["tokenOut"],
                 swap_params["fee"],
@@ -315,11 +268,9 @@ async def swap_tokens(
                 swap_params["amountIn"],
                 swap_params["amountOutMinimum"],
                 swap_params["sqrtPriceLimitX96"],
-            ],
+            )
         )
 
-        encoded_data = function_selector + encoded_params
-
         # Отправляем транзакцию свапа
         tx_hash = await web3.send_transaction(
             to=router_address,
@@ -331,7 +282,7 @@ async def swap_tokens(
         logger.info(
             f"{account_index} | Swap transaction sent, waiting for confirmation (timeout: {config.SETTINGS.WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS}s)..."
         )
-        receipt = await web3.web3.eth.wait_for_transaction_receipt(
+        receipt = await web3.wait_for_receipt(
             tx_hash,
             timeout=config.SETTINGS.WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS,
         )
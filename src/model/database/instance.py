@@ -1,6 +1,6 @@
 import json
 from typing import Optional, List, Dict
-from sqlalchemy import create_engine, Column, Integer, String
+from sqlalchemy import create_engine, event, Column, Integer, String, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
@@ -18,12 +18,33 @@ class Wallet(Base):
     tasks = Column(String)  # JSON строка с задачами
 
 
+class Allowance(Base):
+    __tablename__ = "allowances"
+    __table_args__ = (UniqueConstraint("chain_id", "wallet", "token", "spender"),)
+    id = Column(Integer, primary_key=True)
+    chain_id = Column(Integer)
+    wallet = Column(String)  # адреса хранятся в нижнем регистре
+    token = Column(String)
+    spender = Column(String)
+    amount = Column(String)  # uint256 не помещается в INTEGER sqlite
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets worker processes read while one of them writes, writers
+    # wait for each other instead of failing with "database is locked"
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.close()
+
+
 class Database:
     def __init__(self):
         self.engine = create_async_engine(
             "sqlite+aiosqlite:///data/accounts.db",  # Изменен путь и название БД
             echo=False,
         )
+        event.listen(self.engine.sync_engine, "connect", _set_sqlite_pragmas)
         self.session = sessionmaker(
             bind=self.engine, class_=AsyncSession, expire_on_commit=False
         )
@@ -344,6 +365,97 @@ class Database:
         }
 
 
+    async def init_allowances_table(self) -> None:
+        """Создание таблицы апрувов в базе, созданной до ее появления"""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(
+                lambda sync_conn: Allowance.__table__.create(sync_conn, checkfirst=True)
+            )
+
+    async def get_allowance(
+        self, chain_id: int, wallet: str, token: str, spender: str
+    ) -> Optional[int]:
+        """
+        Получение сохраненного апрува
+
+        :param chain_id: ID сети
+        :param wallet: Адрес кошелька
+        :param token: Адрес токена
+        :param spender: Адрес контракта, которому выдан апрув
+        :return: Сумма апрува или None если апрув не сохранен
+        """
+        async with self.session() as session:
+            allowance = await self._get_allowance(
+                session, chain_id, wallet, token, spender
+            )
+            return int(allowance.amount) if allowance else None
+
+    async def set_allowance(
+        self, chain_id: int, wallet: str, token: str, spender: str, amount: int
+    ) -> None:
+        """
+        Сохранение подтвержденного апрува
+
+        :param chain_id: ID сети
+        :param wallet: Адрес кошелька
+        :param token: Адрес токена
+        :param spender: Адрес контракта, которому выдан апрув
+        :param amount: Сумма апрува
+        """
+        async with self.session() as session:
+            allowance = await self._get_allowance(
+                session, chain_id, wallet, token, spender
+            )
+            if allowance:
+                allowance.amount = str(amount)
+            else:
+                session.add(
+                    Allowance(
+                        chain_id=chain_id,
+                        wallet=wallet.lower(),
+                        token=token.lower(),
+                        spender=spender.lower(),
+                        amount=str(amount),
+                    )
+                )
+            await session.commit()
+
+    async def delete_allowance(
+        self, chain_id: int, wallet: str, token: str, spender: str
+    ) -> None:
+        """
+        Удаление сохраненного апрува, следующая проверка пойдет в сеть
+
+        :param chain_id: ID сети
+        :param wallet: Адрес кошелька
+        :param token: Адрес токена
+        :param spender: Адрес контракта, которому выдан апрув
+        """
+        async with self.session() as session:
+            allowance = await self._get_allowance(
+                session, chain_id, wallet, token, spender
+            )
+            if allowance:
+                await session.delete(allowance)
+                await session.commit()
+
+    async def _get_allowance(
+        self, session: AsyncSession, chain_id: int, wallet: str, token: str, spender: str
+    ) -> Optional[Allowance]:
+        """Внутренний метод для получения апрува по ключу"""
+        from sqlalchemy import select
+
+        result = await session.execute(
+            select(Allowance).filter_by(
+                chain_id=chain_id,
+                wallet=wallet.lower(),
+                token=token.lower(),
+                spender=spender.lower(),
+            )
+        )
+        return result.scalar_one_or_none()
+
+
 # # Создание и инициализация БД
 # db = Database()
 # await db.init_db()
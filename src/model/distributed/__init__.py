@@ -0,0 +1,4 @@
+from .coordinator import run_coordinator
+from .worker import run_worker
+
+__all__ = ["run_coordinator", "run_worker"]
@@ -0,0 +1,218 @@
+import asyncio
+import hmac
+import ipaddress
+import secrets
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from aiohttp import web
+from loguru import logger
+
+from src.model.database.instance import Database
+from src.utils.config import Config
+from src.utils.logs import ProgressTracker
+
+
+# (account index, private key, twitter token)
+Account = Tuple[int, str, str]
+
+# How often idle workers ask for a new lease (seconds)
+LEASE_POLL_INTERVAL = 5
+# The coordinator keeps answering this long after the last account, so
+# polling workers learn that the run is over
+SHUTDOWN_GRACE = 3 * LEASE_POLL_INTERVAL
+
+
+@dataclass
+class Lease:
+    id: str
+    account: Account
+    worker: str
+    expires_at: float
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class Coordinator:
+    """
+    Hands the accounts of the run out to workers on other machines.
+
+    A worker leases one account at a time together with its pending tasks
+    from the database, runs Start.flow for it through its own proxies and
+    reports every finished task, which is saved right away. While the
+    account runs the worker sends heartbeats. A lease without a heartbeat
+    for LEASE_TTL seconds expires and the account goes back to the queue
+    with the tasks that are still pending, so another worker takes it over.
+
+    Every request must carry DISTRIBUTED.SECRET. The protocol is plain
+    HTTP and hands out private keys: run it inside a trusted network.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        accounts: List[Account],
+        progress_tracker: ProgressTracker,
+    ):
+        self.config = config
+        self.progress_tracker = progress_tracker
+        self.lease_ttl = config.DISTRIBUTED.LEASE_TTL
+        self.db = Database()
+
+        self._pending: Deque[Account] = deque(accounts)
+        self._leases: Dict[str, Lease] = {}
+        self._finished = asyncio.Event()
+        if not accounts:
+            self._finished.set()
+
+    async def run(self) -> None:
+        """Serve workers until every account is finished."""
+        settings = self.config.DISTRIBUTED
+        secret = f"Bearer {settings.SECRET}"
+
+        @web.middleware
+        async def authorize(request: web.Request, handler):
+            if not hmac.compare_digest(request.headers.get("Authorization", ""), secret):
+                raise web.HTTPUnauthorized()
+            return await handler(request)
+
+        app = web.Application(middlewares=[authorize])
+        app.add_routes(
+            [
+                web.post("/lease", self._lease),
+                web.post("/heartbeat", self._heartbeat),
+                web.post("/complete", self._complete),
+                web.post("/release", self._release),
+            ]
+        )
+        if not _is_loopback(settings.COORDINATOR_HOST):
+            logger.warning(
+                f"Coordinator listens on {settings.COORDINATOR_HOST} over plain HTTP, private keys "
+                f"can be read on the network. Keep it inside a trusted network or behind TLS"
+            )
+
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(
+            runner, settings.COORDINATOR_HOST, settings.COORDINATOR_PORT
+        ).start()
+        logger.info(
+            f"Coordinator is listening on {settings.COORDINATOR_HOST}:{settings.COORDINATOR_PORT}, "
+            f"{len(self._pending)} accounts to run"
+        )
+
+        try:
+            while not self._finished.is_set():
+                try:
+                    await asyncio.wait_for(self._finished.wait(), timeout=1)
+                except asyncio.TimeoutError:
+                    # Workers may be gone, expire their leases without new requests too
+                    self._expire_leases()
+            logger.success("All accounts are finished")
+            await asyncio.sleep(SHUTDOWN_GRACE)
+        finally:
+            await runner.cleanup()
+            await self.db.engine.dispose()
+
+    def _expire_leases(self) -> None:
+        now = time.monotonic()
+        for lease in [lease for lease in self._leases.values() if lease.expires_at <= now]:
+            del self._leases[lease.id]
+            # Taken over before accounts that have not started yet
+            self._pending.appendleft(lease.account)
+            logger.warning(
+                f"{lease.account[0]} | Lease of worker {lease.worker} expired, the account is back in the queue"
+            )
+
+    def _find_lease(self, body: Dict) -> Optional[Lease]:
+        self._expire_leases()
+        return self._leases.get(str(body.get("lease")))
+
+    async def _account_done(self) -> None:
+        await self.progress_tracker.increment(1)
+        if not self._pending and not self._leases:
+            self._finished.set()
+
+    async def _lease(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        worker = str(body.get("worker", "unknown"))
+        self._expire_leases()
+
+        while self._pending:
+            account = self._pending.popleft()
+            try:
+                tasks = await self.db.get_wallet_pending_tasks(account[1])
+            except Exception:
+                # Not lost, the next lease request tries it again
+                self._pending.appendleft(account)
+                raise
+            if not tasks:
+                # Finished earlier, e.g. by a worker whose lease expired
+                await self._account_done()
+                continue
+
+            lease = Lease(
+                secrets.token_hex(16),
+                account,
+                worker,
+                time.monotonic() + self.lease_ttl,
+            )
+            self._leases[lease.id] = lease
+            logger.info(f"{account[0]} | Leased to worker {worker}")
+            return web.json_response(
+                {
+                    "lease": lease.id,
+                    "account_index": account[0],
+                    "private_key": account[1],
+                    "twitter_token": account[2],
+                    "tasks": tasks,
+                    "ttl": self.lease_ttl,
+                }
+            )
+
+        # Nothing to hand out now, but an active lease may still expire
+        return web.json_response({"lease": None, "done": not self._leases})
+
+    async def _heartbeat(self, request: web.Request) -> web.Response:
+        lease = self._find_lease(await request.json())
+        if lease is None:
+            raise web.HTTPGone()
+        lease.expires_at = time.monotonic() + self.lease_ttl
+        return web.json_response({"ok": True})
+
+    async def _complete(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        lease = self._find_lease(body)
+        if lease is None:
+            raise web.HTTPGone()
+        await self.db.update_task_status(
+            lease.account[1], body["task"], body.get("status", "completed")
+        )
+        lease.expires_at = time.monotonic() + self.lease_ttl
+        return web.json_response({"ok": True})
+
+    async def _release(self, request: web.Request) -> web.Response:
+        lease = self._find_lease(await request.json())
+        if lease is None:
+            raise web.HTTPGone()
+        del self._leases[lease.id]
+        await self._account_done()
+        return web.json_response({"ok": True})
+
+
+async def run_coordinator(
+    config: Config, accounts: List[Account], progress_tracker: ProgressTracker
+) -> None:
+    if not config.DISTRIBUTED.SECRET:
+        logger.error("Set DISTRIBUTED.SECRET in config.yaml to start the coordinator")
+        return
+    await Coordinator(config, accounts, progress_tracker).run()
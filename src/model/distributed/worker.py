@@ -0,0 +1,187 @@
+import asyncio
+import os
+import socket
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from loguru import logger
+
+from src.model.distributed.coordinator import LEASE_POLL_INTERVAL
+from src.model.start import Start
+from src.utils.config import Config
+from src.utils.flow_scheduler import get_flow_scheduler
+
+
+# Tries of one request while the coordinator is unreachable
+REQUEST_ATTEMPTS = 12
+
+
+class CoordinatorClient:
+    """HTTP client of the coordinator's lease protocol."""
+
+    def __init__(self, url: str, secret: str):
+        self.url = url.rstrip("/")
+        self.session = aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {secret}"},
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+
+    async def post(self, path: str, payload: Dict[str, Any]) -> Optional[Dict]:
+        """Response of the coordinator, None if the lease is no longer valid."""
+        for attempt in range(REQUEST_ATTEMPTS):
+            try:
+                async with self.session.post(f"{self.url}{path}", json=payload) as response:
+                    if response.status == 410:
+                        return None
+                    response.raise_for_status()
+                    return await response.json()
+            except aiohttp.ClientResponseError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(
+                    f"Coordinator request {path} failed ({attempt + 1}/{REQUEST_ATTEMPTS}): {e}"
+                )
+                await asyncio.sleep(LEASE_POLL_INTERVAL)
+        raise Exception(f"Coordinator {self.url} is unreachable")
+
+    async def close(self) -> None:
+        await self.session.close()
+
+
+class RemoteTaskStore:
+    """
+    Stands in for the database in Start.flow of a leased account: pending
+    tasks come with the lease, finished ones are reported to the coordinator.
+    """
+
+    def __init__(self, client: CoordinatorClient, lease: Dict[str, Any]):
+        self.client = client
+        self.lease = lease
+
+    async def get_wallet_pending_tasks(self, private_key: str) -> List[Dict]:
+        return self.lease["tasks"]
+
+    async def update_task_status(
+        self, private_key: str, task_name: str, new_status: str
+    ) -> None:
+        response = await self.client.post(
+            "/complete",
+            {"lease": self.lease["lease"], "task": task_name, "status": new_status},
+        )
+        if response is None:
+            logger.warning(
+                f"{self.lease['account_index']} | Lease expired, {task_name} may be run again by another worker"
+            )
+
+
+async def _send_heartbeats(
+    client: CoordinatorClient,
+    lease: Dict[str, Any],
+    interval: float,
+    flow: asyncio.Task,
+) -> None:
+    """Keep the lease alive, the account flow is stopped once the lease is lost."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            response = await client.post("/heartbeat", {"lease": lease["lease"]})
+        except Exception as e:
+            # The lease expires without heartbeats and goes to another worker
+            logger.error(
+                f"{lease['account_index']} | Heartbeat failed, stopping the account: {e}"
+            )
+            flow.cancel()
+            return
+        if response is None:
+            logger.warning(
+                f"{lease['account_index']} | Lease expired, stopping the account, another worker takes it over"
+            )
+            flow.cancel()
+            return
+
+
+async def _run_account(
+    lease: Dict[str, Any],
+    proxies: List[str],
+    config: Config,
+    task_store: RemoteTaskStore,
+) -> None:
+    account_index = lease["account_index"]
+    async with get_flow_scheduler().slot():
+        instance = Start(
+            account_index,
+            proxies[account_index % len(proxies)],
+            lease["private_key"],
+            config,
+            lease["twitter_token"],
+            task_store=task_store,
+        )
+        if not await instance.initialize():
+            raise Exception("Failed to initialize")
+        await instance.flow()
+
+
+async def _run_leased_account(
+    client: CoordinatorClient,
+    lease: Dict[str, Any],
+    proxies: List[str],
+    config: Config,
+) -> None:
+    account_index = lease["account_index"]
+    flow = asyncio.create_task(
+        _run_account(lease, proxies, config, RemoteTaskStore(client, lease))
+    )
+    heartbeats = asyncio.create_task(
+        _send_heartbeats(client, lease, config.DISTRIBUTED.HEARTBEAT_INTERVAL, flow)
+    )
+    lease_lost = False
+    try:
+        await flow
+    except asyncio.CancelledError:
+        # Cancelled by the heartbeats, anything else cancels the worker itself
+        if not heartbeats.done() or heartbeats.cancelled():
+            flow.cancel()
+            raise
+        lease_lost = True
+    except Exception as err:
+        logger.error(f"{account_index} | Account flow failed: {err}")
+    finally:
+        heartbeats.cancel()
+        if not lease_lost:
+            try:
+                await client.post("/release", {"lease": lease["lease"]})
+            except Exception as e:
+                logger.error(f"{account_index} | Failed to release the lease: {e}")
+
+
+async def run_worker(config: Config, proxies: List[str]) -> None:
+    """
+    Run accounts leased from the coordinator at DISTRIBUTED.COORDINATOR_URL
+    until it has nothing left, with this machine's proxies and THREADS.
+    """
+    settings = config.DISTRIBUTED
+    if not settings.SECRET:
+        logger.error("Set DISTRIBUTED.SECRET in config.yaml to start a worker")
+        return
+
+    worker_id = settings.WORKER_ID or f"{socket.gethostname()}-{os.getpid()}"
+    client = CoordinatorClient(settings.COORDINATOR_URL, settings.SECRET)
+    logger.info(f"Worker {worker_id} is taking accounts from {settings.COORDINATOR_URL}")
+
+    async def lease_loop():
+        while True:
+            lease = await client.post("/lease", {"worker": worker_id})
+            if not lease["lease"]:
+                if lease["done"]:
+                    return
+                await asyncio.sleep(LEASE_POLL_INTERVAL)
+                continue
+            await _run_leased_account(client, lease, proxies, config)
+
+    try:
+        await asyncio.gather(
+            *(lease_loop() for _ in range(get_flow_scheduler().accounts_in_progress))
+        )
+        logger.success(f"Worker {worker_id} finished, the coordinator has no accounts left")
+    finally:
+        await client.close()
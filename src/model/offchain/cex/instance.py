@@ -1,12 +1,12 @@
 import random
 import ccxt.async_support as ccxt
 import asyncio
-import time
 from decimal import Decimal
 from src.utils.config import Config
 from eth_account import Account
 from loguru import logger
-from web3 import Web3
+from src.model.onchain.chain_clients import chain_clients
+from src.model.onchain.web3_custom import Web3Custom
 from src.model.offchain.cex.constants import (
     CEX_WITHDRAWAL_RPCS,
     NETWORK_MAPPINGS,
@@ -50,7 +50,9 @@ class CexWithdraw:
         # The network will be selected during withdrawal, not in __init__
         # We'll initialize web3 only after network selection in the withdraw method
         self.network = None
-        self.web3 = None
+        self.web3: Optional[Web3Custom] = None
+        # Network -> client taken from the chain client registry, released in close()
+        self._web3s: Dict[str, Web3Custom] = {}
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -60,6 +62,23 @@ class CexWithdraw:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         await self.exchange.close()
+        await self.close()
+
+    async def get_web3(self, network: str) -> Web3Custom:
+        """Client of the network, connected once and reused until close()."""
+        web3 = self._web3s.get(network)
+        if web3 is None:
+            web3 = await chain_clients.acquire(
+                network, [CEX_WITHDRAWAL_RPCS[network]], self.account_index
+            )
+            self._web3s[network] = web3
+        return web3
+
+    async def close(self) -> None:
+        """Give the network clients back to the registry."""
+        web3s, self._web3s = list(self._web3s.values()), {}
+        for web3 in web3s:
+            await chain_clients.release(web3)
 
     async def check_auth(self) -> None:
         """Test exchange authentication"""
@@ -165,34 +184,25 @@ class CexWithdraw:
         if self.web3 is None:
             raise ValueError(f"[{self.account_index}] Web3 instance not initialized. Network must be selected first.")
 
-        balance_wei = self.web3.eth.get_balance(self.address)
-        return Decimal(self.web3.from_wei(balance_wei, 'ether'))
+        balance_wei = await self.web3.web3.eth.get_balance(self.address)
+        return Decimal(self.web3.web3.from_wei(balance_wei, 'ether'))
 
     async def wait_for_balance_update(self, initial_balance: Decimal, timeout: int = 600) -> bool:
         """
         Wait for the balance to increase from the initial balance.
         Returns True if balance increased, False if timeout reached.
         """
-        start_time = time.time()
+        if self.web3 is None:
+            raise ValueError(f"[{self.account_index}] Web3 instance not initialized. Network must be selected first.")
+
         logger.info(f"[{self.account_index}] Waiting for funds to arrive. Initial balance: {initial_balance} ETH")
-        
-        while time.time() - start_time < timeout:
-            try:
-                current_balance = await self.get_eth_balance()
-                if current_balance > initial_balance:
-                    increase = current_balance - initial_balance
-                    logger.success(f"[{self.account_index}] Funds received! Balance increased by {increase} ETH")
-                    return True
-                
-                logger.info(f"[{self.account_index}] Current balance: {current_balance} ETH. Waiting...")
-                await asyncio.sleep(10)  # Check every 10 seconds
-                
-            except Exception as e:
-                logger.error(f"[{self.account_index}] Error checking balance: {str(e)}")
-                await asyncio.sleep(5)
-                
-        logger.warning(f"[{self.account_index}] Timeout reached after {timeout} seconds. Funds not received.")
-        return False
+        # Checked once per block together with every other account waiting on this network
+        return await self.web3.wait_for_balance_increase(
+            self.address,
+            initial_balance,
+            timeout=timeout,
+            account_index=self.account_index,
+        )
 
     async def withdraw(self) -> bool:
         """
@@ -243,7 +253,7 @@ class CexWithdraw:
             if not rpc_url:
                 logger.error(f"[{self.account_index}] No RPC URL found for network: {self.network}")
                 return False
-            self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self.web3 = await self.get_web3(self.network)
             # logger.info(f"[{self.account_index}] Updated web3 provider to: {rpc_url}")
             
             # Ensure withdrawal amount respects network minimum
@@ -346,6 +356,8 @@ class CexWithdraw:
             logger.error(f"[{self.account_index}] Fatal error during withdrawal process: {str(e)}")
             await self.exchange.close()
             raise 
+        finally:
+            await self.close()
 
     async def check_all_networks_balance(self, max_balance: float) -> bool:
         """
@@ -370,9 +382,9 @@ class CexWithdraw:
                     
                 # Set up web3 for this network
                 self.network = network
-                self.web3 = Web3(Web3.HTTPProvider(rpc_url))
                 
                 try:
+                    self.web3 = await self.get_web3(network)
                     current_balance = await self.get_eth_balance()
                     if current_balance >= Decimal(str(max_balance)):
                         logger.warning(f"[{self.account_index}] Destination wallet balance on {network} ({current_balance}) exceeds maximum allowed ({max_balance})")
@@ -0,0 +1,132 @@
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple, Type
+
+from eth_abi import abi as eth_abi
+from eth_utils import to_checksum_address
+from eth_utils.abi import (
+    abi_to_signature,
+    function_abi_to_4byte_selector,
+    get_abi_input_types,
+    get_abi_output_types,
+)
+from web3 import AsyncWeb3
+from web3.contract import AsyncContract
+
+
+class FunctionCodec:
+    """Selector and argument/result types of one ABI function, computed once."""
+
+    def __init__(self, fn_abi: Dict[str, Any]):
+        self.abi = fn_abi
+        self.name: str = fn_abi["name"]
+        self.signature = abi_to_signature(fn_abi)
+        self.selector: bytes = function_abi_to_4byte_selector(fn_abi)
+        self.input_types: List[str] = get_abi_input_types(fn_abi)
+        self.output_types: List[str] = get_abi_output_types(fn_abi)
+
+    def encode(self, *args: Any) -> str:
+        """Calldata of a call with the given arguments, as a 0x-prefixed hex string."""
+        return "0x" + (self.selector + eth_abi.encode(self.input_types, args)).hex()
+
+    def decode(self, data: bytes) -> Any:
+        """Decode return data, single outputs are unwrapped like ContractFunction.call()."""
+        values = eth_abi.decode(self.output_types, data)
+        return values[0] if len(values) == 1 else list(values)
+
+
+CLIENT_CACHE_ATTR = "_abi_registry_cache"
+
+# ABI objects whose hash is remembered, the least recently used are dropped
+ABI_HASH_CACHE_SIZE = 256
+
+
+@dataclass
+class _ClientCache:
+    # abi hash -> contract class
+    factories: Dict[str, Type[AsyncContract]] = field(default_factory=dict)
+    # (checksum address, abi hash) -> contract
+    contracts: Dict[Tuple[str, str], AsyncContract] = field(default_factory=dict)
+
+
+class AbiRegistry:
+    """
+    Parses every ABI once and hands out cached codecs and contract objects.
+
+    web3.eth.contract() builds a new contract class, parsing the whole ABI,
+    on every call. Here the class is built once per client and ABI and
+    contract objects are reused per (client, address, ABI). Clients are
+    per account (each has its own proxy), so the cache lives as long as
+    the client does.
+    """
+
+    def __init__(self, hash_cache_size: int = ABI_HASH_CACHE_SIZE):
+        self.hash_cache_size = hash_cache_size
+        # id(abi) -> (abi, hash), the abi is kept so its id is not reused
+        # while the entry exists
+        self._hashes: "OrderedDict[int, Tuple[list, str]]" = OrderedDict()
+        self._functions: Dict[Tuple[str, str], FunctionCodec] = {}
+
+    def abi_hash(self, abi: list) -> str:
+        """
+        Content hash of an ABI. Equal ABIs get the same hash whatever object
+        they are in, the hashes of recently used ABI objects are remembered.
+        """
+        key = id(abi)
+        cached = self._hashes.get(key)
+        if cached is not None:
+            self._hashes.move_to_end(key)
+            return cached[1]
+
+        digest = hashlib.sha256(
+            json.dumps(abi, sort_keys=True).encode()
+        ).hexdigest()[:16]
+        self._hashes[key] = (abi, digest)
+        if len(self._hashes) > self.hash_cache_size:
+            # Per-call ABI lists don't stay alive because of the cache
+            self._hashes.popitem(last=False)
+        return digest
+
+    def function(self, abi: list, name: str) -> FunctionCodec:
+        """Codec of the named function. Overloads are not supported, the first match wins."""
+        key = (self.abi_hash(abi), name)
+        codec = self._functions.get(key)
+        if codec is None:
+            fn_abi = next(
+                (
+                    item
+                    for item in abi
+                    if item.get("type") == "function" and item.get("name") == name
+                ),
+                None,
+            )
+            if fn_abi is None:
+                raise ValueError(f"Function {name} is not in the ABI")
+            codec = self._functions[key] = FunctionCodec(fn_abi)
+        return codec
+
+    def contract(self, web3: AsyncWeb3, address: str, abi: list) -> AsyncContract:
+        """Contract object bound to the client, created once per address and ABI."""
+        abi_hash = self.abi_hash(abi)
+        address = to_checksum_address(address)
+
+        # Contracts reference their client, so the cache is kept on the client
+        # itself and goes away with it instead of pinning it in a registry dict
+        cache: _ClientCache = getattr(web3, CLIENT_CACHE_ATTR, None)
+        if cache is None:
+            cache = _ClientCache()
+            setattr(web3, CLIENT_CACHE_ATTR, cache)
+
+        contract = cache.contracts.get((address, abi_hash))
+        if contract is None:
+            if abi_hash not in cache.factories:
+                cache.factories[abi_hash] = web3.eth.contract(abi=abi)
+            contract = cache.contracts[(address, abi_hash)] = cache.factories[
+                abi_hash
+            ](address)
+        return contract
+
+
+abi_registry = AbiRegistry()
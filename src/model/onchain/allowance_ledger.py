@@ -0,0 +1,108 @@
+import asyncio
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from src.model.database.instance import Database
+
+
+# Allowances at least this big are treated as unlimited. Tokens don't
+# decrease a max allowance on transferFrom, so it never runs out
+UNLIMITED_ALLOWANCE = 2**255
+
+# Revert reasons meaning the spender was not allowed to move the tokens
+ALLOWANCE_ERRORS = (
+    "insufficient allowance",
+    "exceeds allowance",
+    "transfer amount exceeds",
+    "transferfrom failed",
+    "transfer_from_failed",
+    "execution reverted: stf",
+)
+
+AllowanceKey = Tuple[int, str, str, str]
+
+
+def is_allowance_error(error: Exception) -> bool:
+    error_msg = str(error).lower()
+    return any(allowance_error in error_msg for allowance_error in ALLOWANCE_ERRORS)
+
+
+class AllowanceLedger:
+    """
+    Remembers unlimited token approvals per (chain id, wallet, token, spender).
+
+    Entries come from confirmed approval receipts and from allowance reads,
+    are stored in the accounts database and survive restarts, so repeated
+    swaps skip both the allowance eth_call and the approval. Finite
+    allowances are spent by swaps and are always read from the chain. An
+    entry is dropped when a transaction reverts with an allowance error,
+    the next approval reads the chain again.
+    """
+
+    def __init__(self):
+        self._cache: Dict[AllowanceKey, Optional[int]] = {}
+        self._db: Optional[Database] = None
+        self._db_lock = asyncio.Lock()
+
+    @staticmethod
+    def _key(chain_id: int, wallet: str, token: str, spender: str) -> AllowanceKey:
+        return (chain_id, wallet.lower(), token.lower(), spender.lower())
+
+    async def _database(self) -> Database:
+        async with self._db_lock:
+            if self._db is None:
+                db = Database()
+                # Databases created before the ledger have no allowances table
+                await db.init_allowances_table()
+                self._db = db
+        return self._db
+
+    async def covers(
+        self, chain_id: int, wallet: str, token: str, spender: str, amount: int
+    ) -> bool:
+        """True if a recorded allowance is known to cover the amount."""
+        key = self._key(chain_id, wallet, token, spender)
+        if key not in self._cache:
+            try:
+                db = await self._database()
+                self._cache[key] = await db.get_allowance(*key)
+            except Exception as e:
+                logger.debug(f"Allowance ledger read failed: {e}")
+                return False
+
+        allowance = self._cache[key]
+        return allowance is not None and allowance >= amount
+
+    async def record(
+        self, chain_id: int, wallet: str, token: str, spender: str, amount: int
+    ) -> None:
+        """Save a confirmed allowance. Finite ones replace, not add to, the old entry."""
+        if amount < UNLIMITED_ALLOWANCE:
+            # approve() overwrites the allowance, an unlimited entry is stale now
+            await self.forget(chain_id, wallet, token, spender)
+            return
+
+        key = self._key(chain_id, wallet, token, spender)
+        self._cache[key] = amount
+        try:
+            db = await self._database()
+            await db.set_allowance(*key, amount)
+        except Exception as e:
+            logger.debug(f"Allowance ledger write failed: {e}")
+
+    async def forget(self, chain_id: int, wallet: str, token: str, spender: str) -> None:
+        """Drop the entry, the next approval checks the allowance on chain."""
+        key = self._key(chain_id, wallet, token, spender)
+        if key in self._cache and self._cache[key] is None:
+            # Already known not to be recorded
+            return
+        self._cache[key] = None
+        try:
+            db = await self._database()
+            await db.delete_allowance(*key)
+        except Exception as e:
+            logger.debug(f"Allowance ledger delete failed: {e}")
+
+
+allowance_ledger = AllowanceLedger()
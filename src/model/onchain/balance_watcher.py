@@ -0,0 +1,166 @@
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from loguru import logger
+from web3 import AsyncWeb3
+
+from src.utils.config import get_config
+from src.model.onchain.abi_registry import abi_registry
+from src.model.onchain.constants import ERC20_ABI
+from src.model.onchain.multicall import (
+    MULTICALL3_ABI,
+    aggregate3,
+    is_multicall_deployed,
+)
+
+if TYPE_CHECKING:
+    from src.model.onchain.web3_custom import Web3Custom
+
+
+# (owner, token or None for the native coin), checksummed
+BalanceKey = Tuple[str, Optional[str]]
+
+
+class BalanceWatcher:
+    """
+    Waits for funds to arrive (bridges, refuels, CEX withdrawals) for all
+    accounts of one chain.
+
+    Instead of every account polling its own balance, waiters register the
+    address, the token and the balance they started from. One task follows
+    new blocks and reads the balances of all registered addresses once per
+    block: one Multicall3 aggregate3 of getEthBalance / balanceOf calls, or
+    on chains without Multicall3 concurrent reads that the batching provider
+    sends as one JSON-RPC batch. Waiters whose balance went above their
+    baseline are resolved. The task stops when nobody waits.
+    """
+
+    def __init__(self, chain_id: int, poll_interval: float = 2.0):
+        self.chain_id = chain_id
+        self.poll_interval = poll_interval
+
+        self._waiters: Dict[BalanceKey, List[Tuple[int, asyncio.Future]]] = {}
+        # Clients of the current waiters, the latest one is used for polling
+        self._clients: List["Web3Custom"] = []
+        # New waiters are checked right away instead of on the next block
+        self._unchecked = False
+        self._last_block: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait_for_increase(
+        self,
+        web3: "Web3Custom",
+        address: str,
+        baseline: int,
+        token: Optional[str] = None,
+        timeout: float = 60,
+    ) -> Optional[int]:
+        """New balance in wei once it is above baseline, None after timeout."""
+        key = (
+            AsyncWeb3.to_checksum_address(address),
+            AsyncWeb3.to_checksum_address(token) if token else None,
+        )
+        future = asyncio.get_running_loop().create_future()
+        waiter = (baseline, future)
+        self._waiters.setdefault(key, []).append(waiter)
+        self._clients.append(web3)
+        self._unchecked = True
+        self._ensure_task()
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._clients.remove(web3)
+            waiters = self._waiters.get(key, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(key, None)
+
+    def _ensure_task(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch_loop())
+
+    async def _watch_loop(self) -> None:
+        while self._waiters:
+            try:
+                await self._poll()
+            except Exception as e:
+                logger.debug(
+                    f"Balance watcher for chain {self.chain_id} poll failed: {e}"
+                )
+            await asyncio.sleep(self.poll_interval)
+
+        self._last_block = None
+
+    async def _poll(self) -> None:
+        if not self._clients:
+            return
+        web3 = self._clients[-1]
+
+        latest = await web3.web3.eth.block_number
+        if latest == self._last_block and not self._unchecked:
+            # Balances only change with a new block
+            return
+        self._unchecked = False
+
+        keys = list(self._waiters)
+        try:
+            balances = await self._read_balances(web3, keys)
+        except Exception:
+            self._unchecked = True
+            raise
+        self._last_block = latest
+
+        for key, balance in zip(keys, balances):
+            if balance is None:
+                continue
+            for baseline, future in self._waiters.get(key, []):
+                if balance > baseline and not future.done():
+                    future.set_result(balance)
+
+    async def _read_balances(
+        self, web3: "Web3Custom", keys: List[BalanceKey]
+    ) -> List[Optional[int]]:
+        address = get_config().ONCHAIN.MULTICALL_ADDRESS
+        if address and await is_multicall_deployed(web3.web3, self.chain_id, address):
+            multicall = abi_registry.contract(web3.web3, address, MULTICALL3_ABI)
+            calls = [
+                (
+                    abi_registry.contract(web3.web3, token, ERC20_ABI)
+                    if token
+                    else multicall,
+                    "balanceOf" if token else "getEthBalance",
+                    (owner,),
+                )
+                for owner, token in keys
+            ]
+            return await aggregate3(web3.web3, calls, address)
+
+        results = await asyncio.gather(
+            *(
+                abi_registry.contract(web3.web3, token, ERC20_ABI)
+                .functions.balanceOf(owner)
+                .call()
+                if token
+                else web3.web3.eth.get_balance(owner)
+                for owner, token in keys
+            ),
+            return_exceptions=True,
+        )
+        return [None if isinstance(result, Exception) else result for result in results]
+
+
+_balance_watchers: Dict[int, BalanceWatcher] = {}
+
+
+def get_balance_watcher(chain_id: int) -> BalanceWatcher:
+    """The process-wide balance watcher of a chain."""
+    if chain_id not in _balance_watchers:
+        _balance_watchers[chain_id] = BalanceWatcher(
+            chain_id,
+            poll_interval=get_config().ONCHAIN.BLOCK_WATCHER_POLL_INTERVAL,
+        )
+    return _balance_watchers[chain_id]
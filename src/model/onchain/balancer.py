@@ -0,0 +1,276 @@
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+from aiohttp import ClientSession
+from loguru import logger
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from src.model.onchain.batching import BATCHABLE_METHODS
+
+
+# Latency assumed for an endpoint that has not answered anything yet,
+# optimistic enough for it to get traffic and be measured
+DEFAULT_LATENCY = 0.3
+
+# Hedging starts only after this many latency samples were collected
+MIN_HEDGE_SAMPLES = 20
+
+
+@dataclass
+class EndpointStats:
+    """Rolling health statistics of one RPC endpoint."""
+
+    provider: Any
+    latency: Optional[float] = None
+    error_rate: float = 0.0
+    consecutive_errors: int = 0
+    ejected: bool = False
+
+    @property
+    def uri(self) -> str:
+        return str(self.provider.endpoint_uri)
+
+    @property
+    def weight(self) -> float:
+        latency = self.latency if self.latency is not None else DEFAULT_LATENCY
+        return max(1.0 - self.error_rate, 0.01) / max(latency, 0.001)
+
+    def record_latency(self, latency: float, alpha: float) -> None:
+        self.latency = (
+            latency
+            if self.latency is None
+            else alpha * latency + (1 - alpha) * self.latency
+        )
+
+    def record_success(self, latency: float, alpha: float) -> None:
+        self.record_latency(latency, alpha)
+        self.error_rate = (1 - alpha) * self.error_rate
+        self.consecutive_errors = 0
+
+    def record_error(self, alpha: float) -> None:
+        self.error_rate = alpha + (1 - alpha) * self.error_rate
+        self.consecutive_errors += 1
+
+
+class LoadBalancedProvider(AsyncJSONBaseProvider):
+    """
+    Provider that spreads requests across several RPC endpoints.
+
+    Each call goes to an endpoint picked at random, weighted by the rolling
+    average of its latency and error rate. Endpoints that fail several times
+    in a row are ejected and re-admitted once a health probe succeeds again.
+
+    With hedge_percentile set, a read that has not answered within that
+    percentile of recent latency is also sent to a second endpoint and the
+    first answer wins. Writes are never hedged.
+    """
+
+    def __init__(
+        self,
+        providers: List[Any],
+        eject_after_errors: int = 3,
+        health_check_interval: float = 10.0,
+        smoothing: float = 0.2,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_delay: float = 0.1,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.endpoints = [EndpointStats(provider) for provider in providers]
+        self.eject_after_errors = eject_after_errors
+        self.health_check_interval = health_check_interval
+        self.smoothing = smoothing
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+
+        self._latencies = deque(maxlen=200)
+        self._health_task: Optional[asyncio.Task] = None
+
+    def __str__(self) -> str:
+        return f"Load balanced RPC connection {[e.uri for e in self.endpoints]}"
+
+    @property
+    def endpoint_uri(self) -> str:
+        return ", ".join(endpoint.uri for endpoint in self.endpoints)
+
+    def pick_endpoint(
+        self, exclude: Optional[List[EndpointStats]] = None
+    ) -> Optional[EndpointStats]:
+        """Pick an endpoint at random, weighted by latency and error rate."""
+        exclude = exclude or []
+        candidates = [
+            e for e in self.endpoints if not e.ejected and e not in exclude
+        ]
+        if not candidates:
+            # Everything is ejected - the least failing endpoint is still
+            # better than no endpoint at all
+            candidates = [e for e in self.endpoints if e not in exclude]
+            if not candidates:
+                return None
+            return min(candidates, key=lambda e: e.consecutive_errors)
+
+        return random.choices(candidates, weights=[e.weight for e in candidates])[0]
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self._ensure_health_checks()
+
+        # Reads are safe to repeat on another node, writes are not
+        # retried here to keep their error handling where it was
+        if method not in BATCHABLE_METHODS:
+            return await self._request(self.pick_endpoint(), method, params)
+
+        hedge_delay = self._hedge_delay()
+        if hedge_delay is not None:
+            return await self._hedged_request(method, params, hedge_delay)
+
+        endpoint = self.pick_endpoint()
+        try:
+            return await self._request(endpoint, method, params)
+        except Exception:
+            fallback = self.pick_endpoint(exclude=[endpoint])
+            if fallback is None:
+                raise
+            return await self._request(fallback, method, params)
+
+    def _hedge_delay(self) -> Optional[float]:
+        """How long a read may run before it is duplicated, None if hedging is off."""
+        if (
+            self.hedge_percentile is None
+            or len(self.endpoints) < 2
+            or len(self._latencies) < MIN_HEDGE_SAMPLES
+        ):
+            return None
+
+        latencies = sorted(self._latencies)
+        index = min(
+            int(len(latencies) * self.hedge_percentile / 100), len(latencies) - 1
+        )
+        return max(latencies[index], self.hedge_min_delay)
+
+    async def _hedged_request(
+        self, method: RPCEndpoint, params: Any, hedge_delay: float
+    ) -> RPCResponse:
+        primary = self.pick_endpoint()
+        tasks = {asyncio.create_task(self._request(primary, method, params))}
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done or next(iter(done)).exception() is not None:
+                # Too slow or already failed - ask a second endpoint as well
+                secondary = self.pick_endpoint(exclude=[primary])
+                if secondary is not None:
+                    tasks.add(
+                        asyncio.create_task(self._request(secondary, method, params))
+                    )
+
+            last_error = None
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+
+            raise last_error
+        finally:
+            # The losing (or abandoned) request is not needed anymore
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def make_batch_request(
+        self, batch_requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> List[RPCResponse]:
+        endpoint = self.pick_endpoint()
+        start = time.monotonic()
+        try:
+            response = await endpoint.provider.make_batch_request(batch_requests)
+        except Exception:
+            self._record_error(endpoint)
+            raise
+        endpoint.record_success(time.monotonic() - start, self.smoothing)
+        return response
+
+    async def _request(
+        self, endpoint: EndpointStats, method: RPCEndpoint, params: Any
+    ) -> RPCResponse:
+        start = time.monotonic()
+        try:
+            response = await endpoint.provider.make_request(method, params)
+        except asyncio.CancelledError:
+            # Lost a hedge race - the time so far is still a latency sample
+            endpoint.record_latency(time.monotonic() - start, self.smoothing)
+            raise
+        except Exception:
+            self._record_error(endpoint)
+            raise
+
+        # A JSON-RPC error (revert, nonce too low...) still means the node is up
+        latency = time.monotonic() - start
+        endpoint.record_success(latency, self.smoothing)
+        self._latencies.append(latency)
+        return response
+
+    def _record_error(self, endpoint: EndpointStats) -> None:
+        endpoint.record_error(self.smoothing)
+        if (
+            not endpoint.ejected
+            and endpoint.consecutive_errors >= self.eject_after_errors
+        ):
+            endpoint.ejected = True
+            logger.warning(
+                f"RPC {endpoint.uri} ejected after {endpoint.consecutive_errors} errors in a row"
+            )
+
+    def _ensure_health_checks(self) -> None:
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_check_loop())
+
+    async def _health_check_loop(self) -> None:
+        """Probe ejected endpoints and re-admit the ones that answer again."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+
+            for endpoint in [e for e in self.endpoints if e.ejected]:
+                start = time.monotonic()
+                try:
+                    response = await endpoint.provider.make_request(
+                        RPCEndpoint("eth_blockNumber"), []
+                    )
+                    if "result" not in response:
+                        raise Exception(response.get("error"))
+                except Exception as e:
+                    logger.debug(f"RPC {endpoint.uri} health check failed: {e}")
+                    continue
+
+                endpoint.ejected = False
+                endpoint.consecutive_errors = 0
+                endpoint.error_rate = 0.0
+                endpoint.latency = time.monotonic() - start
+                logger.info(f"RPC {endpoint.uri} is healthy again, re-admitted")
+
+    async def cache_async_session(self, session: ClientSession) -> ClientSession:
+        for endpoint in self.endpoints:
+            await endpoint.provider.cache_async_session(session)
+        return session
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        for endpoint in self.endpoints:
+            if await endpoint.provider.is_connected(show_traceback=False):
+                return True
+        return False
+
+    async def disconnect(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        for endpoint in self.endpoints:
+            await endpoint.provider.disconnect()
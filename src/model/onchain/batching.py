@@ -0,0 +1,134 @@
+import asyncio
+from typing import Any, List, Optional, Tuple
+
+from loguru import logger
+from web3.types import RPCEndpoint, RPCResponse
+
+from src.model.onchain.rate_limited import RateLimitedHTTPProvider
+
+
+# Read-only methods that are safe to group into one JSON-RPC batch.
+# Anything not listed here (eth_sendRawTransaction etc.) is sent immediately.
+BATCHABLE_METHODS = frozenset(
+    {
+        "eth_blockNumber",
+        "eth_call",
+        "eth_chainId",
+        "eth_estimateGas",
+        "eth_feeHistory",
+        "eth_gasPrice",
+        "eth_getBalance",
+        "eth_getBlockByHash",
+        "eth_getBlockByNumber",
+        "eth_getCode",
+        "eth_getLogs",
+        "eth_getTransactionByHash",
+        "eth_getTransactionCount",
+        "eth_getTransactionReceipt",
+        "eth_maxPriorityFeePerGas",
+    }
+)
+
+
+class BatchingHTTPProvider(RateLimitedHTTPProvider):
+    """
+    AsyncHTTPProvider that groups reads issued within a short window
+    into a single JSON-RPC batch request.
+
+    Every caller still awaits its own response, so the provider is a drop-in
+    replacement for AsyncHTTPProvider. A batch takes one slot of the rate
+    limiter, like a single call.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        request_kwargs: Optional[Any] = None,
+        batch_window: float = 0.015,
+        max_batch_size: int = 20,
+        **kwargs: Any,
+    ):
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs, **kwargs)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+
+        self._queue: List[Tuple[RPCEndpoint, Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: set = set()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        if method not in BATCHABLE_METHODS or self.max_batch_size <= 1:
+            return await super().make_request(method, params)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((method, params, future))
+
+        if len(self._queue) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Take everything queued so far and send it as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._queue:
+            return
+
+        batch, self._queue = self._queue, []
+        task = asyncio.create_task(self._send_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _send_batch(
+        self, batch: List[Tuple[RPCEndpoint, Any, asyncio.Future]]
+    ) -> None:
+        if len(batch) == 1:
+            await self._send_single(*batch[0])
+            return
+
+        try:
+            responses = await self.make_batch_request(
+                [(method, params) for method, params, _ in batch]
+            )
+        except Exception as e:
+            logger.debug(f"Batch request to {self.endpoint_uri} failed: {e}")
+            responses = None
+
+        # Some nodes reject batches with a single error object, or answer
+        # with fewer items than requested - fall back to one call per request
+        if not isinstance(responses, list) or len(responses) != len(batch):
+            await asyncio.gather(*(self._send_single(*item) for item in batch))
+            return
+
+        for (_, _, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def _send_single(
+        self, method: RPCEndpoint, params: Any, future: asyncio.Future
+    ) -> None:
+        try:
+            response = await super().make_request(method, params)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        if not future.done():
+            future.set_result(response)
+
+    async def disconnect(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for _, _, future in self._queue:
+            if not future.done():
+                future.cancel()
+        self._queue = []
+        await super().disconnect()
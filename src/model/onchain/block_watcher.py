@@ -0,0 +1,159 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Set
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import AsyncWeb3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.types import TxReceipt
+
+from src.utils.config import get_config
+
+
+class BlockWatcher:
+    """
+    Resolves transaction receipts of one chain for all accounts.
+
+    Instead of every transaction polling for its own receipt, one task
+    follows new blocks, looks for pending hashes among their transactions
+    and requests receipts only for the hits. A freshly registered hash gets
+    one direct receipt check, in case it was mined before it was registered.
+    The task stops when nothing is pending.
+    """
+
+    def __init__(
+        self,
+        chain_id: int,
+        poll_interval: float = 2.0,
+        max_blocks_per_poll: int = 20,
+        recheck_interval: float = 30.0,
+    ):
+        self.chain_id = chain_id
+        self.poll_interval = poll_interval
+        self.max_blocks_per_poll = max_blocks_per_poll
+        self.recheck_interval = recheck_interval
+
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._unchecked: Set[str] = set()
+        self._last_block: Optional[int] = None
+        self._last_recheck = time.monotonic()
+        # Clients of the current waiters, the latest one is used for polling
+        self._clients: List[AsyncWeb3] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait_for_receipt(
+        self, web3: AsyncWeb3, tx_hash, timeout: float
+    ) -> TxReceipt:
+        """Wait until the transaction is mined, raises TimeExhausted after timeout."""
+        key = AsyncWeb3.to_hex(HexBytes(tx_hash))
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(key, []).append(future)
+        self._unchecked.add(key)
+        self._clients.append(web3)
+        self._ensure_task()
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(
+                f"Transaction {key} is not in the chain after {timeout} seconds"
+            )
+        finally:
+            # The client may be closed once its account is done
+            self._clients.remove(web3)
+            waiters = self._pending.get(key, [])
+            if future in waiters:
+                waiters.remove(future)
+            if not waiters:
+                self._pending.pop(key, None)
+
+    def _ensure_task(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch_loop())
+
+    async def _watch_loop(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self._poll()
+            except Exception as e:
+                logger.debug(f"Block watcher for chain {self.chain_id} poll failed: {e}")
+
+        # Blocks mined while nobody waited are not needed anymore
+        self._last_block = None
+
+    async def _poll(self) -> None:
+        if not self._clients:
+            return
+        web3 = self._clients[-1]
+        to_check, self._unchecked = self._unchecked, set()
+        mined: Set[str] = set()
+
+        try:
+            latest = await web3.eth.block_number
+
+            # Safety net for hashes a lagging node did not show in its blocks
+            if time.monotonic() - self._last_recheck > self.recheck_interval:
+                to_check |= set(self._pending)
+                self._last_recheck = time.monotonic()
+
+            if self._last_block is None:
+                self._last_block = latest
+            elif latest - self._last_block > self.max_blocks_per_poll:
+                # Too far behind to scan block by block, ask for every receipt
+                to_check |= set(self._pending)
+                self._last_block = latest
+            elif latest > self._last_block:
+                blocks = await asyncio.gather(
+                    *(
+                        web3.eth.get_block(number)
+                        for number in range(self._last_block + 1, latest + 1)
+                    )
+                )
+                for block in blocks:
+                    for tx in block["transactions"]:
+                        tx_hash = AsyncWeb3.to_hex(HexBytes(tx))
+                        if tx_hash in self._pending:
+                            mined.add(tx_hash)
+                self._last_block = latest
+        except Exception:
+            self._unchecked |= to_check
+            raise
+
+        hashes = [
+            tx_hash for tx_hash in to_check | mined if tx_hash in self._pending
+        ]
+        if not hashes:
+            return
+
+        receipts = await asyncio.gather(
+            *(web3.eth.get_transaction_receipt(tx_hash) for tx_hash in hashes),
+            return_exceptions=True,
+        )
+        for tx_hash, receipt in zip(hashes, receipts):
+            if isinstance(receipt, TransactionNotFound) and tx_hash not in mined:
+                # Not mined yet, the block scan will find it
+                continue
+            if isinstance(receipt, Exception):
+                # Mined but the node has no receipt yet, or the request failed
+                self._unchecked.add(tx_hash)
+                continue
+
+            for future in self._pending.pop(tx_hash, []):
+                if not future.done():
+                    future.set_result(receipt)
+
+
+_block_watchers: Dict[int, BlockWatcher] = {}
+
+
+def get_block_watcher(chain_id: int) -> BlockWatcher:
+    """The process-wide block watcher of a chain."""
+    if chain_id not in _block_watchers:
+        _block_watchers[chain_id] = BlockWatcher(
+            chain_id,
+            poll_interval=get_config().ONCHAIN.BLOCK_WATCHER_POLL_INTERVAL,
+        )
+    return _block_watchers[chain_id]
@@ -0,0 +1,88 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from src.model.onchain.web3_custom import Web3Custom
+
+
+# (network, proxy)
+ClientKey = Tuple[str, str]
+
+
+class ChainClientRegistry:
+    """
+    Connections to the networks modules bridge or withdraw to (Arbitrum,
+    Optimism, Base, Ethereum, Galileo...), one per (network, proxy).
+
+    A connection is made on the first acquire() and shared by everyone
+    using the same network through the same proxy until the last of them
+    releases it, then it is closed. Every acquire gets its own Web3Custom
+    on the shared connection, so logs and pending transactions stay per
+    account. With ONCHAIN.SHARE_RPC_CONNECTIONS the connection itself
+    stays in the provider pool a while longer and is picked up again by
+    the next account.
+    """
+
+    def __init__(self):
+        # Owners of the shared connections
+        self._connections: Dict[ClientKey, Web3Custom] = {}
+        self._refs: Dict[ClientKey, int] = defaultdict(int)
+        self._locks: Dict[ClientKey, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # id of a handed out client -> key of its connection
+        self._keys: Dict[int, ClientKey] = {}
+
+    @staticmethod
+    def _key(network: str, proxy: Optional[str]) -> ClientKey:
+        return (network.lower(), proxy or "")
+
+    async def acquire(
+        self,
+        network: str,
+        rpc_urls: List[str],
+        account_index: int,
+        proxy: Optional[str] = None,
+        use_proxy: bool = False,
+        ssl: bool = False,
+    ) -> Web3Custom:
+        """
+        Connected client of the network for the account, every acquire must
+        be paired with a release(). rpc_urls of the first acquire of a
+        (network, proxy) are used.
+        """
+        key = self._key(network, proxy if use_proxy else None)
+        async with self._locks[key]:
+            connection = self._connections.get(key)
+            if connection is None:
+                connection = await Web3Custom.create(
+                    account_index, rpc_urls, use_proxy, proxy or "", ssl
+                )
+                self._connections[key] = connection
+            self._refs[key] += 1
+            client = connection.share(account_index)
+            self._keys[id(client)] = key
+            return client
+
+    async def release(self, client: Web3Custom) -> None:
+        """Drop one reference, the client is closed once nobody uses it."""
+        key = self._keys.pop(id(client), None)
+        if key is None:
+            return
+
+        async with self._locks[key]:
+            self._refs[key] -= 1
+            if self._refs[key] > 0:
+                return
+            connection = self._connections.pop(key)
+            del self._refs[key]
+        await connection.cleanup()
+
+    async def close_all(self) -> None:
+        connections = list(self._connections.values())
+        self._connections.clear()
+        self._refs.clear()
+        self._keys.clear()
+        for connection in connections:
+            await connection.cleanup()
+
+
+chain_clients = ChainClientRegistry()
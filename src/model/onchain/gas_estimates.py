@@ -0,0 +1,91 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import Web3
+
+from src.utils.config import get_config
+
+
+# (chain id, to, calldata hash, value)
+EstimateKey = Tuple[int, Optional[str], str, int]
+
+
+def estimate_key(chain_id: int, transaction: Dict[str, Any]) -> EstimateKey:
+    """
+    Cache key of a transaction's gas estimate.
+
+    Only identical transactions share a key: the same contract (or a
+    deployment), calldata and value. Different arguments or a different
+    price may take a different amount of gas.
+    """
+    data = HexBytes(transaction.get("data") or "0x")
+    to = transaction.get("to")
+    return (
+        chain_id,
+        to.lower() if to else None,
+        Web3.keccak(data).hex(),
+        int(transaction.get("value") or 0),
+    )
+
+
+class GasEstimateCache:
+    """
+    eth_estimateGas results shared by all accounts.
+
+    The first account sending a transaction estimates it, the ones running
+    at the same time wait for that result instead of estimating the same
+    transaction again. Entries expire after ttl seconds and are dropped
+    when a transaction sent with a cached limit runs out of gas.
+    """
+
+    def __init__(self, ttl: float = 600.0):
+        self.ttl = ttl
+        self._estimates: Dict[EstimateKey, Tuple[int, float]] = {}
+        self._locks: Dict[EstimateKey, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def _get(self, key: EstimateKey) -> Optional[int]:
+        entry = self._estimates.get(key)
+        if entry is None or time.monotonic() - entry[1] > self.ttl:
+            return None
+        return entry[0]
+
+    async def estimate(
+        self,
+        chain_id: int,
+        transaction: Dict[str, Any],
+        estimator: Callable[[], Awaitable[int]],
+    ) -> int:
+        """Cached estimate of the transaction, estimator is called on a miss."""
+        key = estimate_key(chain_id, transaction)
+        estimate = self._get(key)
+        if estimate is not None:
+            return estimate
+
+        async with self._locks[key]:
+            estimate = self._get(key)
+            if estimate is None:
+                estimate = await estimator()
+                self._estimates[key] = (estimate, time.monotonic())
+            return estimate
+
+    def invalidate(self, chain_id: int, transaction: Dict[str, Any]) -> None:
+        """Forget the estimate, the next transaction of this kind is estimated again."""
+        if self._estimates.pop(estimate_key(chain_id, transaction), None) is not None:
+            logger.debug(f"Gas estimate for {transaction.get('to')} on chain {chain_id} dropped")
+
+
+_gas_estimate_cache: Optional[GasEstimateCache] = None
+
+
+def get_gas_estimate_cache() -> GasEstimateCache:
+    """The process-wide gas estimate cache."""
+    global _gas_estimate_cache
+    if _gas_estimate_cache is None:
+        _gas_estimate_cache = GasEstimateCache(
+            ttl=get_config().ONCHAIN.GAS_ESTIMATE_CACHE_TTL
+        )
+    return _gas_estimate_cache
@@ -0,0 +1,230 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from loguru import logger
+from web3 import AsyncWeb3
+
+from src.utils.config import get_config
+from src.model.onchain.pool import provider_pool
+
+
+@dataclass(frozen=True)
+class GasPolicy:
+    """
+    How aggressive the fees of a transaction are.
+
+    The priority fee is the node's eth_maxPriorityFeePerGas, or with
+    priority_percentile set the given percentile of the tips paid in the
+    latest block. Max fee is the latest block's base fee times
+    base_fee_multiplier plus that tip. On legacy chains base_fee_multiplier
+    is applied to the gas price. The defaults give the same fees as
+    requesting them for every transaction.
+    """
+
+    priority_percentile: float = 0
+    base_fee_multiplier: float = 1.0
+    priority_fee_multiplier: float = 1.0
+
+
+def get_gas_policy(task_name: Optional[str] = None) -> GasPolicy:
+    """Gas policy from ONCHAIN settings, with the task's GAS_POLICIES overrides."""
+    onchain_config = get_config().ONCHAIN
+    overrides = onchain_config.GAS_POLICIES.get(task_name, {}) if task_name else {}
+
+    return GasPolicy(
+        priority_percentile=overrides.get(
+            "PRIORITY_PERCENTILE", onchain_config.GAS_PRIORITY_PERCENTILE
+        ),
+        base_fee_multiplier=overrides.get(
+            "BASE_FEE_MULTIPLIER", onchain_config.GAS_BASE_FEE_MULTIPLIER
+        ),
+        priority_fee_multiplier=overrides.get(
+            "PRIORITY_FEE_MULTIPLIER", onchain_config.GAS_PRIORITY_FEE_MULTIPLIER
+        ),
+    )
+
+
+@dataclass
+class GasSnapshot:
+    """Fee data of one block."""
+
+    block_number: int
+    # When the block was last confirmed to be the latest one
+    checked_at: float = field(default_factory=time.monotonic)
+    # Base fee of the block, None on chains without EIP-1559
+    base_fee: Optional[int] = None
+    # Tip paid at each requested percentile in the block
+    rewards: Dict[float, int] = field(default_factory=dict)
+    # Node's eth_maxPriorityFeePerGas, also used when the block had no transactions
+    suggested_priority_fee: int = 0
+    gas_price: Optional[int] = None
+
+
+class GasOracle:
+    """
+    Gas prices of one chain, shared by all accounts.
+
+    A background task checks for a new block every refresh_interval seconds
+    and only then fetches eth_feeHistory, so accounts read fees from memory
+    instead of requesting the latest block for every transaction. The task
+    stops once nobody asked for fees during idle_timeout seconds.
+
+    The oracle polls through its own pooled client, made with the RPCs and
+    proxy of the account that asked first, so with OTHERS.USE_PROXY_FOR_RPC
+    its requests leave through a proxy like the accounts' own.
+    """
+
+    def __init__(
+        self, chain_id: int, refresh_interval: float = 2.0, idle_timeout: float = 60.0
+    ):
+        self.chain_id = chain_id
+        self.refresh_interval = refresh_interval
+        self.idle_timeout = idle_timeout
+
+        self.snapshot: Optional[GasSnapshot] = None
+        self._percentiles: Set[float] = set()
+        self._web3: Optional[AsyncWeb3] = None
+        self._last_used = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def get_gas_params(
+        self,
+        rpc_urls: List[str],
+        proxy: Optional[str],
+        ssl: bool,
+        policy: GasPolicy,
+    ) -> Dict[str, int]:
+        """Fees for a transaction, rpc_urls and proxy are used if the oracle has no client yet."""
+        self._last_used = time.monotonic()
+        web3 = await self._get_client(rpc_urls, proxy, ssl)
+
+        snapshot = self.snapshot
+        if (
+            snapshot is None
+            or self._is_stale(snapshot)
+            or (
+                snapshot.base_fee is not None
+                and policy.priority_percentile
+                and policy.priority_percentile not in snapshot.rewards
+            )
+        ):
+            async with self._lock:
+                if policy.priority_percentile:
+                    self._percentiles.add(policy.priority_percentile)
+                if self.snapshot is snapshot:
+                    await self._refresh(web3, force=True)
+
+        self._ensure_refresh_task()
+        return self._apply(self.snapshot, policy)
+
+    async def _get_client(
+        self, rpc_urls: List[str], proxy: Optional[str], ssl: bool
+    ) -> AsyncWeb3:
+        if self._web3 is None:
+            web3 = await provider_pool.acquire(rpc_urls, proxy, ssl)
+            if self._web3 is None:
+                self._web3 = web3
+            else:
+                await provider_pool.release(web3)
+        return self._web3
+
+    def _is_stale(self, snapshot: GasSnapshot) -> bool:
+        # The background refresh keeps failing, don't trust old fees
+        return time.monotonic() - snapshot.checked_at > max(
+            self.refresh_interval * 5, 30
+        )
+
+    def _apply(self, snapshot: GasSnapshot, policy: GasPolicy) -> Dict[str, int]:
+        if snapshot.base_fee is None:
+            return {"gasPrice": int(snapshot.gas_price * policy.base_fee_multiplier)}
+
+        priority_fee = (
+            policy.priority_percentile
+            and snapshot.rewards.get(policy.priority_percentile)
+        ) or snapshot.suggested_priority_fee
+        priority_fee = int(priority_fee * policy.priority_fee_multiplier)
+
+        return {
+            "maxFeePerGas": int(snapshot.base_fee * policy.base_fee_multiplier)
+            + priority_fee,
+            "maxPriorityFeePerGas": priority_fee,
+        }
+
+    def _ensure_refresh_task(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def _refresh_loop(self) -> None:
+        try:
+            while time.monotonic() - self._last_used < self.idle_timeout:
+                await asyncio.sleep(self.refresh_interval)
+                try:
+                    async with self._lock:
+                        await self._refresh(self._web3)
+                except Exception as e:
+                    logger.debug(
+                        f"Gas oracle for chain {self.chain_id} refresh failed: {e}"
+                    )
+        finally:
+            web3, self._web3 = self._web3, None
+            if web3 is not None:
+                await provider_pool.release(web3)
+
+    async def _refresh(self, web3: AsyncWeb3, force: bool = False) -> None:
+        block_number = await web3.eth.block_number
+        if (
+            not force
+            and self.snapshot is not None
+            and self.snapshot.block_number == block_number
+        ):
+            self.snapshot.checked_at = time.monotonic()
+            return
+
+        percentiles = sorted(self._percentiles)
+        fee_history, suggested_priority_fee = await asyncio.gather(
+            web3.eth.fee_history(1, block_number, percentiles or None),
+            web3.eth.max_priority_fee,
+            return_exceptions=True,
+        )
+
+        base_fees = (
+            fee_history.get("baseFeePerGas")
+            if not isinstance(fee_history, Exception)
+            else None
+        )
+        if not base_fees or not base_fees[-1]:
+            # No EIP-1559 on this chain
+            self.snapshot = GasSnapshot(
+                block_number=block_number, gas_price=await web3.eth.gas_price
+            )
+            return
+
+        if isinstance(suggested_priority_fee, Exception):
+            if not percentiles:
+                raise suggested_priority_fee
+            suggested_priority_fee = 0
+
+        rewards = fee_history.get("reward") or [[]]
+        self.snapshot = GasSnapshot(
+            block_number=block_number,
+            # [requested block, next block], the first one like get_block("latest")
+            base_fee=base_fees[0],
+            rewards=dict(zip(percentiles, rewards[-1])),
+            suggested_priority_fee=suggested_priority_fee,
+        )
+
+
+_gas_oracles: Dict[int, GasOracle] = {}
+
+
+def get_gas_oracle(chain_id: int) -> GasOracle:
+    """The process-wide gas oracle of a chain."""
+    if chain_id not in _gas_oracles:
+        _gas_oracles[chain_id] = GasOracle(
+            chain_id,
+            refresh_interval=get_config().ONCHAIN.GAS_ORACLE_REFRESH_INTERVAL,
+        )
+    return _gas_oracles[chain_id]
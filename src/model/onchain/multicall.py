@@ -0,0 +1,152 @@
+import asyncio
+from typing import Any, Dict, List, Sequence, Tuple
+
+from loguru import logger
+from web3 import AsyncWeb3
+from web3.contract import AsyncContract
+
+from src.model.onchain.abi_registry import abi_registry
+from src.model.onchain.static_cache import get_static_cache
+
+
+# Same address on every chain it is deployed to
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"internalType": "uint256", "name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+# Max calls in one aggregate3, bigger lists are split into several eth_calls
+MAX_CALLS_PER_AGGREGATE = 100
+
+# (contract, function name, function args)
+ContractCall = Tuple[AsyncContract, str, Sequence[Any]]
+
+_deployed: Dict[Tuple[int, str], bool] = {}
+
+
+async def is_multicall_deployed(web3: AsyncWeb3, chain_id: int, address: str) -> bool:
+    """
+    Check once per chain whether Multicall3 exists at the address. Deployed
+    contracts stay deployed, so a positive answer is kept in the static cache
+    across runs. A missing one is checked again next run.
+    """
+    key = (chain_id, address.lower())
+    if key not in _deployed:
+        static_cache = get_static_cache()
+        if static_cache.get(chain_id, "has_code", address):
+            _deployed[key] = True
+            return True
+
+        code = await web3.eth.get_code(web3.to_checksum_address(address))
+        _deployed[key] = len(code) > 0
+        if _deployed[key]:
+            static_cache.set(chain_id, "has_code", address, value=True)
+        else:
+            logger.warning(
+                f"Multicall3 is not deployed on chain {chain_id}, contract reads are sent one by one"
+            )
+    return _deployed[key]
+
+
+async def aggregate3(
+    web3: AsyncWeb3,
+    calls: List[ContractCall],
+    address: str = MULTICALL3_ADDRESS,
+    allow_failure: bool = True,
+) -> List[Any]:
+    """
+    Execute contract reads through Multicall3.aggregate3.
+
+    Returns the decoded result of every call in order. With allow_failure a
+    reverted call gives None instead of failing the whole batch.
+    """
+    multicall = abi_registry.contract(web3, address, MULTICALL3_ABI)
+
+    chunks = [
+        calls[i : i + MAX_CALLS_PER_AGGREGATE]
+        for i in range(0, len(calls), MAX_CALLS_PER_AGGREGATE)
+    ]
+    responses = await asyncio.gather(
+        *(
+            multicall.functions.aggregate3(
+                [
+                    (
+                        contract.address,
+                        allow_failure,
+                        abi_registry.function(contract.abi, function).encode(*args),
+                    )
+                    for contract, function, args in chunk
+                ]
+            ).call()
+            for chunk in chunks
+        )
+    )
+
+    results = []
+    for (contract, function, _), (success, data) in zip(
+        calls, (result for response in responses for result in response)
+    ):
+        try:
+            if not success:
+                raise Exception("call reverted")
+            results.append(abi_registry.function(contract.abi, function).decode(data))
+        except Exception as e:
+            # Empty return data (no contract at the address) fails decoding too
+            if not allow_failure:
+                raise Exception(
+                    f"Multicall to {contract.address}.{function} failed: {e}"
+                )
+            results.append(None)
+
+    return results
+
+
+async def call_each(calls: List[ContractCall], allow_failure: bool = True) -> List[Any]:
+    """Fallback for chains without Multicall3: one eth_call per read."""
+    results = await asyncio.gather(
+        *(
+            contract.get_function_by_name(function)(*args).call()
+            for contract, function, args in calls
+        ),
+        return_exceptions=True,
+    )
+
+    for result in results:
+        if isinstance(result, Exception) and not allow_failure:
+            raise result
+    return [None if isinstance(result, Exception) else result for result in results]
@@ -0,0 +1,68 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, Tuple
+
+from loguru import logger
+from web3 import AsyncWeb3
+
+
+# Node errors meaning our local nonce no longer matches the chain
+NONCE_ERRORS = (
+    "nonce too low",
+    "nonce too high",
+    "invalid nonce",
+    "replacement transaction underpriced",
+    "already known",
+)
+
+NonceKey = Tuple[int, str]
+
+
+def is_nonce_error(error: Exception) -> bool:
+    error_msg = str(error).lower()
+    return any(nonce_error in error_msg for nonce_error in NONCE_ERRORS)
+
+
+class NonceManager:
+    """
+    Hands out transaction nonces per (chain id, address).
+
+    The pending nonce is fetched from the node once, after that nonces are
+    assigned locally, so back-to-back transactions (approve + swap) neither
+    pay for an extra round-trip nor wait for the previous one to be mined.
+    The cached value is dropped on nonce errors and after transactions that
+    were never sent or got lost, and refetched on the next call.
+    """
+
+    def __init__(self):
+        self._next_nonce: Dict[NonceKey, int] = {}
+        self._locks: Dict[NonceKey, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def get_nonce(self, web3: AsyncWeb3, address: str, chain_id: int) -> int:
+        """Reserve the next nonce for the address."""
+        key = (chain_id, address.lower())
+
+        async with self._locks[key]:
+            if key not in self._next_nonce:
+                self._next_nonce[key] = await web3.eth.get_transaction_count(
+                    web3.to_checksum_address(address), "pending"
+                )
+
+            nonce = self._next_nonce[key]
+            self._next_nonce[key] = nonce + 1
+            return nonce
+
+    def invalidate(self, address: str, chain_id: int) -> None:
+        """Forget the local nonce, the next call fetches it from the node again."""
+        if self._next_nonce.pop((chain_id, address.lower()), None) is not None:
+            logger.debug(f"Nonce of {address} on chain {chain_id} will be resynced")
+
+    def handle_error(self, error: Exception, address: str, chain_id: int) -> bool:
+        """Resync the nonce if the error was caused by it. Returns True if it was."""
+        if not is_nonce_error(error):
+            return False
+        self.invalidate(address, chain_id)
+        return True
+
+
+nonce_manager = NonceManager()
@@ -0,0 +1,218 @@
+import asyncio
+import math
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from loguru import logger
+from web3.types import TxReceipt
+
+if TYPE_CHECKING:
+    from src.model.onchain.web3_custom import Web3Custom
+
+
+# Nodes accept a replacement only if both fees grow by at least 10%
+REPLACEMENT_FEE_MULTIPLIER = 1.125
+
+
+class TransactionCancelled(Exception):
+    """The transaction was replaced by a cancellation before it was mined."""
+
+
+def bump_fees(
+    transaction: Dict[str, Any], multiplier: float = REPLACEMENT_FEE_MULTIPLIER
+) -> Dict[str, int]:
+    """Gas price params high enough for a node to accept a replacement at the same nonce."""
+    if "maxFeePerGas" in transaction:
+        return {
+            "maxFeePerGas": math.ceil(transaction["maxFeePerGas"] * multiplier) + 1,
+            "maxPriorityFeePerGas": math.ceil(
+                transaction["maxPriorityFeePerGas"] * multiplier
+            )
+            + 1,
+        }
+    return {"gasPrice": math.ceil(transaction["gasPrice"] * multiplier) + 1}
+
+
+class PendingTransaction:
+    """
+    A broadcast transaction, resolved in the background once it is mined.
+
+    wait() returns the receipt of the transaction itself or raises
+    TransactionCancelled if a replacement sent by cancel() was mined instead.
+
+    With replace_after set, a transaction still pending after that many
+    seconds is re-signed at the same nonce with fees raised by
+    fee_multiplier (or to the current network fees, whichever is higher),
+    up to max_replacements times. Every sent hash is watched until one of
+    them is mined, tx_hash and transaction then refer to the mined one.
+    """
+
+    def __init__(
+        self,
+        web3: "Web3Custom",
+        tx_hash: HexBytes,
+        transaction: Dict[str, Any],
+        wallet: LocalAccount,
+        chain_id: int,
+        replace_after: float = 0,
+        max_replacements: int = 0,
+        fee_multiplier: float = REPLACEMENT_FEE_MULTIPLIER,
+    ):
+        self.web3 = web3
+        self.tx_hash = tx_hash
+        self.transaction = transaction
+        self.wallet = wallet
+        self.chain_id = chain_id
+        self.replace_after = replace_after
+        self.max_replacements = max_replacements
+        # Nodes reject replacements with less than a 10% fee increase
+        self.fee_multiplier = max(fee_multiplier, 1.1)
+
+        # Every hash sent for this nonce, the original first
+        self.hashes: List[HexBytes] = [tx_hash]
+        # The last version sent, replacements raise its fees
+        self._latest = transaction
+        self._cancelling = False
+
+        self._result: asyncio.Future = asyncio.get_running_loop().create_future()
+        # Don't warn about failures nobody awaited, e.g. of rolled back transactions
+        self._result.add_done_callback(
+            lambda future: future.cancelled() or future.exception()
+        )
+        self._watchers: Set[asyncio.Task] = set()
+        self._watch(tx_hash, transaction, cancellation=False)
+
+        self._replacer: Optional[asyncio.Task] = None
+        if replace_after > 0 and max_replacements > 0:
+            self._replacer = asyncio.create_task(self._replace_when_stuck())
+
+    @property
+    def nonce(self) -> int:
+        return self.transaction["nonce"]
+
+    def done(self) -> bool:
+        return self._result.done()
+
+    def add_done_callback(self, callback: Callable[["PendingTransaction"], Any]) -> None:
+        """Call callback(self) once the transaction is mined, cancelled or failed."""
+        self._result.add_done_callback(lambda _: callback(self))
+
+    async def wait(self) -> TxReceipt:
+        """Receipt of the transaction, raises TimeExhausted if it was not mined in time."""
+        return await asyncio.shield(self._result)
+
+    async def cancel(self) -> None:
+        """
+        Replace the transaction with an empty self-transfer at the same nonce.
+        If the original is mined first the replacement is rejected and wait()
+        returns its receipt as usual.
+        """
+        if self.done() or self._cancelling:
+            return
+
+        cancellation = {
+            "from": self.wallet.address,
+            "to": self.wallet.address,
+            "value": 0,
+            "gas": 21000,
+            "nonce": self.nonce,
+            "chainId": self.chain_id,
+            **bump_fees(self._latest, self.fee_multiplier),
+        }
+        if "maxFeePerGas" in cancellation:
+            cancellation["type"] = 2
+
+        if await self._send_replacement(cancellation, cancellation=True):
+            # A stuck cancellation is sped up like the original would be
+            self._cancelling = True
+
+    async def _replace_when_stuck(self) -> None:
+        for _ in range(self.max_replacements):
+            await asyncio.wait({self._result}, timeout=self.replace_after)
+            if self.done():
+                return
+
+            replacement = {
+                **self._latest,
+                **await self._replacement_fees(),
+            }
+            logger.warning(
+                f"{self.web3.account_index} | Transaction with nonce {self.nonce} pending for "
+                f"{self.replace_after:.0f}s, replacing it with higher fees"
+            )
+            await self._send_replacement(replacement, cancellation=self._cancelling)
+
+    async def _replacement_fees(self) -> Dict[str, int]:
+        fees = bump_fees(self._latest, self.fee_multiplier)
+        # The base fee may have grown by more than the bump since the last version
+        network_fees = await self.web3.get_gas_params()
+        if network_fees and network_fees.keys() == fees.keys():
+            fees = {name: max(fee, network_fees[name]) for name, fee in fees.items()}
+        return fees
+
+    async def _send_replacement(
+        self, transaction: Dict[str, Any], cancellation: bool
+    ) -> bool:
+        try:
+            raw_transaction = await self.web3.sign_transaction(
+                transaction, self.wallet.key
+            )
+            tx_hash = await self.web3.web3.eth.send_raw_transaction(raw_transaction)
+        except Exception as e:
+            # Usually "nonce too low" - one of the sent versions is already mined
+            logger.debug(
+                f"{self.web3.account_index} | Replacement of nonce {self.nonce} rejected: {e}"
+            )
+            return False
+
+        self._latest = transaction
+        self.hashes.append(tx_hash)
+        self._watch(tx_hash, transaction, cancellation)
+        return True
+
+    def _watch(
+        self, tx_hash: HexBytes, transaction: Dict[str, Any], cancellation: bool
+    ) -> None:
+        task = asyncio.create_task(
+            self._wait_mined(tx_hash, transaction, cancellation)
+        )
+        self._watchers.add(task)
+
+    async def _wait_mined(
+        self, tx_hash: HexBytes, transaction: Dict[str, Any], cancellation: bool
+    ) -> None:
+        try:
+            receipt = await self.web3.watch_receipt(tx_hash)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._watchers.discard(asyncio.current_task())
+            # Fail only when none of the sent versions is left
+            if not self._watchers and not self._result.done():
+                self._result.set_exception(e)
+            return
+
+        self._watchers.discard(asyncio.current_task())
+        if not self._result.done():
+            if cancellation:
+                self._result.set_exception(
+                    TransactionCancelled(
+                        f"Transaction {self.tx_hash.hex()} was cancelled"
+                    )
+                )
+            else:
+                if tx_hash != self.tx_hash:
+                    logger.info(
+                        f"{self.web3.account_index} | Transaction {self.tx_hash.hex()} "
+                        f"was replaced by {tx_hash.hex()}"
+                    )
+                self.tx_hash = tx_hash
+                self.transaction = transaction
+                self._result.set_result(receipt)
+
+        # The other hashes of this nonce can never be mined now
+        for task in self._watchers:
+            task.cancel()
+        self._watchers.clear()
+
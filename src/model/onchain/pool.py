@@ -0,0 +1,215 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from aiohttp import ClientSession, TCPConnector
+from loguru import logger
+from web3 import AsyncWeb3, AsyncHTTPProvider
+
+from src.utils.config import get_config
+from src.model.onchain.batching import BatchingHTTPProvider
+from src.model.onchain.balancer import LoadBalancedProvider
+from src.model.onchain.rate_limited import RateLimitedHTTPProvider
+from src.utils.rate_limiter import get_rate_limiter
+
+
+PoolKey = Tuple[Tuple[str, ...], Optional[str]]
+
+
+def build_provider(rpc_urls: List[str], request_kwargs: dict):
+    """
+    Create a provider for the given RPC URLs.
+
+    Several URLs are wrapped into a LoadBalancedProvider, a single URL gets a
+    plain HTTP provider. Reads are batched if ONCHAIN.BATCH_RPC_REQUESTS is set,
+    requests to one host are limited to OTHERS.RPC_REQUESTS_PER_SECOND if it
+    is set.
+    """
+    config = get_config()
+    onchain_config = config.ONCHAIN
+
+    def http_provider(rpc_url: str, **kwargs) -> AsyncHTTPProvider:
+        # One limiter per RPC host, shared by every account's provider
+        rate_limiter = get_rate_limiter(
+            rpc_url,
+            config.OTHERS.RPC_REQUESTS_PER_SECOND,
+            config.OTHERS.REQUESTS_BURST,
+            kind="rpc",
+        )
+        if onchain_config.BATCH_RPC_REQUESTS:
+            return BatchingHTTPProvider(
+                rpc_url,
+                request_kwargs=request_kwargs,
+                rate_limiter=rate_limiter,
+                batch_window=onchain_config.BATCH_WINDOW_MS / 1000,
+                max_batch_size=onchain_config.BATCH_MAX_SIZE,
+                **kwargs,
+            )
+        return RateLimitedHTTPProvider(
+            rpc_url, request_kwargs=request_kwargs, rate_limiter=rate_limiter, **kwargs
+        )
+
+    if len(rpc_urls) == 1:
+        return http_provider(rpc_urls[0])
+
+    # The balancer moves failed reads to another endpoint itself, web3's own
+    # retries on the same endpoint would only delay that
+    return LoadBalancedProvider(
+        [
+            http_provider(rpc_url, exception_retry_configuration=None)
+            for rpc_url in rpc_urls
+        ],
+        eject_after_errors=onchain_config.RPC_EJECT_AFTER_ERRORS,
+        health_check_interval=onchain_config.RPC_HEALTH_CHECK_INTERVAL,
+        hedge_percentile=(
+            onchain_config.HEDGE_PERCENTILE
+            if onchain_config.HEDGE_READ_REQUESTS
+            else None
+        ),
+        hedge_min_delay=onchain_config.HEDGE_MIN_DELAY_MS / 1000,
+    )
+
+
+@dataclass
+class _PoolEntry:
+    """One shared AsyncWeb3 client with its keep-alive session."""
+
+    web3: AsyncWeb3
+    session: ClientSession
+    refs: int = 0
+    chain_id: Optional[int] = None
+    close_handle: Optional[asyncio.TimerHandle] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class ProviderPool:
+    """
+    Process-wide pool of RPC clients keyed by (RPC URLs, proxy).
+
+    Accounts that use the same RPC through the same proxy share one provider
+    and one aiohttp session, so TCP/TLS connections stay warm between accounts.
+    Entries are reference counted and closed after they stay unused for
+    ONCHAIN.POOL_IDLE_TIMEOUT seconds.
+    """
+
+    def __init__(self):
+        self._entries: Dict[PoolKey, _PoolEntry] = {}
+        self._keys: Dict[int, PoolKey] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(
+        self, rpc_urls: List[str], proxy: Optional[str], ssl: bool = False
+    ) -> AsyncWeb3:
+        """
+        Get a shared AsyncWeb3 client for the RPC/proxy pair and take a reference.
+        Several RPC URLs give one client load balanced across all of them.
+        """
+        key = (tuple(rpc_urls), proxy)
+
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.session.closed:
+                entry = self._create_entry(list(rpc_urls), proxy, ssl)
+                await entry.web3.provider.cache_async_session(entry.session)
+                self._entries[key] = entry
+                self._keys[id(entry.web3)] = key
+
+            if entry.close_handle is not None:
+                entry.close_handle.cancel()
+                entry.close_handle = None
+            entry.refs += 1
+
+        return entry.web3
+
+    async def verify(self, web3: AsyncWeb3) -> int:
+        """
+        Check the connection once per pool entry instead of once per account.
+        Returns the chain ID.
+        """
+        entry = self._find_entry(web3)
+        if entry is None:
+            return await web3.eth.chain_id
+
+        async with entry.lock:
+            if entry.chain_id is None:
+                entry.chain_id = await web3.eth.chain_id
+            return entry.chain_id
+
+    def is_pooled(self, web3: AsyncWeb3) -> bool:
+        return id(web3) in self._keys
+
+    async def release(self, web3: AsyncWeb3) -> None:
+        """Drop one reference; the entry is closed once it stays unused."""
+        async with self._lock:
+            key = self._find_key(web3)
+            if key is None:
+                return
+
+            entry = self._entries[key]
+            entry.refs = max(entry.refs - 1, 0)
+            if entry.refs > 0 or entry.close_handle is not None:
+                return
+
+            idle_timeout = get_config().ONCHAIN.POOL_IDLE_TIMEOUT
+            entry.close_handle = asyncio.get_running_loop().call_later(
+                idle_timeout,
+                lambda: asyncio.create_task(self._close_idle(key, entry)),
+            )
+
+    async def close_all(self) -> None:
+        """Close every pooled session regardless of reference counts."""
+        async with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._keys.clear()
+
+        for entry in entries:
+            if entry.close_handle is not None:
+                entry.close_handle.cancel()
+            await self._close_entry(entry)
+
+    def _create_entry(
+        self, rpc_urls: List[str], proxy: Optional[str], ssl: bool
+    ) -> _PoolEntry:
+        onchain_config = get_config().ONCHAIN
+        provider = build_provider(rpc_urls, {"proxy": proxy, "ssl": ssl})
+
+        # web3 creates its sessions with force_close=True, which means a new
+        # TCP/TLS handshake for every request. Our connector keeps them alive.
+        session = ClientSession(
+            raise_for_status=True,
+            connector=TCPConnector(
+                limit_per_host=onchain_config.POOL_CONNECTIONS_PER_HOST,
+                keepalive_timeout=onchain_config.POOL_KEEPALIVE_SECONDS,
+                ssl=ssl,
+            ),
+        )
+
+        return _PoolEntry(web3=AsyncWeb3(provider), session=session)
+
+    def _find_key(self, web3: AsyncWeb3) -> Optional[PoolKey]:
+        return self._keys.get(id(web3))
+
+    def _find_entry(self, web3: AsyncWeb3) -> Optional[_PoolEntry]:
+        key = self._find_key(web3)
+        return self._entries.get(key) if key is not None else None
+
+    async def _close_idle(self, key: PoolKey, entry: _PoolEntry):
+        async with self._lock:
+            if self._entries.get(key) is not entry or entry.refs > 0:
+                return
+            del self._entries[key]
+            self._keys.pop(id(entry.web3), None)
+
+        await self._close_entry(entry)
+
+    async def _close_entry(self, entry: _PoolEntry) -> None:
+        try:
+            await entry.web3.provider.disconnect()
+            if not entry.session.closed:
+                await entry.session.close()
+        except Exception as e:
+            logger.error(f"Error closing pooled RPC session: {str(e)}")
+
+
+provider_pool = ProviderPool()
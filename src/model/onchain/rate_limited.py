@@ -0,0 +1,67 @@
+from typing import Any, Optional
+
+from aiohttp import ClientResponse, ClientResponseError
+from web3 import AsyncHTTPProvider
+from web3._utils.http_session_manager import HTTPSessionManager
+from eth_typing import URI
+
+from src.utils.rate_limiter import (
+    RATE_LIMITED_ATTEMPTS,
+    RateLimiter,
+    parse_retry_after,
+)
+
+
+class RateLimitedSessionManager(HTTPSessionManager):
+    """
+    Session manager that takes a slot from the host's rate limiter before
+    every HTTP request (single calls, batches and web3's own retries alike)
+    and waits out 429 responses instead of returning them.
+    """
+
+    def __init__(self, rate_limiter: RateLimiter, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.rate_limiter = rate_limiter
+
+    async def async_get_response_from_post_request(
+        self, endpoint_uri: URI, *args: Any, **kwargs: Any
+    ) -> ClientResponse:
+        for attempt in range(RATE_LIMITED_ATTEMPTS):
+            await self.rate_limiter.acquire()
+            try:
+                response = await super().async_get_response_from_post_request(
+                    endpoint_uri, *args, **kwargs
+                )
+            except ClientResponseError as e:
+                # web3's sessions raise for error statuses themselves
+                if e.status != 429 or attempt == RATE_LIMITED_ATTEMPTS - 1:
+                    raise
+                self.rate_limiter.record_rate_limited(
+                    parse_retry_after((e.headers or {}).get("Retry-After"))
+                )
+                continue
+
+            if response.status != 429 or attempt == RATE_LIMITED_ATTEMPTS - 1:
+                if response.status != 429:
+                    self.rate_limiter.record_success()
+                # Still limited, raise_for_status() of the caller raises
+                return response
+            self.rate_limiter.record_rate_limited(
+                parse_retry_after(response.headers.get("Retry-After"))
+            )
+            response.release()
+
+
+class RateLimitedHTTPProvider(AsyncHTTPProvider):
+    """AsyncHTTPProvider whose requests go through a shared rate limiter."""
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        request_kwargs: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs, **kwargs)
+        if rate_limiter is not None:
+            self._request_session_manager = RateLimitedSessionManager(rate_limiter)
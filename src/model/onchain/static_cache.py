@@ -0,0 +1,213 @@
+import asyncio
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+
+from src.utils.config import get_config
+
+
+# (value, expiry as unix time or None for values that never change)
+Entry = Tuple[Any, Optional[float]]
+
+# Changes made within this many seconds are written to the file together
+SAVE_DELAY = 2.0
+
+
+@contextmanager
+def _file_lock(path: str, timeout: float = 5.0):
+    """Lock between processes. A lock left by a crashed process is broken after timeout."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                deadline = time.monotonic() + timeout
+            else:
+                time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class StaticCache:
+    """
+    Results of RPC reads that don't change during a run: chain ids, contract
+    code presence, token decimals and contract settings like minimum deposits.
+
+    Values are kept in memory, a hit never leaves the process. Immutable
+    entries live forever, others expire after their ttl. With a path set,
+    entries are also saved to a JSON file and loaded on the next run, so
+    they are not fetched again after a restart. Values must be JSON
+    serializable.
+
+    Changes are written SAVE_DELAY seconds after the first one, in a thread,
+    merged with the file on disk, so worker processes sharing the file keep
+    each other's entries.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._entries: Dict[str, Entry] = {}
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._loaded = False
+
+        self._dirty = False
+        # Keys invalidated since the last save, dropped from the file too
+        self._removed: Set[str] = set()
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_lock = asyncio.Lock()
+
+    @staticmethod
+    def _key(parts: Sequence[Any]) -> str:
+        # Addresses come both checksummed and lowercase
+        return "|".join(str(part).lower() for part in parts)
+
+    def _read_file(self) -> Dict[str, Entry]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to read RPC cache {self.path}: {e}")
+            return {}
+
+    def _load(self) -> None:
+        self._loaded = True
+        now = time.time()
+        for key, (value, expires_at) in self._read_file().items():
+            if expires_at is None or expires_at > now:
+                self._entries.setdefault(key, (value, expires_at))
+
+    def _changed(self) -> None:
+        if not self.path:
+            return
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(*self._take_changes())
+            return
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(
+                SAVE_DELAY, lambda: asyncio.create_task(self.flush())
+            )
+
+    def _take_changes(self) -> Tuple[Dict[str, Entry], Set[str]]:
+        self._dirty = False
+        removed, self._removed = self._removed, set()
+        return dict(self._entries), removed
+
+    async def flush(self) -> None:
+        """Write pending changes to the file now."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        async with self._save_lock:
+            if not self._dirty:
+                return
+            await asyncio.to_thread(self._write, *self._take_changes())
+
+    def _write(self, entries: Dict[str, Entry], removed: Set[str]) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with _file_lock(f"{self.path}.lock"):
+                # Other processes may have saved entries this one doesn't have
+                merged = self._read_file()
+                for key in removed:
+                    merged.pop(key, None)
+                merged.update(entries)
+
+                now = time.time()
+                merged = {
+                    key: entry
+                    for key, entry in merged.items()
+                    if entry[1] is None or entry[1] > now
+                }
+                temp_path = f"{self.path}.{os.getpid()}.{id(self)}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(merged, f)
+                # Readers never see a half written file
+                os.replace(temp_path, self.path)
+        except Exception as e:
+            logger.debug(f"Failed to save RPC cache {self.path}: {e}")
+
+    def _get(self, key: str) -> Optional[Entry]:
+        if not self._loaded:
+            self._load()
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.time():
+            del self._entries[key]
+            return None
+        return entry
+
+    def get(self, *parts: Any) -> Optional[Any]:
+        """Cached value, None if it is not cached or expired."""
+        entry = self._get(self._key(parts))
+        return entry[0] if entry is not None else None
+
+    def set(self, *parts: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a value, forever if ttl is None."""
+        if not self._loaded:
+            self._load()
+        expires_at = time.time() + ttl if ttl is not None else None
+        key = self._key(parts)
+        self._entries[key] = (value, expires_at)
+        self._removed.discard(key)
+        self._changed()
+
+    async def fetch(
+        self,
+        parts: Sequence[Any],
+        fetcher: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Cached value, fetcher is called on a miss. Accounts asking for the
+        same value at the same time wait for one fetch.
+        """
+        key = self._key(parts)
+        entry = self._get(key)
+        if entry is not None:
+            return entry[0]
+
+        async with self._locks[key]:
+            entry = self._get(key)
+            if entry is not None:
+                return entry[0]
+            value = await fetcher()
+            self.set(*parts, value=value, ttl=ttl)
+            return value
+
+    def invalidate(self, *parts: Any) -> None:
+        key = self._key(parts)
+        if self._entries.pop(key, None) is not None:
+            self._removed.add(key)
+            self._changed()
+
+
+_static_cache: Optional[StaticCache] = None
+
+
+def get_static_cache() -> StaticCache:
+    """The process-wide cache, saved to ONCHAIN.STATIC_CACHE_FILE if it is set."""
+    global _static_cache
+    if _static_cache is None:
+        _static_cache = StaticCache(get_config().ONCHAIN.STATIC_CACHE_FILE or None)
+    return _static_cache
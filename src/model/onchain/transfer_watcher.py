@@ -0,0 +1,192 @@
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import AsyncWeb3
+
+from src.utils.config import get_config
+
+if TYPE_CHECKING:
+    from src.model.onchain.web3_custom import Web3Custom
+
+
+# keccak("Transfer(address,address,uint256)")
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+# (token, recipient), checksummed
+TransferKey = Tuple[str, str]
+
+
+def _address_topic(address: str) -> str:
+    return "0x" + address[2:].lower().rjust(64, "0")
+
+
+def parse_transfer(log) -> Optional[Tuple[TransferKey, int]]:
+    """(token, recipient) and amount of an ERC20 Transfer log, None for other logs."""
+    topics = log["topics"]
+    # ERC721 Transfer has the token id indexed too
+    if len(topics) != 3 or HexBytes(topics[0]) != HexBytes(TRANSFER_TOPIC):
+        return None
+    key = (
+        AsyncWeb3.to_checksum_address(log["address"]),
+        AsyncWeb3.to_checksum_address(HexBytes(topics[2])[-20:]),
+    )
+    return key, int.from_bytes(HexBytes(log["data"]), "big")
+
+
+def received_amount(logs, token: str, recipient: str) -> int:
+    """Sum of the token's transfers to the recipient in the logs, e.g. of a receipt."""
+    key = (
+        AsyncWeb3.to_checksum_address(token),
+        AsyncWeb3.to_checksum_address(recipient),
+    )
+    return sum(
+        transfer[1]
+        for transfer in map(parse_transfer, logs)
+        if transfer is not None and transfer[0] == key
+    )
+
+
+class TransferWatcher:
+    """
+    Detects ERC20 tokens arriving at the accounts of one chain.
+
+    Waiters register a token, a recipient and the block to look from. One
+    task follows new blocks and asks for the Transfer logs of all watched
+    tokens to all watched recipients with a single eth_getLogs per block
+    range, so any number of accounts costs one query per block. A waiter
+    is resolved with the exact amount of the transfers it got, no balance
+    is read. The task stops when nobody waits.
+    """
+
+    def __init__(
+        self,
+        chain_id: int,
+        poll_interval: float = 2.0,
+        max_blocks_per_query: int = 500,
+    ):
+        self.chain_id = chain_id
+        self.poll_interval = poll_interval
+        self.max_blocks_per_query = max_blocks_per_query
+
+        self._waiters: Dict[TransferKey, List[Tuple[int, asyncio.Future]]] = {}
+        # Clients of the current waiters, the latest one is used for polling
+        self._clients: List["Web3Custom"] = []
+        # Next block to scan, None until the first poll
+        self._next_block: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait_for_transfer(
+        self,
+        web3: "Web3Custom",
+        token: str,
+        recipient: str,
+        from_block: int,
+        timeout: float = 60,
+    ) -> Optional[int]:
+        """
+        Amount in wei the recipient got in the first block since from_block
+        with transfers of the token to it, None after timeout.
+        """
+        key = (
+            AsyncWeb3.to_checksum_address(token),
+            AsyncWeb3.to_checksum_address(recipient),
+        )
+        future = asyncio.get_running_loop().create_future()
+        waiter = (from_block, future)
+        self._waiters.setdefault(key, []).append(waiter)
+        self._clients.append(web3)
+        if self._next_block is not None and from_block < self._next_block:
+            # Blocks already scanned for others are scanned again for this waiter
+            self._next_block = from_block
+        self._ensure_task()
+
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._clients.remove(web3)
+            waiters = self._waiters.get(key, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(key, None)
+
+    def _ensure_task(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._watch_loop())
+
+    async def _watch_loop(self) -> None:
+        while self._waiters:
+            try:
+                await self._poll()
+            except Exception as e:
+                logger.debug(
+                    f"Transfer watcher for chain {self.chain_id} poll failed: {e}"
+                )
+            await asyncio.sleep(self.poll_interval)
+
+        self._next_block = None
+
+    async def _poll(self) -> None:
+        if not self._clients:
+            return
+        web3 = self._clients[-1].web3
+
+        latest = await web3.eth.block_number
+        if self._next_block is None:
+            self._next_block = min(
+                from_block
+                for waiters in self._waiters.values()
+                for from_block, _ in waiters
+            )
+        if self._next_block > latest:
+            return
+        from_block = self._next_block
+        to_block = min(latest, from_block + self.max_blocks_per_query - 1)
+
+        keys = list(self._waiters)
+        logs = await web3.eth.get_logs(
+            {
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "address": sorted({token for token, _ in keys}),
+                "topics": [
+                    TRANSFER_TOPIC,
+                    None,
+                    sorted({_address_topic(recipient) for _, recipient in keys}),
+                ],
+            }
+        )
+        self._next_block = max(self._next_block, to_block + 1)
+
+        # Transfers of a block to one recipient are summed up
+        received: Dict[TransferKey, Dict[int, int]] = {}
+        for log in logs:
+            transfer = parse_transfer(log)
+            if transfer is None:
+                continue
+            key, amount = transfer
+            blocks = received.setdefault(key, {})
+            blocks[log["blockNumber"]] = blocks.get(log["blockNumber"], 0) + amount
+
+        for key, blocks in received.items():
+            for waiter_block, future in self._waiters.get(key, []):
+                arrived = [block for block in sorted(blocks) if block >= waiter_block]
+                if arrived and not future.done():
+                    future.set_result(blocks[arrived[0]])
+
+
+_transfer_watchers: Dict[int, TransferWatcher] = {}
+
+
+def get_transfer_watcher(chain_id: int) -> TransferWatcher:
+    """The process-wide ERC20 transfer watcher of a chain."""
+    if chain_id not in _transfer_watchers:
+        _transfer_watchers[chain_id] = TransferWatcher(
+            chain_id,
+            poll_interval=get_config().ONCHAIN.BLOCK_WATCHER_POLL_INTERVAL,
+        )
+    return _transfer_watchers[chain_id]
@@ -1,14 +1,41 @@
 from decimal import Decimal
-from typing import Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from loguru import logger
 from web3 import AsyncWeb3
+from web3.types import TxReceipt
+from web3.exceptions import TimeExhausted
+from hexbytes import HexBytes
 from eth_account.signers.local import LocalAccount
 from src.utils.decorators import retry_async
-from src.model.onchain.constants import Balance
+from src.utils.config import get_config
+from src.utils.signer import get_signer_pool
+from src.model.onchain.constants import ERC20_ABI, Balance
+from src.model.onchain.abi_registry import abi_registry
+from src.model.onchain.allowance_ledger import allowance_ledger
+from src.model.onchain.pool import build_provider, provider_pool
+from src.model.onchain.nonce_manager import is_nonce_error, nonce_manager
+from src.model.onchain.gas_oracle import GasPolicy, get_gas_oracle, get_gas_policy
+from src.model.onchain.block_watcher import get_block_watcher
+from src.model.onchain.balance_watcher import get_balance_watcher
+from src.model.onchain.transfer_watcher import get_transfer_watcher, received_amount
+from src.model.onchain.gas_estimates import get_gas_estimate_cache
+from src.model.onchain.static_cache import get_static_cache
+from src.model.onchain.pipeline import PendingTransaction
+from src.model.onchain.multicall import (
+    ContractCall,
+    aggregate3,
+    call_each,
+    is_multicall_deployed,
+)
 import asyncio
+import math
 import traceback
 
 
+# Buffer applied to eth_estimateGas results
+GAS_LIMIT_MULTIPLIER = 2.2
+
+
 class Web3Custom:
     def __init__(
         self,
@@ -24,24 +51,57 @@ class Web3Custom:
         self.proxy = proxy
         self.ssl = ssl
         self.web3 = None
+        # Name of the module being executed, selects the gas policy
+        self.task_name: Optional[str] = None
+        self._chain_id: Optional[int] = None
+        self._holds_pool_reference = False
+        # Transactions of send_transaction by hash, until they are mined
+        self._pending: Dict[HexBytes, PendingTransaction] = {}
+
+    @property
+    def proxy_url(self) -> Optional[str]:
+        """Proxy of the RPC requests, None with OTHERS.USE_PROXY_FOR_RPC off."""
+        return f"http://{self.proxy}" if (self.use_proxy and self.proxy) else None
 
     async def connect_web3(self) -> None:
         """
         Try to connect to each RPC URL in the list.
         Makes 3 attempts for each RPC with 1 second delay between attempts.
+        If ONCHAIN.LOAD_BALANCE_RPCS is enabled, all RPC URLs are used at once
+        through a load balancer instead of falling back one by one.
+        If ONCHAIN.SHARE_RPC_CONNECTIONS is enabled, the client is taken from the
+        process-wide pool and shared with other accounts using the same RPC and proxy.
         """
-        for rpc_url in self.RPC_URLS:
+        onchain_config = get_config().ONCHAIN
+
+        if onchain_config.LOAD_BALANCE_RPCS and len(self.RPC_URLS) > 1:
+            rpc_groups = [self.RPC_URLS]
+        else:
+            rpc_groups = [[rpc_url] for rpc_url in self.RPC_URLS]
+
+        for rpc_urls in rpc_groups:
             for attempt in range(3):
                 try:
-                    proxy_settings = (
-                        (f"http://{self.proxy}")
-                        if (self.use_proxy and self.proxy)
-                        else None
-                    )
+                    proxy_settings = self.proxy_url
+
+                    if onchain_config.SHARE_RPC_CONNECTIONS:
+                        web3 = await provider_pool.acquire(
+                            rpc_urls, proxy_settings, self.ssl
+                        )
+                        try:
+                            # Test connection (once per pooled client)
+                            self._chain_id = await provider_pool.verify(web3)
+                        except Exception:
+                            await provider_pool.release(web3)
+                            raise
+                        self.web3 = web3
+                        self._holds_pool_reference = True
+                        return
+
                     self.web3 = AsyncWeb3(
-                        AsyncWeb3.AsyncHTTPProvider(
-                            rpc_url,
-                            request_kwargs={
+                        build_provider(
+                            rpc_urls,
+                            {
                                 "proxy": proxy_settings,
                                 "ssl": self.ssl,
                             },
@@ -49,12 +109,12 @@ class Web3Custom:
                     )
 
                     # Test connection
-                    await self.web3.eth.chain_id
+                    self._chain_id = await self.web3.eth.chain_id
                     return
 
                 except Exception as e:
                     logger.warning(
-                        f"{self.account_index} | Attempt {attempt + 1}/3 failed for {rpc_url}: {str(e)}"
+                        f"{self.account_index} | Attempt {attempt + 1}/3 failed for {', '.join(rpc_urls)}: {str(e)}"
                     )
                     if attempt < 2:  # Don't sleep after the last attempt
                         await asyncio.sleep(1)
@@ -95,36 +155,145 @@ class Web3Custom:
         Returns:
             Balance object with token balance
         """
-        if token_abi is None:
-            # Use minimal ERC20 ABI if none provided
-            token_abi = [
-                {
-                    "constant": True,
-                    "inputs": [{"name": "_owner", "type": "address"}],
-                    "name": "balanceOf",
-                    "outputs": [{"name": "balance", "type": "uint256"}],
-                    "type": "function",
-                }
-            ]
-
-        token_contract = self.web3.eth.contract(
-            address=self.web3.to_checksum_address(token_address), abi=token_abi
+        token_contract = abi_registry.contract(
+            self.web3, token_address, token_abi or ERC20_ABI
         )
         wei_balance = await token_contract.functions.balanceOf(wallet_address).call()
 
         return Balance.from_wei(wei_balance, decimals=decimals, symbol=symbol)
 
     @retry_async(attempts=3, delay=5.0, default_value=None)
-    async def get_gas_params(self) -> Dict[str, int]:
+    async def get_token_balances(
+        self, wallet_address: str, tokens: Dict[str, Dict]
+    ) -> Dict[str, Balance]:
+        """
+        Get balances of several ERC20 tokens in one multicall.
+
+        Args:
+            wallet_address: Address to check balances for
+            tokens: Token symbol -> {"address": ..., "decimals": ...}, missing
+                decimals are read from the token
+
+        Returns:
+            Token symbol -> Balance
+        """
+        symbols = list(tokens)
+        calls = [
+            (
+                abi_registry.contract(
+                    self.web3, tokens[symbol]["address"], ERC20_ABI
+                ),
+                "balanceOf",
+                (wallet_address,),
+            )
+            for symbol in symbols
+        ]
+        wei_balances = await self.multicall(calls, allow_failure=False)
+
+        decimals = {
+            symbol: tokens[symbol].get("decimals")
+            or await self.get_token_decimals(tokens[symbol]["address"])
+            for symbol in symbols
+        }
+        return {
+            symbol: Balance.from_wei(
+                wei_balance,
+                decimals=decimals[symbol],
+                symbol=symbol,
+            )
+            for symbol, wei_balance in zip(symbols, wei_balances)
+        }
+
+    async def multicall(
+        self, calls: List[ContractCall], allow_failure: bool = True
+    ) -> List[Any]:
+        """
+        Execute contract reads in a single eth_call through Multicall3.aggregate3.
+
+        Args:
+            calls: List of (contract, function name, args)
+            allow_failure: Return None for reads that revert instead of raising
+
+        Returns:
+            Decoded results in the order of calls. On chains without Multicall3
+            (see ONCHAIN.MULTICALL_ADDRESS) every read is sent separately.
+        """
+        if not calls:
+            return []
+
+        address = get_config().ONCHAIN.MULTICALL_ADDRESS
+        if address and await is_multicall_deployed(
+            self.web3, await self.get_chain_id(), address
+        ):
+            return await aggregate3(self.web3, calls, address, allow_failure)
+        return await call_each(calls, allow_failure)
+
+    async def get_chain_id(self) -> int:
+        """Chain ID of the connected network, requested once per instance."""
+        if self._chain_id is None:
+            self._chain_id = await self.web3.eth.chain_id
+        return self._chain_id
+
+    async def cached_call(
+        self,
+        contract: Any,
+        function_name: str,
+        *args: Any,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Result of a view call that never changes (ttl None) or changes rarely,
+        read from the chain once and then served from the static cache.
+        The result must be JSON serializable.
+        """
+        chain_id = await self.get_chain_id()
+        return await get_static_cache().fetch(
+            (chain_id, contract.address, function_name, *args),
+            lambda: contract.get_function_by_name(function_name)(*args).call(),
+            ttl=ttl,
+        )
+
+    async def get_token_decimals(self, token_address: str) -> int:
+        """Decimals of an ERC20 token, read once per chain and token."""
+        contract = abi_registry.contract(self.web3, token_address, ERC20_ABI)
+        return await self.cached_call(contract, "decimals")
+
+    @retry_async(attempts=3, delay=5.0, default_value=None)
+    async def get_gas_params(self, policy: Optional[GasPolicy] = None) -> Dict[str, int]:
+        """
+        Get fee parameters for a transaction.
+
+        Fees are shaped by the given policy or the policy of the current task.
+        With ONCHAIN.GAS_ORACLE enabled they come from the chain's shared gas
+        oracle instead of being requested for every transaction.
+        """
+        policy = policy or get_gas_policy(self.task_name)
         try:
-            # Try EIP-1559 first
-            latest_block = await self.web3.eth.get_block("latest")
+            if get_config().ONCHAIN.GAS_ORACLE:
+                oracle = get_gas_oracle(await self.get_chain_id())
+                return await oracle.get_gas_params(
+                    self.RPC_URLS, self.proxy_url, self.ssl, policy
+                )
+
+            # Try EIP-1559 first. Block and priority fee are requested together
+            # so they go out in one batch
+            latest_block, max_priority_fee = await asyncio.gather(
+                self.web3.eth.get_block("latest"),
+                self.web3.eth.max_priority_fee,
+                return_exceptions=True,
+            )
+            if isinstance(latest_block, Exception):
+                raise latest_block
 
             # Check if the network supports EIP-1559
             if "baseFeePerGas" in latest_block:
+                if isinstance(max_priority_fee, Exception):
+                    raise max_priority_fee
                 base_fee = latest_block["baseFeePerGas"]
-                max_priority_fee = await self.web3.eth.max_priority_fee
-                max_fee = base_fee + max_priority_fee
+                max_priority_fee = int(
+                    max_priority_fee * policy.priority_fee_multiplier
+                )
+                max_fee = int(base_fee * policy.base_fee_multiplier) + max_priority_fee
 
                 return {
                     "maxFeePerGas": max_fee,
@@ -133,7 +302,7 @@ class Web3Custom:
             else:
                 # Fallback to legacy gas pricing
                 gas_price = await self.web3.eth.gas_price
-                return {"gasPrice": gas_price}
+                return {"gasPrice": int(gas_price * policy.base_fee_multiplier)}
 
         except Exception as e:
             logger.error(
@@ -141,6 +310,79 @@ class Web3Custom:
             )
             raise
 
+    async def wait_for_receipt(
+        self, tx_hash, timeout: Optional[float] = None
+    ) -> TxReceipt:
+        """
+        Wait for the transaction receipt, raises TimeExhausted after timeout
+        (SETTINGS.WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS by default).
+        If the transaction was sent by send_transaction and replaced because
+        it got stuck, the receipt of the version that was mined is returned.
+        """
+        pending = self._pending.get(HexBytes(tx_hash))
+        if pending is None:
+            return await self.watch_receipt(tx_hash, timeout)
+
+        if timeout is None:
+            timeout = get_config().SETTINGS.WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS
+        try:
+            return await asyncio.wait_for(pending.wait(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(
+                f"Transaction {HexBytes(tx_hash).hex()} is not in the chain after {timeout} seconds"
+            )
+
+    async def watch_receipt(
+        self, tx_hash, timeout: Optional[float] = None
+    ) -> TxReceipt:
+        """
+        Wait for the receipt of exactly this hash, replacements are not followed.
+        With ONCHAIN.BLOCK_WATCHER enabled the chain's shared block watcher
+        resolves it instead of a separate poll loop.
+        """
+        config = get_config()
+        if timeout is None:
+            timeout = config.SETTINGS.WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS
+
+        if config.ONCHAIN.BLOCK_WATCHER:
+            watcher = get_block_watcher(await self.get_chain_id())
+            return await watcher.wait_for_receipt(self.web3, tx_hash, timeout)
+
+        return await self.web3.eth.wait_for_transaction_receipt(
+            tx_hash,
+            timeout=timeout,
+            poll_latency=config.ONCHAIN.BLOCK_WATCHER_POLL_INTERVAL,
+        )
+
+    async def get_nonce(self, address: str, chain_id: Optional[int] = None) -> int:
+        """
+        Reserve the next nonce for the address through the shared nonce manager.
+        A reserved nonce that ends up unused must be given back with reset_nonce.
+        """
+        if chain_id is None:
+            chain_id = await self.get_chain_id()
+        return await nonce_manager.get_nonce(self.web3, address, chain_id)
+
+    async def reset_nonce(self, address: str, chain_id: Optional[int] = None) -> None:
+        """Drop the locally tracked nonce, it is fetched from the node next time."""
+        if chain_id is None:
+            chain_id = await self.get_chain_id()
+        nonce_manager.invalidate(address, chain_id)
+
+    async def reset_allowance(
+        self,
+        wallet_address: str,
+        token_address: str,
+        spender_address: str,
+        chain_id: Optional[int] = None,
+    ) -> None:
+        """Forget the recorded approval, the next approve_token reads it on chain."""
+        if chain_id is None:
+            chain_id = await self.get_chain_id()
+        await allowance_ledger.forget(
+            chain_id, wallet_address, token_address, spender_address
+        )
+
     def convert_to_wei(self, amount: float, decimals: int) -> int:
         """Convert amount to wei based on token decimals."""
         return int(Decimal(str(amount)) * Decimal(str(10**decimals)))
@@ -149,26 +391,49 @@ class Web3Custom:
         """Convert wei amount back to token units."""
         return float(Decimal(str(amount)) / Decimal(str(10**decimals)))
 
-    @retry_async(attempts=1, delay=5.0, backoff=2.0, default_value=None)
-    async def execute_transaction(
+    async def sign_transaction(self, transaction: Dict, private_key) -> bytes:
+        """
+        Sign a transaction, in the signer worker processes if
+        ONCHAIN.SIGNER_PROCESSES is set, otherwise on the event loop.
+
+        Returns:
+            Raw signed transaction for send_raw_transaction
+        """
+        signer_pool = get_signer_pool()
+        if signer_pool is not None:
+            return await signer_pool.sign_transaction(transaction, private_key)
+        return self.web3.eth.account.sign_transaction(
+            transaction, private_key
+        ).raw_transaction
+
+    async def broadcast_transaction(
         self,
         tx_data: Dict,
         wallet: LocalAccount,
         chain_id: int,
-        explorer_url: Optional[str] = None,
-    ) -> str:
+    ) -> PendingTransaction:
         """
-        Execute a transaction and wait for confirmation.
+        Sign and send a transaction without waiting for it to be mined.
 
         Args:
-            tx_data: Transaction data
+            tx_data: Transaction data, including the gas limit
             wallet: Wallet instance (eth_account.LocalAccount)
             chain_id: Chain ID for the transaction
-            explorer_url: Explorer URL for logging (optional)
+
+        Returns:
+            PendingTransaction, its wait() gives the receipt
         """
+        # A nonce passed in tx_data is used as is, otherwise the nonce manager
+        # reserves the next one
+        reserves_nonce = "nonce" not in tx_data
         try:
-            nonce = await self.web3.eth.get_transaction_count(wallet.address)
-            gas_params = await self.get_gas_params()
+            if reserves_nonce:
+                nonce, gas_params = await asyncio.gather(
+                    self.get_nonce(wallet.address, chain_id),
+                    self.get_gas_params(),
+                )
+            else:
+                nonce, gas_params = tx_data["nonce"], await self.get_gas_params()
             if gas_params is None:
                 raise Exception("Failed to get gas parameters")
 
@@ -184,27 +449,50 @@ class Web3Custom:
             if "maxFeePerGas" in gas_params:
                 transaction["type"] = 2
 
-            signed_txn = self.web3.eth.account.sign_transaction(transaction, wallet.key)
-            tx_hash = await self.web3.eth.send_raw_transaction(
-                signed_txn.raw_transaction
-            )
+            raw_transaction = await self.sign_transaction(transaction, wallet.key)
+            tx_hash = await self.web3.eth.send_raw_transaction(raw_transaction)
+        except Exception as e:
+            # The reserved nonce was never used or the node rejected it
+            if reserves_nonce or is_nonce_error(e):
+                nonce_manager.invalidate(wallet.address, chain_id)
+            raise
+
+        onchain_config = get_config().ONCHAIN
+        return PendingTransaction(
+            self,
+            tx_hash,
+            transaction,
+            wallet,
+            chain_id,
+            replace_after=onchain_config.REPLACE_STUCK_AFTER,
+            max_replacements=onchain_config.MAX_REPLACEMENTS,
+            fee_multiplier=onchain_config.REPLACEMENT_FEE_MULTIPLIER,
+        )
+
+    @retry_async(attempts=1, delay=5.0, backoff=2.0, default_value=None)
+    async def execute_transaction(
+        self,
+        tx_data: Dict,
+        wallet: LocalAccount,
+        chain_id: int,
+        explorer_url: Optional[str] = None,
+    ) -> str:
+        """
+        Execute a transaction and wait for confirmation.
+
+        Args:
+            tx_data: Transaction data
+            wallet: Wallet instance (eth_account.LocalAccount)
+            chain_id: Chain ID for the transaction
+            explorer_url: Explorer URL for logging (optional)
+        """
+        try:
+            pending = await self.broadcast_transaction(tx_data, wallet, chain_id)
 
             logger.info(
                 f"{self.account_index} | Waiting for transaction confirmation..."
             )
-            receipt = await self.web3.eth.wait_for_transaction_receipt(
-                tx_hash, timeout=240, poll_latency=2
-            )
-
-            if receipt["status"] == 1:
-                tx_hex = tx_hash.hex()
-                success_msg = f"Transaction successful!"
-                if explorer_url:
-                    success_msg += f" Explorer URL: {explorer_url}{tx_hex}"
-                logger.success(success_msg)
-                return tx_hex
-            else:
-                raise Exception("Transaction failed")
+            return await self.confirm_transaction(pending, explorer_url)
         except Exception as e:
             error_msg = str(e)
             if "tx already in mempool" in error_msg:
@@ -215,6 +503,38 @@ class Web3Custom:
             )
             raise
 
+    async def confirm_transaction(
+        self, pending: PendingTransaction, explorer_url: Optional[str] = None
+    ) -> str:
+        """
+        Wait until a broadcast transaction is mined.
+
+        Returns:
+            Transaction hash, raises if the transaction reverted or was not
+            mined in time
+        """
+        try:
+            receipt = await pending.wait()
+        except TimeExhausted:
+            # The transaction may have been dropped - resync the nonce
+            nonce_manager.invalidate(pending.wallet.address, pending.chain_id)
+            raise
+
+        if receipt["status"] == 1:
+            tx_hex = pending.tx_hash.hex()
+            success_msg = f"Transaction successful!"
+            if explorer_url:
+                success_msg += f" Explorer URL: {explorer_url}{tx_hex}"
+            logger.success(success_msg)
+            return tx_hex
+
+        transaction = pending.transaction
+        if "gas" in transaction and receipt["gasUsed"] >= transaction["gas"]:
+            # Ran out of gas, the limit may come from a stale cached estimate
+            get_gas_estimate_cache().invalidate(pending.chain_id, transaction)
+            raise Exception("Transaction failed: out of gas")
+        raise Exception("Transaction failed")
+
     @retry_async(attempts=3, delay=5.0, backoff=2.0, default_value=None)
     async def approve_token(
         self,
@@ -239,33 +559,16 @@ class Web3Custom:
             explorer_url: Explorer URL for logging (optional)
         """
         try:
-            if token_abi is None:
-                # Use minimal ERC20 ABI if none provided
-                token_abi = [
-                    {
-                        "constant": True,
-                        "inputs": [
-                            {"name": "_owner", "type": "address"},
-                            {"name": "_spender", "type": "address"},
-                        ],
-                        "name": "allowance",
-                        "outputs": [{"name": "", "type": "uint256"}],
-                        "type": "function",
-                    },
-                    {
-                        "constant": False,
-                        "inputs": [
-                            {"name": "_spender", "type": "address"},
-                            {"name": "_value", "type": "uint256"},
-                        ],
-                        "name": "approve",
-                        "outputs": [{"name": "", "type": "bool"}],
-                        "type": "function",
-                    },
-                ]
-
-            token_contract = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(token_address), abi=token_abi
+            use_ledger = get_config().ONCHAIN.ALLOWANCE_LEDGER
+            ledger_key = (chain_id, wallet.address, token_address, spender_address)
+            if use_ledger and await allowance_ledger.covers(*ledger_key, amount):
+                logger.info(
+                    f"{self.account_index} | Allowance for token {token_address} is already approved"
+                )
+                return None
+
+            token_contract = abi_registry.contract(
+                self.web3, token_address, token_abi or ERC20_ABI
             )
 
             current_allowance = await token_contract.functions.allowance(
@@ -276,6 +579,8 @@ class Web3Custom:
                 logger.info(
                     f"{self.account_index} | Allowance sufficient for token {token_address}"
                 )
+                if use_ledger:
+                    await allowance_ledger.record(*ledger_key, current_allowance)
                 return None
 
             gas_params = await self.get_gas_params()
@@ -287,15 +592,18 @@ class Web3Custom:
             ).build_transaction(
                 {
                     "from": wallet.address,
-                    "nonce": await self.web3.eth.get_transaction_count(wallet.address),
                     "chainId": chain_id,
                     **gas_params,
                 }
             )
 
-            return await self.execute_transaction(
+            tx_hash = await self.execute_transaction(
                 approve_tx, wallet=wallet, chain_id=chain_id, explorer_url=explorer_url
             )
+            # Only a confirmed receipt gives a hash back
+            if use_ledger and isinstance(tx_hash, str):
+                await allowance_ledger.record(*ledger_key, amount)
+            return tx_hash
 
         except Exception as e:
             logger.error(
@@ -307,68 +615,178 @@ class Web3Custom:
     async def wait_for_balance_increase(
         self,
         wallet_address: str,
-        initial_balance: float,
+        initial_balance: Union[Balance, Decimal, float],
         token_address: Optional[str] = None,
-        token_abi: Optional[list] = None,
         timeout: int = 60,
-        check_interval: int = 5,
         log_interval: int = 15,
         account_index: Optional[int] = None,
     ) -> bool:
         """
         Wait for balance to increase (works for both native coin and tokens).
 
+        The chain's shared balance watcher checks the balance once per block
+        together with the balances every other account is waiting for.
+
         Args:
             wallet_address: Address to check balance for
-            initial_balance: Initial balance to compare against
+            initial_balance: Balance to compare against, in coins/tokens or as Balance
             token_address: Token address (if waiting for token balance)
-            token_abi: Token ABI (optional, for tokens)
             timeout: Maximum time to wait in seconds
-            check_interval: How often to check balance in seconds
             log_interval: How often to log progress in seconds
             account_index: Optional account index for logging
         """
+        if account_index is None:
+            account_index = self.account_index
+        decimals = (
+            await self.get_token_decimals(token_address) if token_address else 18
+        )
+        baseline = self._baseline_wei(initial_balance, decimals)
 
         logger.info(
-            f"{self.account_index} | Waiting for balance to increase (max wait time: {timeout} seconds)..."
+            f"{account_index} | Waiting for balance to increase (max wait time: {timeout} seconds)..."
+        )
+        watcher = get_balance_watcher(await self.get_chain_id())
+        waiting = asyncio.create_task(
+            watcher.wait_for_increase(
+                self, wallet_address, baseline, token_address, timeout
+            )
         )
+
         start_time = asyncio.get_event_loop().time()
+        try:
+            while not waiting.done():
+                await asyncio.wait({waiting}, timeout=log_interval)
+                if not waiting.done():
+                    elapsed = int(asyncio.get_event_loop().time() - start_time)
+                    logger.info(
+                        f"{account_index} | Still waiting for balance to increase... ({elapsed}/{timeout} seconds)"
+                    )
+        finally:
+            waiting.cancel()
+
+        current_balance = waiting.result()
+        if current_balance is not None:
+            logger.success(
+                f"{account_index} | Balance increased from {self.convert_from_wei(baseline, decimals)} "
+                f"to {self.convert_from_wei(current_balance, decimals)}"
+            )
+            return True
 
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            # Get current balance (either native coin or token)
-            if token_address:
-                current_balance = await self.get_token_balance(
-                    wallet_address, token_address, token_abi
-                )
-            else:
-                current_balance = await self.get_balance(wallet_address)
+        logger.error(
+            f"{account_index} | Balance didn't increase after {timeout} seconds"
+        )
+        return False
 
-            if current_balance > initial_balance:
-                logger.success(
-                    f"{self.account_index} | Balance increased from {initial_balance} to {current_balance}"
-                )
-                return True
+    @staticmethod
+    def _baseline_wei(balance: Union[Balance, Decimal, float], decimals: int) -> int:
+        if isinstance(balance, Balance):
+            return balance.wei
+        if isinstance(balance, Decimal):
+            return int(balance * 10**decimals)
+        # A float stands for every wei amount that rounds to it, only an
+        # amount above all of them is an increase
+        return int(
+            (Decimal(balance) + Decimal(math.ulp(balance)) / 2) * 10**decimals
+        )
 
-            elapsed = int(asyncio.get_event_loop().time() - start_time)
-            if elapsed % log_interval == 0:
-                logger.info(
-                    f"{self.account_index} | Still waiting for balance to increase... ({elapsed}/{timeout} seconds)"
-                )
+    async def wait_for_token_transfer(
+        self,
+        wallet_address: str,
+        token_address: str,
+        from_block: int,
+        timeout: int = 60,
+        symbol: str = "TOKEN",
+        account_index: Optional[int] = None,
+    ) -> Optional[Balance]:
+        """
+        Wait for ERC20 tokens to arrive at the wallet.
 
-            await asyncio.sleep(check_interval)
+        The chain's shared transfer watcher looks for Transfer logs to the
+        wallet from from_block on, in one eth_getLogs per block for every
+        account that is waiting.
 
-        logger.error(
-            f"{self.account_index} | Balance didn't increase after {timeout} seconds"
+        Returns:
+            The amount received, None if nothing arrived within timeout
+        """
+        if account_index is None:
+            account_index = self.account_index
+
+        watcher = get_transfer_watcher(await self.get_chain_id())
+        amount = await watcher.wait_for_transfer(
+            self, token_address, wallet_address, from_block, timeout
         )
-        return False
+        if amount is None:
+            logger.warning(
+                f"{account_index} | No {symbol} transfer to {wallet_address} after {timeout} seconds"
+            )
+            return None
+
+        received = Balance.from_wei(
+            amount, decimals=await self.get_token_decimals(token_address), symbol=symbol
+        )
+        logger.success(f"{account_index} | Received {received.formatted} {symbol}")
+        return received
+
+    async def report_received_tokens(
+        self,
+        tx_hash,
+        token_address: str,
+        wallet_address: str,
+        symbol: str = "TOKEN",
+        account_index: Optional[int] = None,
+    ) -> Optional[Balance]:
+        """
+        Log the tokens the wallet got in a mined transaction (e.g. a mint),
+        read from the Transfer logs of its receipt. Never raises, the
+        transaction itself has already succeeded.
+
+        Returns:
+            The amount received, None if there was no transfer or it could not be read
+        """
+        if account_index is None:
+            account_index = self.account_index
+
+        try:
+            receipt = await self.web3.eth.get_transaction_receipt(HexBytes(tx_hash))
+            amount = received_amount(receipt["logs"], token_address, wallet_address)
+            if not amount:
+                logger.warning(
+                    f"{account_index} | No {symbol} transfer to {wallet_address} in the transaction"
+                )
+                return None
+
+            received = Balance.from_wei(
+                amount,
+                decimals=await self.get_token_decimals(token_address),
+                symbol=symbol,
+            )
+            logger.success(f"{account_index} | Received {received.formatted} {symbol}")
+            return received
+        except Exception as e:
+            logger.warning(f"{account_index} | Failed to read received {symbol}: {e}")
+            return None
 
     @retry_async(attempts=3, delay=10.0, default_value=None)
-    async def estimate_gas(self, transaction: dict) -> int:
-        """Estimate gas for transaction and add some buffer."""
+    async def estimate_gas(self, transaction: dict, cache: bool = False) -> int:
+        """
+        Estimate gas for transaction and add some buffer.
+
+        With cache=True the estimate is shared by all accounts sending the
+        same call or deployment (see ONCHAIN.GAS_ESTIMATE_CACHE). Only for
+        transactions whose gas does not depend on the sender.
+        """
         try:
-            estimated = await self.web3.eth.estimate_gas(transaction)
+            if cache and get_config().ONCHAIN.GAS_ESTIMATE_CACHE:
+                chain_id = transaction.get("chainId") or await self.get_chain_id()
+                estimated = await get_gas_estimate_cache().estimate(
+                    chain_id,
+                    transaction,
+                    lambda: self.web3.eth.estimate_gas(transaction),
+                )
+            else:
+                estimated = await self.web3.eth.estimate_gas(transaction)
             # Добавляем 10% к estimated gas для безопасности
-            return int(estimated * 2.2)
+            return int(estimated * GAS_LIMIT_MULTIPLIER)
         except Exception as e:
             logger.warning(f"{self.account_index} | Error estimating gas: {e}.")
             raise e
@@ -389,6 +807,19 @@ class Web3Custom:
         await instance.connect_web3()
         return instance
 
+    def share(self, account_index: int) -> "Web3Custom":
+        """
+        Instance of another account on this instance's connection. It has
+        its own log prefix and pending transactions, the connection stays
+        owned by this instance and is not closed by the copy.
+        """
+        instance = type(self)(
+            account_index, self.RPC_URLS, self.use_proxy, self.proxy, self.ssl
+        )
+        instance.web3 = self.web3
+        instance._chain_id = self._chain_id
+        return instance
+
     async def cleanup(self):
         try:
             """
@@ -401,6 +832,16 @@ class Web3Custom:
                 )
                 return
 
+            # Pooled clients are shared with other accounts, only drop our reference
+            if provider_pool.is_pooled(self.web3):
+                if self._holds_pool_reference:
+                    self._holds_pool_reference = False
+                    await provider_pool.release(self.web3)
+                    logger.info(
+                        f"{self.account_index} | Web3 client released to the connection pool"
+                    )
+                return
+
             if hasattr(self.web3, "provider"):
                 provider = self.web3.provider
 
@@ -450,6 +891,7 @@ class Web3Custom:
         wallet: LocalAccount,
         value: int = 0,
         chain_id: Optional[int] = None,
+        cache_gas_estimate: bool = False,
     ) -> str:
         """
         Send a transaction with encoded data.
@@ -460,9 +902,11 @@ class Web3Custom:
             wallet: Wallet instance
             value: Amount of native tokens to send
             chain_id: Chain ID (optional)
+            cache_gas_estimate: Share the gas estimate with other accounts,
+                see estimate_gas (optional)
         """
         if chain_id is None:
-            chain_id = await self.web3.eth.chain_id
+            chain_id = await self.get_chain_id()
 
         # Get gas estimate
         tx_params = {
@@ -473,21 +917,14 @@ class Web3Custom:
             "chainId": chain_id,
         }
 
-        try:
-            gas_limit = await self.estimate_gas(tx_params)
-            tx_params["gas"] = gas_limit
-        except Exception as e:
-            raise e
-
-        # Get gas price params
-        gas_params = await self.get_gas_params()
-        tx_params.update(gas_params)
+        tx_params["gas"] = await self.estimate_gas(tx_params, cache=cache_gas_estimate)
 
-        # Get nonce
-        tx_params["nonce"] = await self.web3.eth.get_transaction_count(wallet.address)
+        # Nonce and gas price params are requested together by broadcast_transaction
+        pending = await self.broadcast_transaction(tx_params, wallet, chain_id)
 
-        # Sign and send transaction
-        signed_tx = self.web3.eth.account.sign_transaction(tx_params, wallet.key)
-        tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        # wait_for_receipt follows the transaction if it gets replaced
+        self._pending[pending.tx_hash] = pending
+        original_hash = pending.tx_hash
+        pending.add_done_callback(lambda _: self._pending.pop(original_hash, None))
 
-        return tx_hash.hex()
+        return pending.tx_hash.hex()
@@ -1,9 +1,13 @@
 import random
 from eth_account import Account
 from src.model.onchain.web3_custom import Web3Custom
+from src.model.onchain.chain_clients import chain_clients
+from src.model.onchain.abi_registry import abi_registry
+from src.model.onchain.gas_oracle import get_gas_policy
 from loguru import logger
 import primp
 import asyncio
+from collections import defaultdict
 from src.utils.config import Config
 from web3 import AsyncWeb3
 from eth_account import Account
@@ -41,6 +45,10 @@ class CrustySwap:
         self.private_key = private_key
 
         self.eth_web3 = None
+        # Network -> client taken from the chain client registry, released in close()
+        self._web3s: Dict[str, Web3Custom] = {}
+        # Balance and minimum deposit are read at once, one client is taken per network
+        self._web3_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self.galileo_contract = self.galileo_web3.web3.eth.contract(address=DESTINATION_CONTRACT_ADDRESS, abi=CRUSTY_SWAP_ABI)
 
     async def initialize(self):
@@ -51,19 +59,31 @@ class CrustySwap:
             logger.error(f"{self.account_index} | Error: {e}")
             return False
 
-    async def create_web3(self, network: str) -> AsyncWeb3:
+    async def create_web3(self, network: str) -> Web3Custom:
+        """Client of the network, connected once and reused until close()."""
         try:
-            web3 = await Web3Custom.create(
-                self.account_index,
-                [CRUSTY_SWAP_RPCS[network]],
-                self.config.OTHERS.USE_PROXY_FOR_RPC,
-                self.proxy,
-                self.config.OTHERS.SKIP_SSL_VERIFICATION,
-            )
+            async with self._web3_locks[network]:
+                web3 = self._web3s.get(network)
+                if web3 is None:
+                    web3 = await chain_clients.acquire(
+                        network,
+                        [CRUSTY_SWAP_RPCS[network]],
+                        self.account_index,
+                        self.proxy,
+                        self.config.OTHERS.USE_PROXY_FOR_RPC,
+                        self.config.OTHERS.SKIP_SSL_VERIFICATION,
+                    )
+                    self._web3s[network] = web3
             return web3
         except Exception as e:
             logger.error(f"{self.account_index} | Error: {e}")
             return False
+
+    async def close(self) -> None:
+        """Give the clients of other networks back to the registry."""
+        web3s, self._web3s = list(self._web3s.values()), {}
+        for web3 in web3s:
+            await chain_clients.release(web3)
         
     async def get_galileo_balance(self) -> float:
         """Get native GALILEO balance."""
@@ -85,49 +105,32 @@ class CrustySwap:
 
     async def wait_for_balance_increase(self, initial_balance: float) -> bool:
         """Wait for GALILEO balance to increase after refuel."""
-        # Use the timeout from config
-        timeout = self.config.CRUSTY_SWAP.MAX_WAIT_TIME
-        
-        logger.info(f"[{self.account_index}] Waiting for balance to increase (max wait time: {timeout} seconds)...")
-        start_time = asyncio.get_event_loop().time()
-        
-        # Check balance every 5 seconds until timeout
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            current_balance = await self.get_galileo_balance()
-            if current_balance > initial_balance:
-                logger.success(
-                    f"[{self.account_index}] Balance increased from {initial_balance:.9f} to {current_balance:.9f} GALILEO"
-                )
-                return True
-            
-            # Log progress every 15 seconds
-            elapsed = int(asyncio.get_event_loop().time() - start_time)
-            if elapsed % 15 == 0:
-                logger.info(f"[{self.account_index}] Still waiting for balance to increase... ({elapsed}/{timeout} seconds)")
-            
-            await asyncio.sleep(5)
-        
-        logger.error(f"[{self.account_index}] Balance didn't increase after {timeout} seconds")
-        return False
+        return await self._wait_for_balance_increase(initial_balance, self.wallet.address)
     
     async def get_gas_params(self, web3: AsyncWeb3) -> Dict[str, int]:
         """Get gas parameters for transaction."""
-        latest_block = await web3.web3.eth.get_block('latest')
-        base_fee = latest_block['baseFeePerGas']
-        max_priority_fee = await web3.web3.eth.max_priority_fee
-        max_fee = int((base_fee + max_priority_fee) * 1.5)
-        
+        # The client is shared with other accounts, the policy of this
+        # account's task is passed with the call
+        gas_params = await web3.get_gas_params(
+            get_gas_policy(self.galileo_web3.task_name)
+        )
+        if gas_params is None or "maxFeePerGas" not in gas_params:
+            raise Exception("Failed to get EIP-1559 gas parameters")
+
+        # Bridging networks are busy, keep a 50% margin on the max fee
         return {
-            "maxFeePerGas": max_fee,
-            "maxPriorityFeePerGas": max_priority_fee,
+            "maxFeePerGas": int(gas_params["maxFeePerGas"] * 1.5),
+            "maxPriorityFeePerGas": gas_params["maxPriorityFeePerGas"],
         }
     
     async def get_minimum_deposit(self, network: str) -> int:
         """Get minimum deposit amount for a specific network."""
         try:
             web3 = await self.create_web3(network)
-            contract = web3.web3.eth.contract(address=CONTRACT_ADDRESSES[network], abi=CRUSTY_SWAP_ABI)
-            return await contract.functions.minimumDeposit().call()
+            contract = abi_registry.contract(web3.web3, CONTRACT_ADDRESSES[network], CRUSTY_SWAP_ABI)
+            return await web3.cached_call(
+                contract, "minimumDeposit", ttl=self.config.ONCHAIN.STATIC_CACHE_TTL
+            )
         except Exception as e:
             logger.error(f"[{self.account_index}] Error getting minimum deposit: {str(e)}")
             return 0
@@ -141,18 +144,33 @@ class CrustySwap:
             retry_delay: Delay between retries in seconds (default: 5)
             
         Returns:
-            List of tuples (network, balance) or False if no eligible networks found
+            List of tuples (network, balance), the largest balance over the
+            minimum deposit first, or False if no eligible networks found
         """
         for attempt in range(1, max_retries + 1):
             try:
-                eligible_networks = []
-                
                 networks_to_refuel_from = self.config.CRUSTY_SWAP.NETWORKS_TO_REFUEL_FROM
-                for network in networks_to_refuel_from:
-                    balance = await self.get_native_balance(network)
-                    if balance > await self.get_minimum_deposit(network):
-                        eligible_networks.append((network, balance))
-                return eligible_networks
+                # All networks are checked at once, the minimum deposit
+                # usually comes from the cache shared by all accounts
+                results = await asyncio.gather(
+                    *(
+                        asyncio.gather(
+                            self.get_native_balance(network),
+                            self.get_minimum_deposit(network),
+                        )
+                        for network in networks_to_refuel_from
+                    )
+                )
+
+                candidates = []
+                for network, (balance, minimum_deposit) in zip(networks_to_refuel_from, results):
+                    if balance is None:
+                        raise Exception(f"Failed to get balance on {network}")
+                    if balance > minimum_deposit:
+                        candidates.append((balance - minimum_deposit, network, balance))
+
+                candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+                return [(network, balance) for _, network, balance in candidates]
             except Exception as e:
                 if attempt < max_retries:
                     logger.warning(f"[{self.account_index}] Attempt {attempt}/{max_retries} failed to get eligible networks: {str(e)}")
@@ -202,7 +220,9 @@ class CrustySwap:
             gas_estimate = await web3.web3.eth.estimate_gas({
                 'from': self.wallet.address,
                 'to': CONTRACT_ADDRESSES[network],
-                'value': await contract.functions.minimumDeposit().call(),
+                'value': await web3.cached_call(
+                    contract, "minimumDeposit", ttl=self.config.ONCHAIN.STATIC_CACHE_TTL
+                ),
                 'data': contract.functions.deposit(
                         ZERO_ADDRESS,
                         self.wallet.address,
@@ -238,13 +258,14 @@ class CrustySwap:
                 
                 amount_wei = int(round(web3.web3.to_wei(amount_ether, 'ether'), random.randint(8, 12)))
                 
-            # Get nonce
-            nonce = await web3.web3.eth.get_transaction_count(self.wallet.address)
-            
             has_enough_galileo = await self.check_available_galileo(amount_wei, contract)
             if not has_enough_galileo:
                 logger.error(f"[{self.account_index}] Not enough GALILEO in the contract for your amount of ETH deposit, try again later")
                 return False
+
+            # Get nonce (reserved right before signing so it is not wasted on early returns)
+            chain_id = await web3.get_chain_id()
+            nonce = await web3.get_nonce(self.wallet.address, chain_id)
                 
             tx = {
                 'from': self.wallet.address,
@@ -257,16 +278,21 @@ class CrustySwap:
                     )._encode_transaction_data(),
                 'nonce': nonce,
                 'gas': int(gas_estimate * 1.1),  # Add 10% buffer to gas estimate
-                'chainId': await web3.web3.eth.chain_id,
+                'chainId': chain_id,
                 **gas_params  # Use the same gas params that we calculated during get_balances
             }
             
             # Sign and send transaction
-            signed_tx = web3.web3.eth.account.sign_transaction(tx, self.private_key)
-            tx_hash = await web3.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            try:
+                raw_transaction = await web3.sign_transaction(tx, self.private_key)
+                tx_hash = await web3.web3.eth.send_raw_transaction(raw_transaction)
+            except Exception:
+                # The reserved nonce was not used
+                await web3.reset_nonce(self.wallet.address, chain_id)
+                raise
             
             logger.info(f"[{self.account_index}] Waiting for refuel transaction confirmation...")
-            receipt = await web3.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await web3.wait_for_receipt(tx_hash, timeout=120)
             
             explorer_url = f"{EXPLORER_URLS[network]}{tx_hash.hex()}"
             
@@ -291,6 +317,8 @@ class CrustySwap:
         except Exception as e:
             logger.error(f"[{self.account_index}] Refuel failed: {str(e)}")
             return False
+        finally:
+            await self.close()
 
     def _convert_private_keys_to_addresses(self, private_keys_to_distribute):
         """Convert private keys to addresses."""
@@ -380,30 +408,13 @@ class CrustySwap:
             
     async def _wait_for_balance_increase(self, initial_balance: float, address: str) -> bool:
         """Wait for GALILEO balance to increase after refuel."""
-        # Use the timeout from config
-        timeout = self.config.CRUSTY_SWAP.MAX_WAIT_TIME
-        
-        logger.info(f"[{self.account_index}] Waiting for balance to increase (max wait time: {timeout} seconds)...")
-        start_time = asyncio.get_event_loop().time()
-        
-        # Check balance every 5 seconds until timeout
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            current_balance = await self._get_galileo_balance(address)
-            if current_balance > initial_balance:
-                logger.success(
-                    f"[{self.account_index}] Balance increased from {initial_balance} to {current_balance} GALILEO"
-                )
-                return True
-            
-            # Log progress every 15 seconds
-            elapsed = int(asyncio.get_event_loop().time() - start_time)
-            if elapsed % 15 == 0:
-                logger.info(f"[{self.account_index}] Still waiting for balance to increase... ({elapsed}/{timeout} seconds)")
-            
-            await asyncio.sleep(5)
-        
-        logger.error(f"[{self.account_index}] Balance didn't increase after {timeout} seconds")
-        return False
+        # Checked once per block together with every other account waiting on Galileo
+        return await self.galileo_web3.wait_for_balance_increase(
+            address,
+            initial_balance,
+            timeout=self.config.CRUSTY_SWAP.MAX_WAIT_TIME,
+            account_index=self.account_index,
+        )
         
     async def _handle_transaction_status(self, receipt, explorer_url, initial_balance, network, address) -> bool:
         if receipt['status'] == 1:
@@ -454,7 +465,9 @@ class CrustySwap:
             gas_estimate = await web3.web3.eth.estimate_gas({
                 'from': self.wallet.address,
                 'to': CONTRACT_ADDRESSES[network],
-                'value': await contract.functions.minimumDeposit().call(),
+                'value': await web3.cached_call(
+                    contract, "minimumDeposit", ttl=self.config.ONCHAIN.STATIC_CACHE_TTL
+                ),
                 'data': contract.functions.deposit(
                         ZERO_ADDRESS,
                         address,
@@ -490,12 +503,14 @@ class CrustySwap:
                 
                 amount_wei = int(round(web3.web3.to_wei(amount_ether, 'ether'), random.randint(8, 12)))
                 
-            # Get nonce
-            nonce = await web3.web3.eth.get_transaction_count(self.wallet.address)
             has_enough_galileo = await self.check_available_galileo(amount_wei, contract)
             if not has_enough_galileo:
                 logger.error(f"[{self.account_index}] Not enough GALILEO in the contract for your amount of ETH deposit, try again later")
                 return False
+
+            # Get nonce (reserved right before signing so it is not wasted on early returns)
+            chain_id = await web3.get_chain_id()
+            nonce = await web3.get_nonce(self.wallet.address, chain_id)
                 
             tx = {
                 'from': self.wallet.address,
@@ -508,16 +523,21 @@ class CrustySwap:
                     )._encode_transaction_data(),
                 'nonce': nonce,
                 'gas': int(gas_estimate * 1.1),  # Add 10% buffer to gas estimate
-                'chainId': await web3.web3.eth.chain_id,
+                'chainId': chain_id,
                 **gas_params  # Use the same gas params that we calculated during get_balances
             }
             
             # Sign and send transaction
-            signed_tx = web3.web3.eth.account.sign_transaction(tx, self.private_key)
-            tx_hash = await web3.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            try:
+                raw_transaction = await web3.sign_transaction(tx, self.private_key)
+                tx_hash = await web3.web3.eth.send_raw_transaction(raw_transaction)
+            except Exception:
+                # The reserved nonce was not used
+                await web3.reset_nonce(self.wallet.address, chain_id)
+                raise
             
             logger.info(f"[{self.account_index}] Waiting for refuel transaction confirmation...")
-            receipt = await web3.web3.eth.wait_for_transaction_receipt(tx_hash)
+            receipt = await web3.wait_for_receipt(tx_hash, timeout=120)
             
             explorer_url = f"{EXPLORER_URLS[network]}{tx_hash.hex()}"
             return await self._handle_transaction_status(receipt, explorer_url, initial_balance, network, address)
@@ -542,4 +562,6 @@ class CrustySwap:
             return True
         except Exception as e:
             logger.error(f"[{self.account_index}] Refuel failed: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+        finally:
+            await self.close()
\ No newline at end of file
@@ -37,61 +37,28 @@ async def memebridge_deploy(
 
         logger.info(f"{account_index} | Starting deployment of memebridge contract...")
 
-        # Получаем текущие газовые параметры и увеличиваем их в 1.5 раза
-        gas_price = await web3.web3.eth.gas_price
-        gas_price = int(gas_price * 1.5)
+        # Текущие газовые параметры из общего газового оракула
+        gas_params = await web3.get_gas_params()
+        if gas_params is None:
+            raise Exception("Failed to get gas parameters")
 
         # Определяем, поддерживает ли сеть EIP-1559
-        supports_eip1559 = False
-        try:
-            block = await web3.web3.eth.get_block("latest")
-            supports_eip1559 = "baseFeePerGas" in block
-        except Exception:
-            supports_eip1559 = False
+        supports_eip1559 = "maxFeePerGas" in gas_params
 
         # Подготавливаем транзакцию с соответствующими параметрами газа
+        tx_params = {
+            "from": wallet.address,
+            "value": web3.web3.to_wei(0.1 if supports_eip1559 else 0.00005, "ether"),
+            "data": PAYLOAD,
+            "chainId": CHAIN_ID,
+            **gas_params,
+        }
         if supports_eip1559:
-            try:
-                base_fee = block.get("baseFeePerGas", 0)
-                max_priority_fee = await web3.web3.eth.max_priority_fee
-                max_priority_fee = int(max_priority_fee * 1.5)
-                max_fee_per_gas = int(base_fee * 2 * 1.5) + max_priority_fee
-
-                tx_params = {
-                    "from": wallet.address,
-                    "value": web3.web3.to_wei(0.1, "ether"),
-                    "data": PAYLOAD,
-                    "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
-                    "chainId": CHAIN_ID,
-                    "maxFeePerGas": max_fee_per_gas,
-                    "maxPriorityFeePerGas": max_priority_fee,
-                    "type": 2,
-                }
-                logger.info(
-                    f"{account_index} | Using EIP-1559 gas parameters: maxFeePerGas={max_fee_per_gas}, maxPriorityFeePerGas={max_priority_fee}"
-                )
-            except Exception as e:
-                logger.warning(
-                    f"{account_index} | Error setting EIP-1559 parameters: {e}, falling back to legacy"
-                )
-                supports_eip1559 = False
-
-        if not supports_eip1559:
-            tx_params = {
-                "from": wallet.address,
-                "value": web3.web3.to_wei(0.00005, "ether"),
-                "data": PAYLOAD,
-                "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
-                "chainId": CHAIN_ID,
-                "gasPrice": gas_price,
-            }
-            logger.info(
-                f"{account_index} | Using legacy gas parameters: gasPrice={gas_price}"
-            )
+            tx_params["type"] = 2
 
         # Оцениваем газ динамически
         try:
-            estimated_gas = await web3.estimate_gas(tx_params)
+            estimated_gas = await web3.estimate_gas(tx_params, cache=True)
             tx_params["gas"] = int(estimated_gas * 1.5)  # Увеличиваем газ в 1.5 раза
 
         except Exception as e:
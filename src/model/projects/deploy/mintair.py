@@ -48,7 +48,6 @@ async def mintair_deploy(
             "from": wallet.address,
             "value": 0,
             "data": PAYLOAD_TIMER_CONTRACT,
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -59,7 +58,7 @@ async def mintair_deploy(
 
         # Оцениваем газ динамически
         try:
-            estimated_gas = await web3.estimate_gas(tx_params)
+            estimated_gas = await web3.estimate_gas(tx_params, cache=True)
             tx_params["gas"] = estimated_gas
 
         except Exception as e:
@@ -125,15 +125,18 @@ async def mint_nft(
             abi=CONFT_NFT_ABI,
         )
 
-        # Check if user already has NFT
-        balance = await nft_contract.functions.balanceOf(wallet.address).call()
+        # Check if user already has NFT and get mint price in one multicall
+        balance, mint_price = await web3.multicall(
+            [
+                (nft_contract, "balanceOf", (wallet.address,)),
+                (nft_contract, "mintPrice", ()),
+            ],
+            allow_failure=False,
+        )
         if balance > 0:
             logger.success(f"{account_index} | Already have Conft.app NFT in wallet")
             return True
 
-        # Get mint price
-        mint_price = await nft_contract.functions.mintPrice().call()
-
         # Check if wallet has enough balance
         wallet_balance = await web3.get_balance(wallet.address)
         if wallet_balance.wei < mint_price:
@@ -149,7 +152,6 @@ async def mint_nft(
         tx_params = {
             "from": wallet.address,
             "value": mint_price,
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CONFT_CHAIN_ID,
             **gas_params,
         }
@@ -266,7 +268,6 @@ async def mint_domain(
             "from": wallet.address,
             "to": web3.web3.to_checksum_address(DOMAIN_CONTRACT_ADDRESS),
             "value": "0xd529ae9e860000",  # 0.06 0g
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CONFT_CHAIN_ID,
             "data": data,
             **gas_params,
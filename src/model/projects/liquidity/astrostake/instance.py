@@ -81,7 +81,6 @@ async def astrostake_staking(
             "to": web3.web3.to_checksum_address(selected_contract),
             "value": stake_amount_wei,
             "data": data,
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CHAIN_ID,
             **gas_params,
         }
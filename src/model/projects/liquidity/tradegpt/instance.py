@@ -3,6 +3,7 @@ import random
 
 from eth_account import Account
 from src.model.onchain.web3_custom import Web3Custom
+from src.model.onchain.constants import ERC20_ABI
 from loguru import logger
 import primp
 
@@ -60,36 +61,6 @@ STAKING_ABI = [
     }
 ]
 
-ERC20_ABI = [
-    {
-        "constant": True,
-        "inputs": [{"name": "_owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "balance", "type": "uint256"}],
-        "type": "function",
-    },
-    {
-        "constant": False,
-        "inputs": [
-            {"name": "_spender", "type": "address"},
-            {"name": "_value", "type": "uint256"},
-        ],
-        "name": "approve",
-        "outputs": [{"name": "", "type": "bool"}],
-        "type": "function",
-    },
-    {
-        "constant": True,
-        "inputs": [
-            {"name": "_owner", "type": "address"},
-            {"name": "_spender", "type": "address"},
-        ],
-        "name": "allowance",
-        "outputs": [{"name": "", "type": "uint256"}],
-        "type": "function",
-    },
-]
-
 
 @retry_async(default_value=False)
 async def tradegpt_faucet(
@@ -128,9 +99,6 @@ async def tradegpt_faucet(
         tx_params = {
             "from": wallet.address,
             "value": 0,
-            "nonce": await web3.web3.eth.get_transaction_count(
-                wallet.address, "pending"
-            ),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -262,9 +230,6 @@ async def tradegpt_staking(
         tx_params = {
             "from": wallet.address,
             "value": 0,
-            "nonce": await web3.web3.eth.get_transaction_count(
-                wallet.address, "pending"
-            ),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -105,7 +105,6 @@ async def mintaura_panda(
             "to": web3.web3.to_checksum_address(PANDA_0G_CONTRACT),
             "value": 0,  # Минт бесплатный
             "data": data,
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -116,7 +115,7 @@ async def mintaura_panda(
 
         # Оцениваем газ динамически
         try:
-            estimated_gas = await web3.estimate_gas(tx_params)
+            estimated_gas = await web3.estimate_gas(tx_params, cache=True)
             tx_params["gas"] = estimated_gas
 
         except Exception as e:
@@ -221,7 +220,6 @@ async def mintaura_pandriel(
             "to": web3.web3.to_checksum_address(PANDRIEL_0G_CONTRACT),
             "value": 0,  # Минт бесплатный
             "data": data,
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -232,7 +230,7 @@ async def mintaura_pandriel(
 
         # Оцениваем газ динамически
         try:
-            estimated_gas = await web3.estimate_gas(tx_params)
+            estimated_gas = await web3.estimate_gas(tx_params, cache=True)
             tx_params["gas"] = estimated_gas
 
         except Exception as e:
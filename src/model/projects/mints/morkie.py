@@ -7,6 +7,8 @@ import os
 from eth_account import Account
 from src.model.help.captcha import NoCaptcha
 from src.model.onchain.web3_custom import Web3Custom
+from src.model.onchain.constants import ERC721_ABI
+from src.model.onchain.abi_registry import abi_registry
 from loguru import logger
 import primp
 
@@ -16,17 +18,6 @@ from src.utils.constants import EXPLORER_URL_0G
 
 CHAIN_ID = 16601
 
-# Минимальный ABI для проверки баланса NFT
-NFT_ABI = [
-    {
-        "constant": True,
-        "inputs": [{"name": "owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "", "type": "uint256"}],
-        "type": "function",
-    }
-]
-
 
 @retry_async(default_value=False)
 async def morkie_og_mint(
@@ -42,8 +33,8 @@ async def morkie_og_mint(
         logger.info(f"{account_index} | Checking balance of Morkie 0G NFT...")
 
         # Проверяем баланс NFT на кошельке
-        nft_contract = web3.web3.eth.contract(
-            address=web3.web3.to_checksum_address(MORKIE_0GOG_CONTRACT), abi=NFT_ABI
+        nft_contract = abi_registry.contract(
+            web3.web3, MORKIE_0GOG_CONTRACT, ERC721_ABI
         )
 
         nft_balance = await nft_contract.functions.balanceOf(wallet.address).call()
@@ -74,7 +65,6 @@ async def morkie_og_mint(
             "to": web3.web3.to_checksum_address(MORKIE_0GOG_CONTRACT),
             "value": 0,  # 0 A0GI
             "data": data,
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -85,7 +75,7 @@ async def morkie_og_mint(
 
         # Оцениваем газ динамически
         try:
-            estimated_gas = await web3.estimate_gas(tx_params)
+            estimated_gas = await web3.estimate_gas(tx_params, cache=True)
             tx_params["gas"] = estimated_gas
 
         except Exception as e:
@@ -108,7 +108,6 @@ async def mint_nerzo_0gog(
             "to": web3.web3.to_checksum_address(NERZO_0GOG_CONTRACT),
             "value": mint_price,  # 0.005 A0GI
             "data": data,
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -120,7 +119,7 @@ async def mint_nerzo_0gog(
 
         # Оцениваем газ динамически
         try:
-            estimated_gas = await web3.estimate_gas(tx_params)
+            estimated_gas = await web3.estimate_gas(tx_params, cache=True)
             tx_params["gas"] = estimated_gas
 
         except Exception as e:
@@ -7,6 +7,8 @@ import os
 from eth_account import Account
 from src.model.help.captcha import NoCaptcha
 from src.model.onchain.web3_custom import Web3Custom
+from src.model.onchain.constants import ERC721_ABI
+from src.model.onchain.abi_registry import abi_registry
 from loguru import logger
 import primp
 
@@ -16,17 +18,6 @@ from src.utils.constants import EXPLORER_URL_0G
 
 CHAIN_ID = 16601
 
-# ERC721 ABI for NFT balance check
-ERC721_ABI = [
-    {
-        "constant": True,
-        "inputs": [{"name": "_owner", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"name": "", "type": "uint256"}],
-        "type": "function",
-    }
-]
-
 
 class OmniHub:
     def __init__(
@@ -86,9 +77,8 @@ class OmniHub:
     async def _check_nft_balance(self, contract_address: str) -> int:
         """Check the NFT balance for the current wallet from the given contract."""
         try:
-            nft_contract = self.web3.web3.eth.contract(
-                address=self.web3.web3.to_checksum_address(contract_address),
-                abi=ERC721_ABI,
+            nft_contract = abi_registry.contract(
+                self.web3.web3, contract_address, ERC721_ABI
             )
 
             balance = await nft_contract.functions.balanceOf(self.wallet.address).call()
@@ -123,9 +113,7 @@ class OmniHub:
             logger.info(
                 f"{self.account_index} | Waiting for transaction confirmation..."
             )
-            receipt = await self.web3.web3.eth.wait_for_transaction_receipt(
-                tx_hash, timeout=120
-            )
+            receipt = await self.web3.wait_for_receipt(tx_hash, timeout=120)
 
             if receipt["status"] == 1:
                 logger.success(
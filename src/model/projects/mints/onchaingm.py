@@ -53,7 +53,6 @@ async def onchaingm_gm(
             "to": web3.web3.to_checksum_address(ONCHAINGM_CONTRACT),
             "value": mint_price,  # 0.00029 A0GI
             "data": data,
-            "nonce": await web3.web3.eth.get_transaction_count(wallet.address),
             "chainId": CHAIN_ID,
             **gas_params,
         }
@@ -65,7 +64,7 @@ async def onchaingm_gm(
 
         # Оцениваем газ динамически
         try:
-            estimated_gas = await web3.estimate_gas(tx_params)
+            estimated_gas = await web3.estimate_gas(tx_params, cache=True)
             tx_params["gas"] = estimated_gas
 
         except Exception as e:
@@ -1,3 +1,5 @@
+from src.model.onchain.abi_registry import abi_registry
+
 TOKENS = {
     "USDT": {"address": "0x3eC8A8705bE1D5ca90066b37ba62c4183B024ebf", "decimals": 18},
     "BTC": {"address": "0x36f6414FF1df609214dDAbA71c84f18bcf00F67d", "decimals": 18},
@@ -13,37 +15,6 @@ MAX_UINT256 = (
     2**256
 ) - 1  # ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff
 
-# ERC20 ABI для апрувов
-ERC_20_ABI = [
-    {
-        "inputs": [
-            {"internalType": "address", "name": "spender", "type": "address"},
-            {"internalType": "uint256", "name": "amount", "type": "uint256"},
-        ],
-        "name": "approve",
-        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "address", "name": "", "type": "address"},
-            {"internalType": "address", "name": "", "type": "address"},
-        ],
-        "name": "allowance",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-    {
-        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
-        "name": "balanceOf",
-        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
-
 # Router ABI для свапов
 ROUTER_ABI = [
     {
@@ -80,3 +51,6 @@ ROUTER_ABI = [
         "type": "function",
     }
 ]
+
+# exactInputSingle кодируется без создания контракта, селектор считается один раз
+EXACT_INPUT_SINGLE = abi_registry.function(ROUTER_ABI, "exactInputSingle")
@@ -7,17 +7,15 @@ from loguru import logger
 from src.utils.decorators import retry_async
 from src.utils.config import Config
 from src.model.onchain.web3_custom import Web3Custom
+from src.model.onchain.allowance_ledger import is_allowance_error
 from eth_account import Account
 import primp
-from web3 import Web3 as SyncWeb3
-from eth_abi import abi
 
 from src.utils.constants import EXPLORER_URL_0G
 from src.model.projects.swaps.zero_exchange.constants import (
     TOKENS,
-    ERC_20_ABI,
     ROUTER_ADDRESS,
-    ROUTER_ABI,
+    EXACT_INPUT_SINGLE,
     MAX_UINT256,
 )
 
@@ -37,16 +35,13 @@ async def zero_exchange_swaps(
         if native_balance.wei == 0:
             raise Exception("Native token balance is 0")
 
-        # Получаем балансы всех трех токенов
+        # Получаем балансы всех трех токенов одним multicall
+        balances = await web3.get_token_balances(wallet.address, TOKENS)
+        if balances is None:
+            raise Exception("Failed to get token balances")
+
         token_balances = {}
-        for symbol, token_data in TOKENS.items():
-            balance = await web3.get_token_balance(
-                wallet_address=wallet.address,
-                token_address=token_data["address"],
-                token_abi=ERC_20_ABI,
-                decimals=token_data["decimals"],
-                symbol=symbol,
-            )
+        for symbol, balance in balances.items():
             token_balances[symbol] = balance.wei
             logger.info(
                 f"{account_index} | {symbol} Balance: {balance.wei / 10**18:.4f}"
@@ -126,7 +121,6 @@ async def zero_exchange_swaps(
             new_balance = await web3.get_token_balance(
                 wallet_address=wallet.address,
                 token_address=token_out_address,
-                token_abi=ERC_20_ABI,
                 decimals=TOKENS[token_out_symbol]["decimals"],
                 symbol=token_out_symbol,
             )
@@ -197,20 +191,8 @@ async def swap_tokens(
         if balance.wei == 0:
             raise Exception("Native token balance is 0")
 
-        # Апрув токена
         router_address = ROUTER_ADDRESS
-        chain_id = await web3.web3.eth.chain_id
-
-        # Используем максимальное значение uint256 для неограниченного апрува
-        await web3.approve_token(
-            token_address=token_in_address,
-            spender_address=router_address,
-            amount=MAX_UINT256,  # Unlimited approval
-            wallet=wallet,
-            chain_id=chain_id,
-            token_abi=ERC_20_ABI,
-            explorer_url=EXPLORER_URL_0G,
-        )
+        chain_id = await web3.get_chain_id()
 
         # Параметры свапа
         swap_params = {
@@ -225,21 +207,8 @@ async def swap_tokens(
         }
 
         # Кодируем функцию и параметры
-        function_signature = "exactInputSingle((address,address,uint24,address,uint256,uint256,uint256,uint160))"
-        function_selector = SyncWeb3.keccak(text=function_signature)[:4]
-
-        encoded_params = abi.encode(
-            [
-                "address",
-                "address",
-                "uint24",
-                "address",
-                "uint256",
-                "uint256",
-                "uint256",
-                "uint160",
-            ],
-            [
+        encoded_data = EXACT_INPUT_SINGLE.encode(
+            (
                 swap_params["tokenIn"],
                 swap_params["tokenOut"],
                 swap_params["fee"],
@@ -248,12 +217,21 @@ async def swap_tokens(
                 swap_params["amountIn"],
                 swap_params["amountOutMinimum"],
                 swap_params["sqrtPriceLimitX96"],
-            ],
+            )
         )
 
-        encoded_data = function_selector + encoded_params
+        # Используем максимальное значение uint256 для неограниченного апрува
+        await web3.approve_token(
+            token_address=token_in_address,
+            spender_address=router_address,
+            amount=MAX_UINT256,  # Unlimited approval
+            wallet=wallet,
+            chain_id=chain_id,
+            explorer_url=EXPLORER_URL_0G,
+        )
 
-        # Отправляем транзакцию свапа
+        # Газ свапа зависит от кошелька и пары, оцениваем каждый раз:
+        # eth_estimateGas заодно не даёт отправить свап, который ревертнется
         tx_hash = await web3.send_transaction(
             to=router_address,
             data=encoded_data,
@@ -264,7 +242,7 @@ async def swap_tokens(
         logger.info(
             f"{account_index} | Swap transaction sent, waiting for confirmation (timeout: {config.SETTINGS.WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS}s)..."
         )
-        receipt = await web3.web3.eth.wait_for_transaction_receipt(
+        receipt = await web3.wait_for_receipt(
             tx_hash,
             timeout=config.SETTINGS.WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS,
         )
@@ -275,9 +253,13 @@ async def swap_tokens(
             )
             return tx_hash
         else:
+            # Апрув мог быть отозван - при следующей попытке проверяем его в сети
+            await web3.reset_allowance(wallet.address, token_in_address, ROUTER_ADDRESS)
             raise Exception("Swap transaction failed")
 
     except Exception as e:
+        if is_allowance_error(e):
+            await web3.reset_allowance(wallet.address, token_in_address, ROUTER_ADDRESS)
         random_pause = random.randint(
             config.SETTINGS.PAUSE_BETWEEN_ATTEMPTS[0],
             config.SETTINGS.PAUSE_BETWEEN_ATTEMPTS[1],
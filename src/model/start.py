@@ -23,6 +23,7 @@ from src.model.ZeroG import faucets, faucet_tokens, deploy_storage_scan, swaps
 from src.model.onchain.web3_custom import Web3Custom
 from src.utils.client import create_client
 from src.utils.config import Config
+from src.utils.flow_scheduler import get_flow_scheduler
 from src.model.database.db_manager import Database
 from src.utils.telegram_logger import send_telegram_message
 from src.utils.reader import read_private_keys
@@ -35,12 +36,16 @@ class Start:
         private_key: str,
         config: Config,
         twitter_token: str,
+        task_store=None,
     ):
         self.account_index = account_index
         self.proxy = proxy
         self.private_key = private_key
         self.config = config
         self.twitter_token = twitter_token
+        # Pending tasks and their completion, the database unless leased
+        # from a coordinator
+        self.task_store = task_store
 
         self.session: primp.AsyncClient | None = None
         self.zerog_web3: Web3Custom | None = None
@@ -67,6 +72,7 @@ class Start:
             return False
 
     async def flow(self):
+        cancelled = False
         try:
             try:
                 wallet_stats = WalletStats(self.config, self.zerog_web3)
@@ -76,7 +82,7 @@ class Start:
             except Exception as e:
                 pass
 
-            db = Database()
+            db = self.task_store or Database()
             try:
                 tasks = await db.get_wallet_pending_tasks(self.private_key)
             except Exception as e:
@@ -112,7 +118,7 @@ class Start:
                 self.config.SETTINGS.RANDOM_INITIALIZATION_PAUSE[1],
             )
             logger.info(f"[{self.account_index}] Sleeping for {pause} seconds before start...")
-            await asyncio.sleep(pause)
+            await get_flow_scheduler().pause(pause)
 
             task_plan_msg = [f"{i+1}. {task['name']}" for i, task in enumerate(tasks)]
             logger.info(
@@ -183,6 +189,10 @@ class Start:
 
             return len(failed_tasks) == 0
 
+        except asyncio.CancelledError:
+            # E.g. the lease of a distributed worker was lost
+            cancelled = True
+            raise
         except Exception as e:
             logger.error(f"{self.account_index} | Error: {e}")
 
@@ -205,17 +215,27 @@ class Start:
             except Exception as e:
                 logger.error(f"{self.account_index} | Error during cleanup: {e}")
 
-            pause = random.randint(
-                self.config.SETTINGS.RANDOM_PAUSE_BETWEEN_ACCOUNTS[0],
-                self.config.SETTINGS.RANDOM_PAUSE_BETWEEN_ACCOUNTS[1],
-            )
-            logger.info(f"[{self.account_index}] Sleeping for {pause} seconds before next account...")
-            await asyncio.sleep(pause)
+            if not cancelled:
+                pause = random.randint(
+                    self.config.SETTINGS.RANDOM_PAUSE_BETWEEN_ACCOUNTS[0],
+                    self.config.SETTINGS.RANDOM_PAUSE_BETWEEN_ACCOUNTS[1],
+                )
+                logger.info(f"[{self.account_index}] Sleeping for {pause} seconds before next account...")
+                # The account is done, its thread can go to the next one right away
+                await get_flow_scheduler().pause(pause, resume=False)
             
     async def execute_task(self, task):
+        """Execute a single task within its FLOW.TASK_CONCURRENCY limit"""
+        async with get_flow_scheduler().task_slot(task):
+            return await self._execute_task(task)
+
+    async def _execute_task(self, task):
         try:
             """Execute a single task"""
             task = task.lower()
+            # Lets the gas oracle apply this module's gas policy
+            if self.zerog_web3:
+                self.zerog_web3.task_name = task
 
             if task == "skip":
                 return True
@@ -444,4 +464,4 @@ class Start:
         logger.info(
             f"{self.account_index} | Sleeping {pause} seconds after {task_name}"
         )
-        await asyncio.sleep(pause)
+        await get_flow_scheduler().pause(pause)
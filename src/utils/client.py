@@ -1,11 +1,52 @@
 import primp
 from noble_tls import Session, Client
 
+from src.utils.config import get_config
+from src.utils.rate_limiter import (
+    RATE_LIMITED_ATTEMPTS,
+    get_rate_limiter,
+    parse_retry_after,
+)
+
+
+class RateLimitedClient(primp.AsyncClient):
+    """
+    primp.AsyncClient that waits for the target host's rate limiter, shared
+    by all accounts, and waits out 429 responses. Only with
+    OTHERS.HTTP_REQUESTS_PER_SECOND set, by default requests go out as before.
+    """
+
+    async def request(self, method, url: str, **kwargs):
+        config = get_config().OTHERS
+        rate_limiter = get_rate_limiter(
+            url, config.HTTP_REQUESTS_PER_SECOND, config.REQUESTS_BURST
+        )
+        if rate_limiter is None:
+            return await super().request(method, url, **kwargs)
+
+        for _ in range(RATE_LIMITED_ATTEMPTS):
+            await rate_limiter.acquire()
+            response = await super().request(method, url, **kwargs)
+            if response.status_code != 429:
+                rate_limiter.record_success()
+                return response
+
+            retry_after = next(
+                (
+                    value
+                    for name, value in response.headers.items()
+                    if name.lower() == "retry-after"
+                ),
+                None,
+            )
+            rate_limiter.record_rate_limited(parse_retry_after(retry_after))
+        return response
+
 
 async def create_client(
     proxy: str, skip_ssl_verification: bool = True, chrome_version: int = 131
 ) -> primp.AsyncClient:
-    session = primp.AsyncClient(
+    session = RateLimitedClient(
         impersonate=f"chrome_{chrome_version}", verify=skip_ssl_verification
     )
 
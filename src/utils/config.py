@@ -21,6 +21,8 @@ class SettingsConfig:
     SEND_TELEGRAM_LOGS: bool
     SHUFFLE_WALLETS: bool
     WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS: int
+    MAX_PAUSED_ACCOUNTS: int = 0
+    PROCESSES: int = 1
 
 
 @dataclass
@@ -36,6 +38,7 @@ class StakingConfig:
 class FlowConfig:
     TASKS: List
     SKIP_FAILED_TASKS: bool
+    TASK_CONCURRENCY: Dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -73,6 +76,55 @@ class PuzzlemaniaConfig:
 class OthersConfig:
     SKIP_SSL_VERIFICATION: bool
     USE_PROXY_FOR_RPC: bool
+    RPC_REQUESTS_PER_SECOND: float = 0
+    HTTP_REQUESTS_PER_SECOND: float = 0
+    REQUESTS_BURST: int = 10
+
+
+@dataclass
+class OnchainConfig:
+    BATCH_RPC_REQUESTS: bool = True
+    BATCH_WINDOW_MS: int = 15
+    BATCH_MAX_SIZE: int = 20
+    SHARE_RPC_CONNECTIONS: bool = True
+    POOL_CONNECTIONS_PER_HOST: int = 50
+    POOL_KEEPALIVE_SECONDS: int = 30
+    POOL_IDLE_TIMEOUT: int = 120
+    LOAD_BALANCE_RPCS: bool = True
+    RPC_EJECT_AFTER_ERRORS: int = 3
+    RPC_HEALTH_CHECK_INTERVAL: int = 10
+    HEDGE_READ_REQUESTS: bool = False
+    HEDGE_PERCENTILE: int = 95
+    HEDGE_MIN_DELAY_MS: int = 100
+    GAS_ORACLE: bool = True
+    GAS_ORACLE_REFRESH_INTERVAL: float = 2
+    GAS_PRIORITY_PERCENTILE: float = 0
+    GAS_BASE_FEE_MULTIPLIER: float = 1.0
+    GAS_PRIORITY_FEE_MULTIPLIER: float = 1.0
+    GAS_POLICIES: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    BLOCK_WATCHER: bool = True
+    BLOCK_WATCHER_POLL_INTERVAL: float = 2
+    MULTICALL_ADDRESS: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
+    ALLOWANCE_LEDGER: bool = True
+    GAS_ESTIMATE_CACHE: bool = True
+    GAS_ESTIMATE_CACHE_TTL: float = 600
+    REPLACE_STUCK_AFTER: float = 0
+    REPLACEMENT_FEE_MULTIPLIER: float = 1.2
+    MAX_REPLACEMENTS: int = 5
+    SIGNER_PROCESSES: int = 0
+    STATIC_CACHE_FILE: str = "data/rpc_cache.json"
+    STATIC_CACHE_TTL: float = 3600
+
+
+@dataclass
+class DistributedConfig:
+    COORDINATOR_HOST: str = "127.0.0.1"
+    COORDINATOR_PORT: int = 8780
+    COORDINATOR_URL: str = "http://127.0.0.1:8780"
+    SECRET: str = ""
+    WORKER_ID: str = ""
+    LEASE_TTL: float = 120
+    HEARTBEAT_INTERVAL: float = 30
 
 
 @dataclass
@@ -133,6 +185,8 @@ class Config:
     EXCHANGES: ExchangesConfig
     MINTS: MintsConfig
     STAKING: StakingConfig
+    ONCHAIN: OnchainConfig = field(default_factory=OnchainConfig)
+    DISTRIBUTED: DistributedConfig = field(default_factory=DistributedConfig)
     WALLETS: WalletsConfig = field(default_factory=WalletsConfig)
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     spare_twitter_tokens: List[str] = field(default_factory=list)
@@ -184,10 +238,13 @@ class Config:
                 WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS=data["SETTINGS"].get(
                     "WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS", 120
                 ),
+                MAX_PAUSED_ACCOUNTS=data["SETTINGS"].get("MAX_PAUSED_ACCOUNTS", 0),
+                PROCESSES=data["SETTINGS"].get("PROCESSES", 1),
             ),
             FLOW=FlowConfig(
                 TASKS=tasks_list,
                 SKIP_FAILED_TASKS=data["FLOW"]["SKIP_FAILED_TASKS"],
+                TASK_CONCURRENCY=data["FLOW"].get("TASK_CONCURRENCY") or {},
             ),
             ZERO_EXCHANGE_SWAPS=ZeroExchangeSwapsConfig(
                 BALANCE_PERCENT_TO_SWAP=tuple(
@@ -206,6 +263,11 @@ class Config:
             OTHERS=OthersConfig(
                 SKIP_SSL_VERIFICATION=data["OTHERS"]["SKIP_SSL_VERIFICATION"],
                 USE_PROXY_FOR_RPC=data["OTHERS"]["USE_PROXY_FOR_RPC"],
+                RPC_REQUESTS_PER_SECOND=data["OTHERS"].get("RPC_REQUESTS_PER_SECOND")
+                or 0,
+                HTTP_REQUESTS_PER_SECOND=data["OTHERS"].get("HTTP_REQUESTS_PER_SECOND")
+                or 0,
+                REQUESTS_BURST=data["OTHERS"].get("REQUESTS_BURST", 10),
             ),
             PUZZLEMANIA=PuzzlemaniaConfig(
                 USE_REFERRAL_CODE=data["PUZZLEMANIA"]["USE_REFERRAL_CODE"],
@@ -258,6 +320,95 @@ class Config:
                     )
                 )
             ),
+            ONCHAIN=OnchainConfig(
+                BATCH_RPC_REQUESTS=data.get("ONCHAIN", {}).get(
+                    "BATCH_RPC_REQUESTS", True
+                ),
+                BATCH_WINDOW_MS=data.get("ONCHAIN", {}).get("BATCH_WINDOW_MS", 15),
+                BATCH_MAX_SIZE=data.get("ONCHAIN", {}).get("BATCH_MAX_SIZE", 20),
+                SHARE_RPC_CONNECTIONS=data.get("ONCHAIN", {}).get(
+                    "SHARE_RPC_CONNECTIONS", True
+                ),
+                POOL_CONNECTIONS_PER_HOST=data.get("ONCHAIN", {}).get(
+                    "POOL_CONNECTIONS_PER_HOST", 50
+                ),
+                POOL_KEEPALIVE_SECONDS=data.get("ONCHAIN", {}).get(
+                    "POOL_KEEPALIVE_SECONDS", 30
+                ),
+                POOL_IDLE_TIMEOUT=data.get("ONCHAIN", {}).get("POOL_IDLE_TIMEOUT", 120),
+                LOAD_BALANCE_RPCS=data.get("ONCHAIN", {}).get(
+                    "LOAD_BALANCE_RPCS", True
+                ),
+                RPC_EJECT_AFTER_ERRORS=data.get("ONCHAIN", {}).get(
+                    "RPC_EJECT_AFTER_ERRORS", 3
+                ),
+                RPC_HEALTH_CHECK_INTERVAL=data.get("ONCHAIN", {}).get(
+                    "RPC_HEALTH_CHECK_INTERVAL", 10
+                ),
+                HEDGE_READ_REQUESTS=data.get("ONCHAIN", {}).get(
+                    "HEDGE_READ_REQUESTS", False
+                ),
+                HEDGE_PERCENTILE=data.get("ONCHAIN", {}).get("HEDGE_PERCENTILE", 95),
+                HEDGE_MIN_DELAY_MS=data.get("ONCHAIN", {}).get(
+                    "HEDGE_MIN_DELAY_MS", 100
+                ),
+                GAS_ORACLE=data.get("ONCHAIN", {}).get("GAS_ORACLE", True),
+                GAS_ORACLE_REFRESH_INTERVAL=data.get("ONCHAIN", {}).get(
+                    "GAS_ORACLE_REFRESH_INTERVAL", 2
+                ),
+                GAS_PRIORITY_PERCENTILE=data.get("ONCHAIN", {}).get(
+                    "GAS_PRIORITY_PERCENTILE", 0
+                ),
+                GAS_BASE_FEE_MULTIPLIER=data.get("ONCHAIN", {}).get(
+                    "GAS_BASE_FEE_MULTIPLIER", 1.0
+                ),
+                GAS_PRIORITY_FEE_MULTIPLIER=data.get("ONCHAIN", {}).get(
+                    "GAS_PRIORITY_FEE_MULTIPLIER", 1.0
+                ),
+                GAS_POLICIES=data.get("ONCHAIN", {}).get("GAS_POLICIES") or {},
+                BLOCK_WATCHER=data.get("ONCHAIN", {}).get("BLOCK_WATCHER", True),
+                BLOCK_WATCHER_POLL_INTERVAL=data.get("ONCHAIN", {}).get(
+                    "BLOCK_WATCHER_POLL_INTERVAL", 2
+                ),
+                MULTICALL_ADDRESS=data.get("ONCHAIN", {}).get(
+                    "MULTICALL_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11"
+                ),
+                ALLOWANCE_LEDGER=data.get("ONCHAIN", {}).get("ALLOWANCE_LEDGER", True),
+                GAS_ESTIMATE_CACHE=data.get("ONCHAIN", {}).get(
+                    "GAS_ESTIMATE_CACHE", True
+                ),
+                GAS_ESTIMATE_CACHE_TTL=data.get("ONCHAIN", {}).get(
+                    "GAS_ESTIMATE_CACHE_TTL", 600
+                ),
+                REPLACE_STUCK_AFTER=data.get("ONCHAIN", {}).get("REPLACE_STUCK_AFTER")
+                or 0,
+                REPLACEMENT_FEE_MULTIPLIER=data.get("ONCHAIN", {}).get(
+                    "REPLACEMENT_FEE_MULTIPLIER", 1.2
+                ),
+                MAX_REPLACEMENTS=data.get("ONCHAIN", {}).get("MAX_REPLACEMENTS", 5),
+                SIGNER_PROCESSES=data.get("ONCHAIN", {}).get("SIGNER_PROCESSES", 0),
+                STATIC_CACHE_FILE=data.get("ONCHAIN", {}).get(
+                    "STATIC_CACHE_FILE", "data/rpc_cache.json"
+                ),
+                STATIC_CACHE_TTL=data.get("ONCHAIN", {}).get("STATIC_CACHE_TTL", 3600),
+            ),
+            DISTRIBUTED=DistributedConfig(
+                COORDINATOR_HOST=data.get("DISTRIBUTED", {}).get(
+                    "COORDINATOR_HOST", "127.0.0.1"
+                ),
+                COORDINATOR_PORT=data.get("DISTRIBUTED", {}).get(
+                    "COORDINATOR_PORT", 8780
+                ),
+                COORDINATOR_URL=data.get("DISTRIBUTED", {}).get(
+                    "COORDINATOR_URL", "http://127.0.0.1:8780"
+                ),
+                SECRET=data.get("DISTRIBUTED", {}).get("SECRET") or "",
+                WORKER_ID=data.get("DISTRIBUTED", {}).get("WORKER_ID") or "",
+                LEASE_TTL=data.get("DISTRIBUTED", {}).get("LEASE_TTL", 120),
+                HEARTBEAT_INTERVAL=data.get("DISTRIBUTED", {}).get(
+                    "HEARTBEAT_INTERVAL", 30
+                ),
+            ),
         )
 
 
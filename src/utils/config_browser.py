@@ -213,6 +213,14 @@ def create_required_directories():
                         <i class="fas fa-ellipsis-h"></i>
                         <span>Others</span>
                     </div>
+                    <div class="sidebar-item" data-section="onchain">
+                        <i class="fas fa-bolt"></i>
+                        <span>Onchain</span>
+                    </div>
+                    <div class="sidebar-item" data-section="distributed">
+                        <i class="fas fa-server"></i>
+                        <span>Distributed</span>
+                    </div>
                     <div class="sidebar-item" data-section="staking">
                         <i class="fas fa-coins"></i>
                         <span>Staking</span>
@@ -1240,6 +1248,8 @@ function renderConfig(config) {
         'crustyswap': { key: 'CRUSTY_SWAP', title: 'Crusty Swap', icon: 'gas-pump' },
         'exchanges': { key: 'EXCHANGES', title: 'Exchanges', icon: 'university' },
         'others': { key: 'OTHERS', title: 'Others', icon: 'ellipsis-h' },
+        'onchain': { key: 'ONCHAIN', title: 'Onchain', icon: 'bolt' },
+        'distributed': { key: 'DISTRIBUTED', title: 'Distributed', icon: 'server' },
         'mints': { key: 'MINTS', title: 'Mints', icon: 'cube' },
         'staking': { key: 'STAKING', title: 'Staking', icon: 'coins' }
     };
@@ -1265,6 +1275,8 @@ function renderConfig(config) {
                 // Карточка для основных настроек
                 createCard(cardsContainer, 'Basic Settings', 'sliders-h', [
                     { key: 'THREADS', value: config[key]['THREADS'] },
+                    { key: 'MAX_PAUSED_ACCOUNTS', value: config[key]['MAX_PAUSED_ACCOUNTS'] },
+                    { key: 'PROCESSES', value: config[key]['PROCESSES'] },
                     { key: 'ATTEMPTS', value: config[key]['ATTEMPTS'] },
                     { key: 'SHUFFLE_WALLETS', value: config[key]['SHUFFLE_WALLETS'] },
                     { key: 'WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS', value: config[key]['WAIT_FOR_TRANSACTION_CONFIRMATION_IN_SECONDS'] }
@@ -1316,6 +1328,15 @@ function renderConfig(config) {
                 createCard(cardsContainer, 'Flow Settings', 'exchange-alt', [
                     { key: 'SKIP_FAILED_TASKS', value: config[key]['SKIP_FAILED_TASKS'], isCheckbox: true }
                 ], key);
+
+                // Per task concurrency limits
+                const taskConcurrency = Object.entries(config[key]['TASK_CONCURRENCY'] || {});
+                if (taskConcurrency.length) {
+                    createCard(cardsContainer, 'Task Concurrency', 'layer-group',
+                        taskConcurrency.map(([task, limit]) => ({ key: task, value: limit })),
+                        `${key}.TASK_CONCURRENCY`
+                    );
+                }
             } else if (key === 'RPCS') {
                 // Специальная обработка для RPCs
                 createCard(cardsContainer, 'RPC Settings', 'network-wired', 
@@ -1333,6 +1354,103 @@ function renderConfig(config) {
                     { key: 'SKIP_SSL_VERIFICATION', value: config[key]['SKIP_SSL_VERIFICATION'], isCheckbox: true },
                     { key: 'USE_PROXY_FOR_RPC', value: config[key]['USE_PROXY_FOR_RPC'], isCheckbox: true }
                 ], key);
+
+                createCard(cardsContainer, 'Rate Limits', 'tachometer-alt', [
+                    { key: 'RPC_REQUESTS_PER_SECOND', value: config[key]['RPC_REQUESTS_PER_SECOND'], isFloat: true },
+                    { key: 'HTTP_REQUESTS_PER_SECOND', value: config[key]['HTTP_REQUESTS_PER_SECOND'], isFloat: true },
+                    { key: 'REQUESTS_BURST', value: config[key]['REQUESTS_BURST'] }
+                ], key);
+            } else if (key === 'ONCHAIN') {
+                // Специальная обработка для Onchain
+                createCard(cardsContainer, 'RPC Batching', 'layer-group', [
+                    { key: 'BATCH_RPC_REQUESTS', value: config[key]['BATCH_RPC_REQUESTS'], isCheckbox: true },
+                    { key: 'BATCH_WINDOW_MS', value: config[key]['BATCH_WINDOW_MS'] },
+                    { key: 'BATCH_MAX_SIZE', value: config[key]['BATCH_MAX_SIZE'] }
+                ], key);
+
+                createCard(cardsContainer, 'Connection Pool', 'plug', [
+                    { key: 'SHARE_RPC_CONNECTIONS', value: config[key]['SHARE_RPC_CONNECTIONS'], isCheckbox: true },
+                    { key: 'POOL_CONNECTIONS_PER_HOST', value: config[key]['POOL_CONNECTIONS_PER_HOST'] },
+                    { key: 'POOL_KEEPALIVE_SECONDS', value: config[key]['POOL_KEEPALIVE_SECONDS'] },
+                    { key: 'POOL_IDLE_TIMEOUT', value: config[key]['POOL_IDLE_TIMEOUT'] }
+                ], key);
+
+                createCard(cardsContainer, 'RPC Load Balancing', 'balance-scale', [
+                    { key: 'LOAD_BALANCE_RPCS', value: config[key]['LOAD_BALANCE_RPCS'], isCheckbox: true },
+                    { key: 'RPC_EJECT_AFTER_ERRORS', value: config[key]['RPC_EJECT_AFTER_ERRORS'] },
+                    { key: 'RPC_HEALTH_CHECK_INTERVAL', value: config[key]['RPC_HEALTH_CHECK_INTERVAL'] }
+                ], key);
+
+                createCard(cardsContainer, 'Hedged Reads', 'random', [
+                    { key: 'HEDGE_READ_REQUESTS', value: config[key]['HEDGE_READ_REQUESTS'], isCheckbox: true },
+                    { key: 'HEDGE_PERCENTILE', value: config[key]['HEDGE_PERCENTILE'] },
+                    { key: 'HEDGE_MIN_DELAY_MS', value: config[key]['HEDGE_MIN_DELAY_MS'] }
+                ], key);
+
+                createCard(cardsContainer, 'Gas Oracle', 'gas-pump', [
+                    { key: 'GAS_ORACLE', value: config[key]['GAS_ORACLE'], isCheckbox: true },
+                    { key: 'GAS_ORACLE_REFRESH_INTERVAL', value: config[key]['GAS_ORACLE_REFRESH_INTERVAL'], isFloat: true },
+                    { key: 'GAS_PRIORITY_PERCENTILE', value: config[key]['GAS_PRIORITY_PERCENTILE'], isFloat: true },
+                    { key: 'GAS_BASE_FEE_MULTIPLIER', value: config[key]['GAS_BASE_FEE_MULTIPLIER'], isFloat: true },
+                    { key: 'GAS_PRIORITY_FEE_MULTIPLIER', value: config[key]['GAS_PRIORITY_FEE_MULTIPLIER'], isFloat: true }
+                ], key);
+
+                createCard(cardsContainer, 'Block Watcher', 'cubes', [
+                    { key: 'BLOCK_WATCHER', value: config[key]['BLOCK_WATCHER'], isCheckbox: true },
+                    { key: 'BLOCK_WATCHER_POLL_INTERVAL', value: config[key]['BLOCK_WATCHER_POLL_INTERVAL'], isFloat: true }
+                ], key);
+
+                createCard(cardsContainer, 'Multicall', 'list', [
+                    { key: 'MULTICALL_ADDRESS', value: config[key]['MULTICALL_ADDRESS'] }
+                ], key);
+
+                createCard(cardsContainer, 'Allowance Ledger', 'check-double', [
+                    { key: 'ALLOWANCE_LEDGER', value: config[key]['ALLOWANCE_LEDGER'], isCheckbox: true }
+                ], key);
+
+                createCard(cardsContainer, 'Gas Estimate Cache', 'calculator', [
+                    { key: 'GAS_ESTIMATE_CACHE', value: config[key]['GAS_ESTIMATE_CACHE'], isCheckbox: true },
+                    { key: 'GAS_ESTIMATE_CACHE_TTL', value: config[key]['GAS_ESTIMATE_CACHE_TTL'], isFloat: true }
+                ], key);
+
+                createCard(cardsContainer, 'Stuck Transactions', 'forward', [
+                    { key: 'REPLACE_STUCK_AFTER', value: config[key]['REPLACE_STUCK_AFTER'], isFloat: true },
+                    { key: 'REPLACEMENT_FEE_MULTIPLIER', value: config[key]['REPLACEMENT_FEE_MULTIPLIER'], isFloat: true },
+                    { key: 'MAX_REPLACEMENTS', value: config[key]['MAX_REPLACEMENTS'] }
+                ], key);
+
+                createCard(cardsContainer, 'Signer', 'signature', [
+                    { key: 'SIGNER_PROCESSES', value: config[key]['SIGNER_PROCESSES'] }
+                ], key);
+
+                createCard(cardsContainer, 'Static RPC Cache', 'database', [
+                    { key: 'STATIC_CACHE_FILE', value: config[key]['STATIC_CACHE_FILE'] },
+                    { key: 'STATIC_CACHE_TTL', value: config[key]['STATIC_CACHE_TTL'], isFloat: true }
+                ], key);
+
+                // Per module gas policies
+                Object.entries(config[key]['GAS_POLICIES'] || {}).forEach(([task, policy]) => {
+                    createCard(cardsContainer, `Gas Policy: ${task}`, 'sliders-h',
+                        Object.entries(policy).map(([k, v]) => ({ key: k, value: v, isFloat: true })),
+                        `${key}.GAS_POLICIES.${task}`
+                    );
+                });
+            } else if (key === 'DISTRIBUTED') {
+                createCard(cardsContainer, 'Coordinator', 'server', [
+                    { key: 'COORDINATOR_HOST', value: config[key]['COORDINATOR_HOST'] },
+                    { key: 'COORDINATOR_PORT', value: config[key]['COORDINATOR_PORT'] },
+                    { key: 'LEASE_TTL', value: config[key]['LEASE_TTL'], isFloat: true }
+                ], key);
+
+                createCard(cardsContainer, 'Worker', 'laptop', [
+                    { key: 'COORDINATOR_URL', value: config[key]['COORDINATOR_URL'] },
+                    { key: 'WORKER_ID', value: config[key]['WORKER_ID'] },
+                    { key: 'HEARTBEAT_INTERVAL', value: config[key]['HEARTBEAT_INTERVAL'], isFloat: true }
+                ], key);
+
+                createCard(cardsContainer, 'Security', 'key', [
+                    { key: 'SECRET', value: config[key]['SECRET'] }
+                ], key);
             } else if (key === 'CRUSTY_SWAP') {
                 createCard(cardsContainer, 'Crusty Swap Settings', 'gas-pump', [
                     { key: 'NETWORKS_TO_REFUEL_FROM', value: config[key]['NETWORKS_TO_REFUEL_FROM'], isNetworkSelection: true },
@@ -1445,7 +1563,7 @@ function createCard(container, title, iconClass, fields, category) {
         } else if (Array.isArray(value)) {
             createListField(cardDiv, key, value, `${category}.${key}`);
         } else {
-            createTextField(cardDiv, key, value, `${category}.${key}`);
+            createTextField(cardDiv, key, value, `${category}.${key}`, isFloat);
         }
     });
     
@@ -0,0 +1,226 @@
+import asyncio
+import math
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from src.utils.config import get_config
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel for the pauses of all accounts.
+
+    A pause lands in the slot of the tick it is due at, one task advances
+    the wheel tick by tick and wakes everything due in the current slot.
+    Scheduling and firing cost O(1) however many accounts are sleeping.
+    Pauses longer than one revolution stay in their slot and are skipped
+    until their tick comes. The task stops when nothing is scheduled.
+    """
+
+    def __init__(self, tick: float = 0.5, size: int = 512):
+        self.tick = tick
+        self.size = size
+
+        # Slot -> (due tick, future)
+        self._slots: List[List[Tuple[int, asyncio.Future]]] = [
+            [] for _ in range(size)
+        ]
+        self._count = 0
+        self._origin: Optional[float] = None
+        # Last tick whose slot was processed
+        self._current = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def _now_tick(self) -> int:
+        loop = asyncio.get_running_loop()
+        if self._origin is None:
+            self._origin = loop.time()
+        return int((loop.time() - self._origin) / self.tick)
+
+    async def sleep(self, delay: float) -> None:
+        """Wait at least `delay` seconds (rounded up to the tick)."""
+        if delay <= 0:
+            return
+        due = max(self._now_tick(), self._current) + math.ceil(delay / self.tick)
+        future = asyncio.get_running_loop().create_future()
+        self._slots[due % self.size].append((due, future))
+        self._count += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        await future
+
+    async def _run(self) -> None:
+        while self._count:
+            now = self._now_tick()
+            # After a stall every slot is visited once at most
+            for tick in range(max(self._current + 1, now - self.size + 1), now + 1):
+                self._fire(tick % self.size, now)
+            self._current = max(self._current, now)
+
+            next_tick_at = self._origin + (now + 1) * self.tick
+            await asyncio.sleep(max(next_tick_at - asyncio.get_running_loop().time(), 0))
+
+    def _fire(self, slot: int, now: int) -> None:
+        entries = self._slots[slot]
+        if not entries:
+            return
+        waiting = []
+        for due, future in entries:
+            if due > now:
+                waiting.append((due, future))
+                continue
+            self._count -= 1
+            if not future.done():
+                future.set_result(None)
+        self._slots[slot] = waiting
+
+
+class FlowScheduler:
+    """
+    Hands out the THREADS slots of the run to accounts.
+
+    An account holds a slot while it works. With paused accounts allowed,
+    pause() gives the slot back while the account waits out its random
+    pause on the timer wheel and takes one again when the pause is over,
+    before any account that has not started yet. Up to THREADS +
+    max_paused accounts are in progress at once, so the threads keep
+    doing I/O for other accounts instead of sleeping with them. With
+    max_paused 0 accounts sleep in their slot as before.
+
+    Tasks with a limit in task_limits (task name -> max accounts running
+    it at once) also wait for a slot of their own. An account waiting for
+    one always gives its thread back the same way as during a pause, and
+    up to THREADS more accounts are started so the freed threads have
+    work. max_paused only caps the accounts waiting out pauses.
+    """
+
+    def __init__(
+        self,
+        threads: int,
+        max_paused: int = 0,
+        task_limits: Optional[Dict[str, int]] = None,
+    ):
+        self.threads = max(threads, 1)
+        self.max_paused = max(max_paused, 0)
+        self.task_limits = {
+            name.lower(): limit for name, limit in (task_limits or {}).items() if limit
+        }
+        self.timer_wheel = TimerWheel()
+        self._task_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        self._free = self.threads
+        # Accounts back from a pause go first
+        self._resumed: Deque[asyncio.Future] = deque()
+        self._queued: Deque[asyncio.Future] = deque()
+        self._holders: Set[asyncio.Task] = set()
+
+    @property
+    def accounts_in_progress(self) -> int:
+        """How many accounts may be started and not finished at once."""
+        # Accounts queued for a limited task don't hold a thread
+        task_waiters = self.threads if self.task_limits else 0
+        return self.threads + self.max_paused + task_waiters
+
+    async def acquire(self, resumed: bool = False) -> None:
+        task = asyncio.current_task()
+        if task in self._holders:
+            return
+
+        if self._free > 0 and not self._resumed and not self._queued:
+            self._free -= 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            (self._resumed if resumed else self._queued).append(future)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was handed over right before the cancellation
+                    self._hand_over()
+                raise
+        self._holders.add(task)
+
+    def release(self) -> None:
+        task = asyncio.current_task()
+        if task not in self._holders:
+            return
+        self._holders.discard(task)
+        self._hand_over()
+
+    def _hand_over(self) -> None:
+        for waiters in (self._resumed, self._queued):
+            while waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(None)
+                    return
+        self._free += 1
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold a slot for the account running in this task."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def task_slot(self, task_name: str):
+        """Run one task of the account within the task's concurrency limit."""
+        name = task_name.lower()
+        limit = self.task_limits.get(name)
+        if not limit:
+            yield
+            return
+
+        semaphore = self._task_semaphores.setdefault(name, asyncio.Semaphore(limit))
+        if semaphore.locked():
+            # The thread serves other accounts while this one waits for the task
+            self.release()
+            await semaphore.acquire()
+            try:
+                await self.acquire(resumed=True)
+            except BaseException:
+                semaphore.release()
+                raise
+        else:
+            await semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    async def pause(self, seconds: float, resume: bool = True) -> None:
+        """
+        Random pause of the account running in this task. Without resume
+        the slot is not taken back, for pauses the account ends with.
+        """
+        if not self.max_paused:
+            await asyncio.sleep(seconds)
+            return
+
+        self.release()
+        await self.timer_wheel.sleep(seconds)
+        if resume:
+            await self.acquire(resumed=True)
+
+
+_flow_scheduler: Optional[FlowScheduler] = None
+
+
+def get_flow_scheduler() -> FlowScheduler:
+    """
+    The scheduler of the run, sized by SETTINGS.THREADS, MAX_PAUSED_ACCOUNTS
+    and FLOW.TASK_CONCURRENCY.
+    """
+    global _flow_scheduler
+    if _flow_scheduler is None:
+        config = get_config()
+        _flow_scheduler = FlowScheduler(
+            config.SETTINGS.THREADS,
+            config.SETTINGS.MAX_PAUSED_ACCOUNTS,
+            config.FLOW.TASK_CONCURRENCY,
+        )
+    return _flow_scheduler
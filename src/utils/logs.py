@@ -50,6 +50,22 @@ class ProgressTracker:
         pass  # Убираем закрытие tqdm
 
 
+class QueueProgressTracker:
+    """
+    Progress tracker of a worker process: increments are sent to the parent
+    process, which shows them on its own ProgressTracker.
+    """
+
+    def __init__(self, queue, shard: int):
+        self.queue = queue
+        self.shard = shard
+
+    async def increment(self, amount: int = 1, message: Optional[str] = None):
+        # The queue is unbounded, the item is handed to the feeder thread
+        # without blocking the event loop
+        self.queue.put_nowait(("progress", self.shard, amount))
+
+
 async def create_progress_tracker(
     total: int, description: str = "Progress"
 ) -> ProgressTracker:
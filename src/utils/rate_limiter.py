@@ -0,0 +1,126 @@
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+
+# Sends of one request after a 429 before the response is passed on
+RATE_LIMITED_ATTEMPTS = 4
+# How long to back off after a 429 without a usable Retry-After header (seconds)
+DEFAULT_RETRY_AFTER = 1.0
+# Never wait longer than this for a single Retry-After
+MAX_RETRY_AFTER = 60.0
+# A 429 multiplies the rate by RATE_LIMITED_SLOWDOWN, it grows back by
+# RECOVERY_PER_SECOND of the limit per second
+RATE_LIMITED_SLOWDOWN = 0.7
+RECOVERY_PER_SECOND = 0.1
+# The rate never drops below this share of the limit
+MIN_RATE_SHARE = 0.1
+
+
+def parse_retry_after(value: Optional[str]) -> float:
+    """Seconds to wait from a Retry-After header, in seconds or as an HTTP date."""
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return DEFAULT_RETRY_AFTER
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every account talking to one host.
+
+    Up to `burst` requests go out at once, after that `rate` per second.
+    Callers wait in a FIFO queue, so no account starves while others keep
+    getting through. A 429 response pauses the whole host for Retry-After
+    and lowers the rate, which then recovers step by step while requests
+    succeed - traffic settles at what the host sustains instead of
+    alternating between bursts and bans.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int = 1):
+        self.name = name
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(burst, 1)
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._recovered_at = self._updated
+        # asyncio.Lock wakes its waiters in arrival order
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait for a free slot to send one request."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if self._tokens < 1:
+                    wait = max(wait, (1 - self._tokens) / self.rate)
+                if wait <= 0:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep(wait)
+
+    def record_success(self) -> None:
+        now = time.monotonic()
+        if self.rate < self.max_rate:
+            self.rate = min(
+                self.max_rate,
+                self.rate
+                + self.max_rate * RECOVERY_PER_SECOND * (now - self._recovered_at),
+            )
+        self._recovered_at = now
+
+    def record_rate_limited(self, retry_after: float) -> None:
+        """The host answered 429: pause it and slow down."""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        if now < self._blocked_until:
+            # Requests sent before the pause started, already slowed down for them
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            return
+        self._blocked_until = now + retry_after
+        self._recovered_at = self._blocked_until
+        self.rate = max(self.rate * RATE_LIMITED_SLOWDOWN, self.max_rate * MIN_RATE_SHARE)
+        logger.warning(
+            f"{self.name} is rate limiting requests, pausing for {retry_after:.1f}s "
+            f"and slowing down to {self.rate:.1f} requests per second"
+        )
+
+
+# (kind, host) -> limiter
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(url: str, rate: float, burst: int, kind: str = "http") -> Optional[RateLimiter]:
+    """
+    The limiter of the url's host, shared by all accounts. None if rate is 0
+    (unlimited). The limits of the first call for a host are used.
+    """
+    if not rate:
+        return None
+    host = urlsplit(url).netloc.lower() or url
+    key = (kind, host)
+    if key not in _limiters:
+        _limiters[key] = RateLimiter(host, rate, burst)
+    return _limiters[key]
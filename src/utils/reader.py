@@ -1,9 +1,10 @@
 import json
 from loguru import logger
-from eth_account import Account
 from eth_account.hdaccount import generate_mnemonic
 from web3.auto import w3
 
+from src.utils.signer import load_private_keys
+
 
 def read_txt_file(file_name: str, file_path: str) -> list:
     with open(file_path, "r") as file:
@@ -42,35 +43,24 @@ def read_private_keys(file_path: str) -> list:
     Raises:
         InvalidKeyError: If any key or mnemonic phrase in the file is invalid
     """
-    private_keys = []
-
     with open(file_path, "r") as file:
-        for line_number, line in enumerate(file, 1):
-            key = line.strip()
-            if not key:
-                continue
-
-            try:
-                # Check if the line is a mnemonic phrase (12 or 24 words)
-                words = key.split()
-                if len(words) in [12, 24]:
-                    Account.enable_unaudited_hdwallet_features()
-                    account = Account.from_mnemonic(key)
-                    private_key = account.key.hex()
-                else:
-                    # Try to process as a private key
-                    if not key.startswith("0x"):
-                        key = "0x" + key
-                    # Verify that it's a valid private key
-                    Account.from_key(key)
-                    private_key = key
-
-                private_keys.append(private_key)
-
-            except Exception as e:
-                raise InvalidKeyError(
-                    f"Invalid key or mnemonic phrase at line {line_number}: {key[:10]}... Error: {str(e)}"
-                )
+        lines = [
+            (line_number, line.strip())
+            for line_number, line in enumerate(file, 1)
+            if line.strip()
+        ]
+
+    # Mnemonic derivation is slow, large files are processed in parallel
+    # when ONCHAIN.SIGNER_PROCESSES is set
+    results = load_private_keys([key for _, key in lines])
+
+    private_keys = []
+    for (line_number, key), (ok, value) in zip(lines, results):
+        if not ok:
+            raise InvalidKeyError(
+                f"Invalid key or mnemonic phrase at line {line_number}: {key[:10]}... Error: {value}"
+            )
+        private_keys.append(value)
 
     logger.success(f"Successfully loaded {len(private_keys)} private keys.")
     return private_keys
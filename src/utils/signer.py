@@ -0,0 +1,167 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from eth_account import Account
+from loguru import logger
+
+from src.utils.config import get_config
+
+
+# Results cross the process boundary as (ok, value or error message),
+# exceptions of eth_account are not guaranteed to be picklable
+Result = Tuple[bool, Any]
+
+
+def load_private_key(line: str) -> str:
+    """
+    Private key of a line of the keys file: a private key (with or without
+    0x) or a 12/24 word mnemonic phrase. Raises if it is neither.
+    """
+    words = line.split()
+    if len(words) in [12, 24]:
+        Account.enable_unaudited_hdwallet_features()
+        return Account.from_mnemonic(line).key.hex()
+
+    key = line if line.startswith("0x") else "0x" + line
+    # Verify that it's a valid private key
+    Account.from_key(key)
+    return key
+
+
+def _sign_batch(batch: List[Tuple[Dict[str, Any], str]]) -> List[Result]:
+    results = []
+    for transaction, private_key in batch:
+        try:
+            signed = Account.sign_transaction(transaction, private_key)
+            results.append((True, bytes(signed.raw_transaction)))
+        except Exception as e:
+            results.append((False, str(e)))
+    return results
+
+
+def _load_batch(lines: List[str]) -> List[Result]:
+    results = []
+    for line in lines:
+        try:
+            results.append((True, load_private_key(line)))
+        except Exception as e:
+            results.append((False, str(e)))
+    return results
+
+
+class SignerPool:
+    """
+    Signs transactions and derives keys in worker processes.
+
+    secp256k1 signing and mnemonic derivation are CPU work that would
+    otherwise run on the event loop and delay every other account's I/O.
+    Signing requests arriving within batch_delay seconds of each other are
+    sent to a worker together, so the IPC round-trip is paid once per batch.
+    """
+
+    def __init__(
+        self, processes: int, batch_size: int = 32, batch_delay: float = 0.002
+    ):
+        self.processes = processes
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._queue: List[Tuple[Dict[str, Any], str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.processes)
+        return self._executor
+
+    async def sign_transaction(
+        self, transaction: Dict[str, Any], private_key: str
+    ) -> bytes:
+        """Raw signed transaction, ready for eth_sendRawTransaction."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((dict(transaction), private_key, future))
+
+        if len(self._queue) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._queue = self._queue, []
+        if not batch:
+            return
+
+        work = asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            _sign_batch,
+            [(transaction, private_key) for transaction, private_key, _ in batch],
+        )
+
+        def resolve(done: asyncio.Future) -> None:
+            if done.exception() is not None:
+                # The worker died, fail the whole batch
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(done.exception())
+                return
+
+            for (*_, future), (ok, value) in zip(batch, done.result()):
+                if future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(Exception(value))
+
+        work.add_done_callback(resolve)
+
+    def load_private_keys(self, lines: List[str]) -> List[Result]:
+        """load_private_key for every line, split across the workers."""
+        chunk_size = max(1, len(lines) // (self.processes * 4))
+        chunks = [lines[i : i + chunk_size] for i in range(0, len(lines), chunk_size)]
+        return [
+            result
+            for chunk in self.executor.map(_load_batch, chunks)
+            for result in chunk
+        ]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_signer_pool: Optional[SignerPool] = None
+
+
+def get_signer_pool() -> Optional[SignerPool]:
+    """The process-wide signer pool, None if ONCHAIN.SIGNER_PROCESSES is 0."""
+    global _signer_pool
+    processes = get_config().ONCHAIN.SIGNER_PROCESSES
+    if not processes:
+        return None
+    if _signer_pool is None:
+        _signer_pool = SignerPool(processes)
+        logger.info(f"Signing transactions in {processes} worker processes")
+    return _signer_pool
+
+
+def load_private_keys(lines: List[str]) -> List[Result]:
+    """
+    load_private_key for every line. Large files go through the signer pool
+    when it is enabled, mnemonic derivation is slow.
+    """
+    signer_pool = get_signer_pool()
+    if signer_pool is not None and len(lines) >= 100:
+        return signer_pool.load_private_keys(lines)
+    return _load_batch(lines)